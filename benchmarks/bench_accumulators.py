@@ -0,0 +1,135 @@
+"""Scaling of the stream accumulators with stream length.
+
+Feeds raw chunk data for streams of growing length into
+ChatCompletionAccumulator and into a hand-rolled accumulator that concatenates
+content and tool call arguments on a per-choice dict, as consumers commonly
+do. Then feeds Responses API text delta events into ResponseAccumulator. The
+accumulators' per-event cost should stay flat as the stream grows.
+
+    python benchmarks/bench_accumulators.py
+"""
+
+import time
+
+from sudo_ai import utils
+
+LENGTHS = [1_000, 10_000, 100_000]
+
+
+def build_chunks(count: int):
+    chunks = []
+    for i in range(count):
+        delta = {"content": f"token {i} " * 4}
+        if i % 2:
+            delta["tool_calls"] = [
+                {"index": 0, "function": {"arguments": f'"arg {i}", ' * 4}}
+            ]
+        chunks.append(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": 1700000000,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": delta}],
+            }
+        )
+    return chunks
+
+
+def hand_rolled(chunks):
+    choices = {}
+    for chunk in chunks:
+        for choice in chunk["choices"]:
+            state = choices.setdefault(
+                choice["index"], {"content": "", "arguments": {}}
+            )
+            delta = choice["delta"]
+            state["content"] += delta.get("content") or ""
+            for call in delta.get("tool_calls") or ():
+                arguments = state["arguments"]
+                arguments[call["index"]] = (
+                    arguments.get(call["index"], "") + call["function"]["arguments"]
+                )
+    return choices[0]["content"]
+
+
+def accumulated(chunks):
+    accumulator = utils.ChatCompletionAccumulator()
+    for chunk in chunks:
+        accumulator.add(chunk)
+    return accumulator.completion().choices[0].message.content
+
+
+def build_response_events(count: int):
+    response = {
+        "id": "resp_bench",
+        "object": "response",
+        "created_at": 1700000000,
+        "model": "gpt-4o",
+        "status": "in_progress",
+    }
+    events = [
+        {"type": "response.created", "response": response},
+        {
+            "type": "response.output_item.added",
+            "output_index": 0,
+            "item": {
+                "id": "msg_bench",
+                "type": "message",
+                "role": "assistant",
+                "status": "in_progress",
+                "content": [],
+            },
+        },
+        {
+            "type": "response.content_part.added",
+            "output_index": 0,
+            "content_index": 0,
+            "part": {"type": "output_text", "text": "", "annotations": []},
+        },
+    ]
+    for i in range(count):
+        events.append(
+            {
+                "type": "response.output_text.delta",
+                "output_index": 0,
+                "content_index": 0,
+                "delta": f"token {i} " * 4,
+            }
+        )
+    return [dict(event, sequence_number=i) for i, event in enumerate(events)]
+
+
+def response_accumulated(events):
+    accumulator = utils.ResponseAccumulator()
+    for event in events:
+        accumulator.add(event)
+    return accumulator.response()
+
+
+def main():
+    accumulated(build_chunks(10))
+
+    print(f"{'chunks':>8} {'hand-rolled µs/chunk':>21} {'accumulator µs/chunk':>21}")
+    for count in LENGTHS:
+        chunks = build_chunks(count)
+        timings = []
+        for fn in (hand_rolled, accumulated):
+            start = time.perf_counter()
+            fn(chunks)
+            timings.append((time.perf_counter() - start) / count * 1e6)
+        print(f"{count:>8,} {timings[0]:>21.2f} {timings[1]:>21.2f}")
+
+    response_accumulated(build_response_events(10))
+
+    print(f"\n{'events':>8} {'ResponseAccumulator µs/event':>29}")
+    for count in LENGTHS:
+        events = build_response_events(count)
+        start = time.perf_counter()
+        response_accumulated(events)
+        elapsed = (time.perf_counter() - start) / len(events) * 1e6
+        print(f"{count:>8,} {elapsed:>29.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Throughput of the SSE parser behind EventStream / EventStreamAsync.
+
+Feeds a synthetic stream of chat completion chunks through
+``stream_events`` split into fixed size network chunks and reports events and
+megabytes parsed per second. With ``--decode`` every event is also validated
+into ``models.ChatCompletionChunk`` the way ``Router.create_streaming`` does.
+With ``--raw`` events are wrapped in ``RawEvent`` as in ``EventStream.raw()``
+and only the delta content is read from the parsed data. With ``--metrics``
+events go through ``EventStream`` with ``StreamMetrics`` recording enabled.
+With ``--frames`` the stream is only split into the raw frames that
+``EventStream.frames()`` forwards, and the sentinel frame counts as an event.
+
+    python benchmarks/bench_eventstreaming.py [--events N]
+        [--decode | --raw | --frames] [--metrics]
+"""
+
+import argparse
+import json
+import time
+
+from sudo_ai import models, utils
+from sudo_ai.utils.eventstreaming import EventStream, RawEvent, stream_events
+
+CHUNK_SIZES = [16, 64, 256, 1024, 16384]
+
+
+class _Response:
+    num_bytes_downloaded = 0
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def iter_bytes(self):
+        return iter(self._chunks)
+
+
+def build_stream(events: int) -> bytes:
+    frames = []
+    for i in range(events):
+        payload = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}}],
+        }
+        frames.append(f"data: {json.dumps(payload)}\n\n".encode())
+    frames.append(b"data: [DONE]\n\n")
+    return b"".join(frames)
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--decode", action="store_true")
+    mode.add_argument("--raw", action="store_true")
+    mode.add_argument("--frames", action="store_true")
+    parser.add_argument("--metrics", action="store_true")
+    args = parser.parse_args()
+
+    def validate(event):
+        return utils.unmarshal_event(event, models.ChatCompletionChunk)
+
+    if args.decode:
+        decoder = validate
+
+    elif args.raw:
+
+        def decoder(event):
+            raw = RawEvent(event, validate)
+            return raw.data["choices"][0]["delta"]["content"]
+
+    else:
+
+        def decoder(event):
+            return event
+
+    data = build_stream(args.events)
+    print(f"{args.events} events, {len(data) / 1e6:.1f} MB")
+    print(f"{'chunk':>8} {'seconds':>9} {'events/s':>12} {'MB/s':>8}")
+    for size in CHUNK_SIZES:
+        response = _Response(split(data, size))
+        start = time.perf_counter()
+        if args.frames:
+            events = EventStream(response, decoder, "[DONE]").frames()
+        elif args.metrics:
+            metrics = utils.StreamMetrics("bench")
+            events = EventStream(response, decoder, "[DONE]", metrics=metrics)
+        else:
+            events = stream_events(response, decoder, "[DONE]")
+        count = sum(1 for _ in events)
+        elapsed = time.perf_counter() - start
+        assert count == args.events + args.frames
+        print(
+            f"{size:>8} {elapsed:>9.3f} {count / elapsed:>12,.0f} "
+            f"{len(data) / elapsed / 1e6:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Per-call cost of debug logging and request tracing for large request bodies.
+
+Times ``Router.create`` against a local stand-in server with a message history
+of the given size, with the default no-op logger, with a ``logging`` logger
+whose level is above DEBUG, with a DEBUG logger writing to a ``NullHandler``,
+and with a ``TraceConfig`` that samples every body.
+
+    python benchmarks/bench_logging.py [--kb N] [--calls N]
+"""
+
+import argparse
+import logging
+import time
+
+import httpx
+
+from sudo_ai import Sudo, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class NullSink:
+    def publish(self, trace: utils.RequestTrace) -> None:
+        pass
+
+
+def measure(sdk: Sudo, messages, calls: int) -> float:
+    sdk.router.create(messages=messages, model="gpt-4o")
+    start = time.perf_counter()
+    for _ in range(calls):
+        sdk.router.create(messages=messages, model="gpt-4o")
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kb", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    messages = [
+        {"role": "user", "content": "x" * 1024, "name": f"m{i}"} for i in range(args.kb)
+    ]
+
+    quiet = logging.getLogger("sudo_ai.bench.quiet")
+    quiet.setLevel(logging.WARNING)
+    verbose = logging.getLogger("sudo_ai.bench.verbose")
+    verbose.setLevel(logging.DEBUG)
+    verbose.addHandler(logging.NullHandler())
+    verbose.propagate = False
+
+    configs = [
+        ("no-op logger", {}),
+        ("logger above DEBUG", {"debug_logger": quiet}),
+        ("DEBUG logger", {"debug_logger": verbose}),
+        (
+            "tracing",
+            {"trace_config": utils.TraceConfig(NullSink(), body_sample_rate=1.0)},
+        ),
+    ]
+
+    print(f"{'configuration':<20} {'µs/call':>10}")
+    for name, kwargs in configs:
+        sdk = Sudo(
+            server_url="http://bench.test",
+            api_key="bench",
+            client=httpx.Client(
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, json=COMPLETION)
+                )
+            ),
+            **kwargs,
+        )
+        print(f"{name:<20} {measure(sdk, messages, args.calls):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Cost of dumping the request models and their nested models.
+
+Each generated model drops UNSET fields and keeps explicitly set nulls in a
+``model_serializer`` hook, so dumping a request runs that hook once per nested
+object. This times ``model_dump`` and ``marshal_json_bytes`` for each request
+model with a representative message history and reports the cost per message.
+
+    python benchmarks/bench_model_serialization.py [--messages N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from sudo_ai import models, utils
+
+
+def chat_messages(count: int):
+    messages = []
+    for i in range(count):
+        if i % 4 == 3:
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": "",
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {
+                                "name": "lookup",
+                                "arguments": '{"q": "weather"}',
+                            },
+                        }
+                    ],
+                }
+            )
+        else:
+            role = "user" if i % 2 == 0 else "assistant"
+            messages.append({"role": role, "content": f"message {i} " * 20})
+    return messages
+
+
+def build_cases(count: int):
+    messages = chat_messages(count)
+    return [
+        (
+            "ChatCompletionRequestJSON",
+            models.ChatCompletionRequestJSON(
+                model="gpt-4o", messages=messages, temperature=0.2, user=None
+            ),
+            count,
+        ),
+        (
+            "ChatCompletionRequestStream",
+            models.ChatCompletionRequestStream(
+                model="gpt-4o",
+                messages=messages,
+                stream_options={"include_usage": True},
+            ),
+            count,
+        ),
+        (
+            "ResponsesRequest",
+            models.ResponsesRequest(
+                model="gpt-4o",
+                input=[{"role": m["role"], "content": m["content"]} for m in messages],
+                instructions=None,
+            ),
+            count,
+        ),
+        (
+            "ImageGenerationRequest",
+            models.ImageGenerationRequest(
+                model="gpt-image-1", prompt="a cat", n=1, size=None
+            ),
+            1,
+        ),
+    ]
+
+
+def per_call_us(fn, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<28} {'items':>8} {'model_dump µs':>14} "
+        f"{'bytes µs':>10} {'µs/item':>10}"
+    )
+    for name, request, items in build_cases(args.messages):
+        typ = type(request)
+        dump = per_call_us(
+            lambda: request.model_dump(by_alias=True, exclude_none=True), args.repeat
+        )
+        encode = per_call_us(
+            lambda: utils.marshal_json_bytes(request, typ), args.repeat
+        )
+        print(
+            f"{name:<28} {items:>8} {dump:>14.1f} {encode:>10.1f} "
+            f"{encode / items:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Fan-in of many concurrent EventStreamAsync streams.
+
+Merges N in-memory streams, each sending events at a fixed interval, once
+with the common pattern of one pump task per stream feeding an unbounded
+asyncio.Queue, and once with EventStreamMultiplexer. The consumer spends a
+little time on every event, so it is slower than the streams combined.
+Reports total time and the peak number of events buffered between the
+streams and the consumer.
+
+    python benchmarks/bench_multiplexer.py [--streams N] [--events N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from sudo_ai import utils
+from sudo_ai.utils.eventstreaming import EventStreamAsync
+
+FRAME = b'data: {"choices": [{"index": 0, "delta": {"content": "token "}}]}\n\n'
+
+
+class _Response:
+    def __init__(self, events: int, interval: float):
+        self.events = events
+        self.interval = interval
+
+    async def aiter_bytes(self):
+        for _ in range(self.events):
+            await asyncio.sleep(self.interval)
+            yield FRAME
+
+    async def aclose(self):
+        pass
+
+
+def streams(count: int, events: int, interval: float):
+    return [
+        EventStreamAsync(_Response(events, interval), lambda event: event.data)
+        for _ in range(count)
+    ]
+
+
+async def consume(item):
+    # Simulated per-event work, e.g. writing the token to a websocket.
+    if hash(item) % 8 == 0:
+        await asyncio.sleep(0)
+
+
+async def queue_fan_in(sources):
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    peak = 0
+
+    async def pump(key, stream):
+        async for event in stream:
+            await queue.put((key, event))
+        await queue.put(done)
+
+    tasks = [asyncio.ensure_future(pump(k, s)) for k, s in enumerate(sources)]
+    remaining = len(tasks)
+    count = 0
+    while remaining:
+        peak = max(peak, queue.qsize())
+        item = await queue.get()
+        if item is done:
+            remaining -= 1
+            continue
+        count += 1
+        await consume(item)
+    return count, peak
+
+
+async def multiplexed(sources):
+    peak = 0
+    count = 0
+    async with utils.EventStreamMultiplexer(sources) as mux:
+        async for item in mux:
+            peak = max(peak, len(mux._done))  # pylint: disable=protected-access
+            count += 1
+            await consume(item)
+    return count, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.001)
+    args = parser.parse_args()
+
+    print(f"{args.streams} streams x {args.events} events")
+    print(f"{'fan-in':>12} {'seconds':>9} {'events/s':>10} {'peak buffered':>14}")
+    for name, fan_in in (("queue", queue_fan_in), ("multiplexer", multiplexed)):
+        sources = streams(args.streams, args.events, args.interval)
+        start = time.perf_counter()
+        count, peak = asyncio.run(fan_in(sources))
+        elapsed = time.perf_counter() - start
+        assert count == args.streams * args.events
+        print(f"{name:>12} {elapsed:>9.2f} {count / elapsed:>10,.0f} {peak:>14,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Overlap of network waits and consumer work with EventStream.prefetch().
+
+Streams chat completion chunks from a stand-in response that waits a fixed
+time before each chunk, as tokens arriving over the network do. Each event is
+validated into ``models.ChatCompletionChunk`` and the consumer then spends a
+fixed time per event, e.g. writing it to a WSGI response. Reports wall time
+with and without prefetching.
+
+    python benchmarks/bench_prefetch.py [--events N] [--latency-ms MS] [--work-ms MS]
+"""
+
+import argparse
+import json
+import time
+
+from sudo_ai import models, utils
+from sudo_ai.utils.eventstreaming import EventStream
+
+
+class _Response:
+    num_bytes_downloaded = 0
+
+    def __init__(self, events: int, latency: float):
+        self.events = events
+        self.latency = latency
+
+    def iter_bytes(self):
+        for i in range(self.events):
+            time.sleep(self.latency)
+            payload = {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": 1700000000,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": {"content": f"token {i} "}}],
+            }
+            yield f"data: {json.dumps(payload)}\n\n".encode()
+
+    def close(self):
+        pass
+
+
+def decode(event):
+    return utils.unmarshal_event(event, models.ChatCompletionChunk)
+
+
+def run(stream, work: float) -> float:
+    start = time.perf_counter()
+    for _ in stream:
+        time.sleep(work)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--work-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+    work = args.work_ms / 1000
+
+    print(
+        f"{args.events} events, {args.latency_ms} ms network, "
+        f"{args.work_ms} ms work per event"
+    )
+    print(f"{'reader':>10} {'seconds':>9}")
+    sequential = run(EventStream(_Response(args.events, latency), decode), work)
+    print(f"{'inline':>10} {sequential:>9.3f}")
+    prefetched = run(
+        EventStream(_Response(args.events, latency), decode).prefetch(), work
+    )
+    print(f"{'prefetch':>10} {prefetched:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
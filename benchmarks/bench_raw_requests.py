@@ -0,0 +1,82 @@
+"""Per-call cost of Router.create against create_raw with pre-encoded bodies.
+
+Times ``Router.create`` with TypedDict messages, ``create_raw`` with the same
+request as a dict, and ``create_raw`` with the request already encoded to
+bytes, against a local stand-in server, for message histories of several
+lengths.
+
+    python benchmarks/bench_raw_requests.py [--calls N]
+"""
+
+import argparse
+import json
+import time
+
+import httpx
+
+from sudo_ai import Sudo
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def measure(call, calls: int) -> float:
+    call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    response = json.dumps(COMPLETION).encode()
+    sdk = Sudo(
+        server_url="http://bench.test",
+        api_key="bench",
+        client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=response, headers={"content-type": "application/json"}
+                )
+            )
+        ),
+    )
+    router = sdk.router
+
+    print(f"{'messages':>8} {'create µs':>11} {'raw dict µs':>12} {'raw bytes µs':>13}")
+    for count in (1, 20, 200):
+        messages = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+            for i in range(count)
+        ]
+        body = {"model": "gpt-4o", "messages": messages, "temperature": 0.5}
+        encoded = json.dumps(body).encode()
+
+        def create():
+            router.create(model="gpt-4o", messages=messages, temperature=0.5)
+
+        def raw_dict():
+            router.create_raw(body=body)
+
+        def raw_bytes():
+            router.create_raw(body=encoded)
+
+        print(
+            f"{count:>8} {measure(create, args.calls):>11.1f} "
+            f"{measure(raw_dict, args.calls):>12.1f} "
+            f"{measure(raw_bytes, args.calls):>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Per-call cost of Router.create versus Router.create_with_raw_response.
+
+Serves a chat completion with per-token logprobs from a local
+``httpx.MockTransport`` and times full calls: ``create`` validating the body
+into ``models.ChatCompletion``, ``create_with_raw_response`` returning the
+undecoded bytes, the raw variant followed by ``parse()``, and the raw variant
+followed by ``project()`` of the message content and usage.
+
+    python benchmarks/bench_raw_response.py [--tokens N] [--calls N]
+"""
+
+import argparse
+import json
+import time
+from typing import Annotated, Optional
+
+import httpx
+
+from sudo_ai import Sudo, models, utils
+
+
+class Answer(utils.Projection):
+    content: Annotated[Optional[str], utils.JsonPath("choices.0.message.content")]
+    usage: models.Usage
+
+
+def build_completion(tokens: int) -> bytes:
+    content = [
+        {
+            "token": f"tok{i}",
+            "logprob": -0.5,
+            "bytes": [116, 111, 107],
+            "top_logprobs": [
+                {"token": f"alt{j}", "logprob": -1.0 - j, "bytes": [97]}
+                for j in range(5)
+            ],
+        }
+        for i in range(tokens)
+    ]
+    return json.dumps(
+        {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "tok " * tokens},
+                    "logprobs": {"content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 10,
+                "completion_tokens": tokens,
+                "total_tokens": 10 + tokens,
+            },
+        }
+    ).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    body = build_completion(args.tokens)
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={"content-type": "application/json"}, content=body
+        )
+
+    sdk = Sudo(
+        server_url="http://bench.test",
+        api_key="bench",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    kwargs = {"messages": [{"role": "user", "content": "hi"}], "model": "gpt-4o"}
+    router = sdk.router
+    variants = {
+        "create": lambda: router.create(**kwargs),
+        "raw": lambda: router.create_with_raw_response(**kwargs),
+        "raw+parse": lambda: router.create_with_raw_response(**kwargs).parse(),
+        "raw+project": lambda: router.create_with_raw_response(**kwargs).project(
+            Answer
+        ),
+    }
+
+    print(f"{args.tokens} logprob tokens, {len(body) / 1e3:.0f} KB body")
+    print(f"{'variant':>12} {'ms/call':>9}")
+    for name, call in variants.items():
+        call()
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            call()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12} {elapsed / args.calls * 1000:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
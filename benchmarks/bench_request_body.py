@@ -0,0 +1,63 @@
+"""Cost of encoding JSON request bodies of growing size.
+
+Compares ``serialize_request_body`` for a ``ChatCompletionRequestJSON`` with a
+long message history against the previous path: ``marshal_json`` building a
+dict and a ``str`` that httpx then encodes to UTF-8 bytes.
+
+    python benchmarks/bench_request_body.py [--repeat N]
+"""
+
+import argparse
+import time
+
+from sudo_ai import models, utils
+
+HISTORY_BYTES = [1_000, 10_000, 200_000, 1_000_000]
+
+TURN = "The quick brown fox jumps over the lazy dog, naïvely. " * 8
+
+
+def build_request(size: int) -> models.ChatCompletionRequestJSON:
+    messages = []
+    while sum(len(m["content"]) for m in messages) < size:
+        role = "user" if len(messages) % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": TURN})
+    return models.ChatCompletionRequestJSON(
+        model="gpt-4o", messages=messages, temperature=0.2
+    )
+
+
+def before(request):
+    return utils.marshal_json(request, models.ChatCompletionRequestJSON).encode()
+
+
+def after(request):
+    return utils.serialize_request_body(
+        request, False, False, "json", models.ChatCompletionRequestJSON
+    ).content
+
+
+def per_call_ms(fn, request, repeat: int) -> float:
+    fn(request)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(request)
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'history':>10} {'body KB':>8} {'before ms':>10} {'after ms':>9}")
+    for size in HISTORY_BYTES:
+        request = build_request(size)
+        body = after(request)
+        b = per_call_ms(before, request, args.repeat)
+        a = per_call_ms(after, request, args.repeat)
+        print(f"{size:>10,} {len(body) / 1e3:>8.0f} {b:>10.3f} {a:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
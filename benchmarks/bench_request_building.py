@@ -0,0 +1,127 @@
+"""Per-call cost of building operation requests with and without request plans.
+
+For several operations, times the generic ``generate_url``,
+``get_query_params`` and ``get_headers`` utilities, which read the per-class
+field metadata tables, against the same parts read through the operation's
+cached ``RequestPlan``, and times the whole of ``_build_request``, body
+encoding and ``httpx.Client.build_request`` included.
+
+    python benchmarks/bench_request_building.py [--calls N]
+"""
+
+import argparse
+import time
+
+import httpx
+
+from sudo_ai import Sudo, models, utils
+
+SERVER_URL = "http://bench.test"
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+OPERATIONS = [
+    (
+        "create",
+        "POST",
+        "/v1/chat/completions",
+        models.ChatCompletionRequestJSON(model="gpt-4o", messages=MESSAGES),
+        models.ChatCompletionRequestJSON,
+    ),
+    (
+        "list",
+        "GET",
+        "/v1/chat/completions",
+        models.ListChatCompletionsRequest(limit=20, order="desc", metadata={"k": "v"}),
+        None,
+    ),
+    (
+        "messages",
+        "GET",
+        "/v1/chat/completions/{completion_id}/messages",
+        models.GetChatCompletionMessagesRequest(completion_id="chatcmpl-1", limit=20),
+        None,
+    ),
+    (
+        "update",
+        "POST",
+        "/v1/chat/completions/{completion_id}",
+        models.UpdateChatCompletionRequest(
+            completion_id="chatcmpl-1",
+            request_body=models.UpdateChatCompletionRequestBody(metadata={"k": "v"}),
+        ),
+        models.UpdateChatCompletionRequestBody,
+    ),
+]
+
+
+def measure(call, calls: int) -> float:
+    call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    sdk = Sudo(
+        server_url=SERVER_URL,
+        api_key="bench",
+        client=httpx.Client(transport=httpx.MockTransport(httpx.Response)),
+    )
+    router = sdk.router
+
+    print(
+        f"{'operation':<10} {'utils µs':>11} {'plan µs':>8} {'build_request µs':>17}"
+    )
+    for name, method, path, request, body_type in OPERATIONS:
+        get_serialized_body = None
+        if body_type is not None:
+            body = getattr(request, "request_body", request)
+
+            def get_serialized_body(body=body, body_type=body_type):
+                return utils.serialize_request_body(
+                    body, False, False, "json", body_type
+                )
+
+        def generic():
+            utils.generate_url(SERVER_URL, path, request)
+            utils.get_query_params(request)
+            utils.get_headers(request)
+
+        def plan():
+            plan = utils.get_request_plan(
+                method, path, type(request), True, True, "application/json"
+            )
+            plan.generate_url(SERVER_URL, request)
+            plan.get_query_params(request)
+            plan.get_headers(request)
+
+        def build():
+            router._build_request(
+                method=method,
+                path=path,
+                base_url=SERVER_URL,
+                url_variables=None,
+                request=request,
+                request_body_required=body_type is not None,
+                request_has_path_params=True,
+                request_has_query_params=True,
+                user_agent_header="user-agent",
+                accept_header_value="application/json",
+                security=sdk.sdk_configuration.security,
+                get_serialized_body=get_serialized_body,
+            )
+
+        print(
+            f"{name:<10} {measure(generic, args.calls):>11.2f} "
+            f"{measure(plan, args.calls):>8.2f} {measure(build, args.calls):>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Startup time and memory of many short-lived Sudo instances, one per tenant.
+
+Creates ``--instances`` ``Sudo`` instances and keeps them alive, then drops
+them and collects garbage, so their finalizers run. Each mode runs in a fresh
+interpreter. ``lazy`` leaves the default clients to be created on first use,
+``sync`` creates only the sync client as a sync-only service would, and
+``eager`` creates both clients up front, as every instance used to. Reports
+the time per instance to create and to finalize, and the resident set growth
+per instance while they are alive.
+
+    python benchmarks/bench_sdk_startup.py [--instances N]
+"""
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+
+MODES = ("lazy", "sync", "eager")
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def run(mode: str, instances: int) -> None:
+    from sudo_ai import Sudo
+
+    # Import and build everything shared between instances up front.
+    warm = Sudo(server_url="http://bench.test", api_key="bench")
+    warm.sdk_configuration.get_client()
+    warm.sdk_configuration.get_async_client()
+    del warm
+    gc.collect()
+
+    before = rss_bytes()
+    start = time.perf_counter()
+    sdks = []
+    for i in range(instances):
+        sdk = Sudo(server_url="http://bench.test", api_key=f"tenant-{i}")
+        if mode in ("sync", "eager"):
+            sdk.sdk_configuration.get_client()
+        if mode == "eager":
+            sdk.sdk_configuration.get_async_client()
+        sdks.append(sdk)
+    created = time.perf_counter() - start
+    grown = rss_bytes() - before
+
+    start = time.perf_counter()
+    del sdks, sdk
+    gc.collect()
+    finalized = time.perf_counter() - start
+
+    print(
+        f"{mode:<6} {created / instances * 1e6:>11.1f} "
+        f"{finalized / instances * 1e6:>13.1f} {grown / instances / 1024:>10.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instances", type=int, default=500)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run(args.mode, args.instances)
+        return
+
+    print(f"{'mode':<6} {'create µs':>11} {'finalize µs':>13} {'RSS KiB':>10}")
+    for mode in MODES:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--mode",
+                mode,
+                "--instances",
+                str(args.instances),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
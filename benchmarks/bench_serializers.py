@@ -0,0 +1,127 @@
+"""Per-call cost of the type-driven helpers in ``sudo_ai.utils.serializers``.
+
+Every request and response goes through ``unmarshal_json`` / ``marshal_json``
+/ ``get_pydantic_model``. This compares the current implementation, which
+reuses one cached ``TypeAdapter`` per type, against the previous one, which
+built a throwaway wrapper model with ``create_model`` on every call.
+
+    python benchmarks/bench_serializers.py [--calls N]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, List
+
+from pydantic import ConfigDict, create_model
+from pydantic_core import from_json
+
+from sudo_ai import models, utils
+
+
+def legacy_unmarshal(val, typ: Any) -> Any:
+    unmarshaller = create_model(
+        "Unmarshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    return unmarshaller(body=val).body  # type: ignore
+
+
+def legacy_unmarshal_json(raw, typ: Any) -> Any:
+    return legacy_unmarshal(from_json(raw), typ)
+
+
+def legacy_marshal_json(val, typ):
+    marshaller = create_model(
+        "Marshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    d = marshaller(body=val).model_dump(by_alias=True, mode="json", exclude_none=True)
+    if len(d) == 0:
+        return ""
+    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+
+
+COMPLETION = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hello there! " * 20},
+            }
+        ],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 40, "total_tokens": 52},
+    }
+)
+
+CHUNK = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": "token "}}],
+    }
+)
+
+MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "Summarise the plot of Hamlet."},
+]
+
+REQUEST = models.ChatCompletionRequestJSON(model="gpt-4o", messages=MESSAGES)
+
+CASES = [
+    (
+        "unmarshal_json ChatCompletion",
+        lambda: legacy_unmarshal_json(COMPLETION, models.ChatCompletion),
+        lambda: utils.unmarshal_json(COMPLETION, models.ChatCompletion),
+    ),
+    (
+        "unmarshal_json ChatCompletionChunk",
+        lambda: legacy_unmarshal_json(CHUNK, models.ChatCompletionChunk),
+        lambda: utils.unmarshal_json(CHUNK, models.ChatCompletionChunk),
+    ),
+    (
+        "get_pydantic_model List[ChatMessage]",
+        lambda: legacy_unmarshal(MESSAGES, List[models.ChatMessage]),
+        lambda: utils.get_pydantic_model(MESSAGES, List[models.ChatMessage]),
+    ),
+    (
+        "marshal_json ChatCompletionRequestJSON",
+        lambda: legacy_marshal_json(REQUEST, models.ChatCompletionRequestJSON),
+        lambda: utils.marshal_json(REQUEST, models.ChatCompletionRequestJSON),
+    ),
+]
+
+
+def per_call_us(fn, calls: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'case':<40} {'before µs':>10} {'after µs':>10} {'speedup':>8}")
+    for name, before, after in CASES:
+        assert before() == after()
+        b = per_call_us(before, args.calls)
+        a = per_call_us(after, args.calls)
+        print(f"{name:<40} {b:>10.1f} {a:>10.1f} {b / a:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
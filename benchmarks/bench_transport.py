@@ -0,0 +1,169 @@
+"""High-concurrency streaming through the transport settings of TransportConfig.
+
+Starts a local HTTP/1.1 server that answers every request with a chat
+completion event stream, one event every ``--interval`` ms, and runs two
+rounds of ``--streams`` concurrent ``Router.create_streaming_async`` calls,
+``--idle`` seconds apart, for each configuration. Reports the wall time of
+each round, the connections the server accepted in each round, and the
+streams that failed, for example with a pool timeout.
+
+    python benchmarks/bench_transport.py [--streams N] [--events N] [--interval MS] [--idle S]
+
+HTTP/2 is negotiated with TLS ALPN, so it cannot be exercised against this
+plaintext server and has no row here.
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from sudo_ai import Sudo, utils
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class StreamServer:
+    def __init__(self, events: int, interval: float):
+        self.events = events
+        self.interval = interval
+        self.connections = 0
+        self.port = 0
+        self._started = threading.Event()
+
+    def start(self) -> None:
+        threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True).start()
+        self._started.wait()
+
+    async def _serve(self) -> None:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = server.sockets[0].getsockname()[1]
+        self._started.set()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        chunk = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": "token"}}],
+        }
+        event = f"data: {json.dumps(chunk)}\n\n".encode()
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/event-stream\r\n"
+                    b"Transfer-Encoding: chunked\r\n\r\n"
+                )
+                for _ in range(self.events):
+                    await asyncio.sleep(self.interval)
+                    writer.write(b"%x\r\n%s\r\n" % (len(event), event))
+                    await writer.drain()
+                done = b"data: [DONE]\n\n"
+                writer.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(done), done))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def consume(sdk: Sudo) -> None:
+    res = await sdk.router.create_streaming_async(messages=MESSAGES, model="gpt-4o")
+    async with res as event_stream:
+        async for _ in event_stream:
+            pass
+
+
+async def run_round(sdk: Sudo, streams: int):
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(consume(sdk) for _ in range(streams)), return_exceptions=True
+    )
+    errors = sum(isinstance(result, Exception) for result in results)
+    return time.perf_counter() - start, errors
+
+
+async def run(server: StreamServer, config, streams: int, idle: float):
+    sdk = Sudo(
+        server_url=f"http://127.0.0.1:{server.port}",
+        api_key="bench",
+        transport_config=config,
+    )
+    rounds = []
+    async with sdk:
+        for i in range(2):
+            if i:
+                await asyncio.sleep(idle)
+            connections = server.connections
+            elapsed, errors = await run_round(sdk, streams)
+            rounds.append((elapsed, server.connections - connections, errors))
+    return rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=5)
+    parser.add_argument("--idle", type=float, default=1)
+    args = parser.parse_args()
+
+    server = StreamServer(args.events, args.interval / 1000)
+    server.start()
+
+    n = args.streams
+    configs = [
+        ("httpx defaults", None),
+        (
+            f"pool {n}",
+            utils.TransportConfig(max_connections=n, max_keepalive_connections=n),
+        ),
+        (f"pool {n}, 20 kept alive", utils.TransportConfig(max_connections=n)),
+        (
+            f"pool {n}, keep-alive 0.5 s",
+            utils.TransportConfig(
+                max_connections=n, max_keepalive_connections=n, keepalive_expiry_ms=500
+            ),
+        ),
+        (
+            "pool 10",
+            utils.TransportConfig(max_connections=10, max_keepalive_connections=10),
+        ),
+        (
+            "pool 10, pool timeout 0.1 s",
+            utils.TransportConfig(
+                max_connections=10, max_keepalive_connections=10, pool_timeout_ms=100
+            ),
+        ),
+    ]
+
+    print(
+        f"{'configuration':<28} {'round 1 s':>9} {'conns':>6} {'errors':>6} "
+        f"{'round 2 s':>9} {'conns':>6} {'errors':>6}"
+    )
+    for name, config in configs:
+        rounds = asyncio.run(run(server, config, n, args.idle))
+        print(
+            f"{name:<28} "
+            + " ".join(
+                f"{elapsed:>9.3f} {connections:>6} {errors:>6}"
+                for elapsed, connections, errors in rounds
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
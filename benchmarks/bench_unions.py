@@ -0,0 +1,124 @@
+"""Validation cost of the Item, InputItem and ContentPart unions.
+
+Validates JSON arrays of mixed items against the tag-dispatched unions in
+``models`` and against plain smart-mode unions of the same variants, the way
+they were declared before. Reports microseconds per item for each.
+
+    python benchmarks/bench_unions.py [--items N ...] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+from typing import List, Union
+
+from sudo_ai import models, utils
+from sudo_ai.models import contentpart_union, inputitem_union, item_union
+
+ITEMS = [
+    {
+        "type": "message",
+        "id": "msg_1",
+        "role": "assistant",
+        "status": "completed",
+        "content": [{"type": "output_text", "text": "Hello", "annotations": []}],
+    },
+    {
+        "type": "function_call",
+        "id": "fc_1",
+        "call_id": "call_1",
+        "name": "get_weather",
+        "arguments": '{"city": "Paris"}',
+        "status": "completed",
+    },
+    {"type": "function_call_output", "call_id": "call_1", "output": "sunny"},
+    {
+        "type": "reasoning",
+        "id": "rs_1",
+        "summary": [{"type": "summary_text", "text": "thinking"}],
+        "content": [],
+    },
+    {
+        "type": "web_search_call",
+        "id": "ws_1",
+        "status": "completed",
+        "action": {"type": "search", "query": "weather"},
+    },
+    {
+        "type": "mcp_call",
+        "id": "mcp_1",
+        "server_label": "tools",
+        "name": "lookup",
+        "arguments": "{}",
+    },
+]
+
+PARTS = [
+    {"type": "text", "text": "Describe this"},
+    {"type": "image_url", "image_url": {"url": "https://example.com/cat.png"}},
+    {"type": "input_audio", "input_audio": {"data": "AAAA", "format": "wav"}},
+    {"type": "file", "file": {"file_id": "file_1"}},
+]
+
+INPUT_ITEMS = [
+    {"role": "user", "content": [PARTS[0], PARTS[1]]},
+    {"type": "item_reference", "id": "msg_0"},
+] + ITEMS[1:]
+
+CASES = [
+    ("Item", ITEMS, models.ItemUnion, item_union._ItemVariants),
+    (
+        "InputItem",
+        INPUT_ITEMS,
+        models.InputItemUnion,
+        Union[
+            inputitem_union.InputItem1,
+            inputitem_union.InputItem2,
+            item_union._ItemVariants,
+        ],
+    ),
+    (
+        "ContentPart",
+        PARTS,
+        models.ContentPartUnion,
+        Union[
+            contentpart_union.ContentPart1,
+            contentpart_union.ContentPart2,
+            contentpart_union.ContentPart3,
+            contentpart_union.ContentPart4,
+        ],
+    ),
+]
+
+
+def measure(adapter, data: bytes, count: int, repeat: int) -> float:
+    adapter.validate_json(data)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        adapter.validate_json(data)
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'union':<12} {'items':>6} {'smart µs/item':>14} {'tagged µs/item':>15}")
+    for name, samples, tagged, smart in CASES:
+        for count in args.items:
+            data = json.dumps([samples[i % len(samples)] for i in range(count)])
+            smart_us = measure(
+                utils.get_type_adapter(List[smart]), data.encode(), count, args.repeat
+            )
+            tagged_us = measure(
+                utils.get_type_adapter(List[tagged]), data.encode(), count, args.repeat
+            )
+            print(f"{name:<12} {count:>6} {smart_us:>14.2f} {tagged_us:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
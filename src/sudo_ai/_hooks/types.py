@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 import httpx
 from sudo_ai.sdkconfiguration import SDKConfiguration
+from sudo_ai.utils.credentials import CredentialProvider
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 
@@ -25,6 +26,9 @@ class HookContext:
         self.base_url = base_url
         self.operation_id = operation_id
         self.oauth2_scopes = oauth2_scopes
+        # Hooks get the callable the SDK was given, not its caching wrapper.
+        if isinstance(security_source, CredentialProvider):
+            security_source = security_source.source
         self.security_source = security_source
 
 
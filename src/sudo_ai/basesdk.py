@@ -5,7 +5,7 @@ import httpx
 from sudo_ai import errors, models, utils
 from sudo_ai._hooks import AfterErrorContext, AfterSuccessContext, BeforeRequestContext
 from sudo_ai.utils import RetryConfig, SerializedRequestBody, get_body_content
-from typing import Callable, List, Mapping, Optional, Tuple
+from typing import Awaitable, Callable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 
@@ -57,7 +57,7 @@ class BaseSDK:
         url_override: Optional[str] = None,
         http_headers: Optional[Mapping[str, str]] = None,
     ) -> httpx.Request:
-        client = self.sdk_configuration.async_client
+        client = self.sdk_configuration.get_async_client()
         return self._build_request_with_client(
             client,
             method,
@@ -76,6 +76,7 @@ class BaseSDK:
             get_serialized_body,
             url_override,
             http_headers,
+            background_refresh=True,
         )
 
     def _build_request(
@@ -99,7 +100,7 @@ class BaseSDK:
         url_override: Optional[str] = None,
         http_headers: Optional[Mapping[str, str]] = None,
     ) -> httpx.Request:
-        client = self.sdk_configuration.client
+        client = self.sdk_configuration.get_client()
         return self._build_request_with_client(
             client,
             method,
@@ -141,22 +142,26 @@ class BaseSDK:
         ] = None,
         url_override: Optional[str] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        background_refresh: bool = False,
     ) -> httpx.Request:
+        plan = utils.get_request_plan(
+            method,
+            path,
+            type(request),
+            request_has_path_params,
+            request_has_query_params,
+            accept_header_value,
+        )
+
         query_params = {}
 
-        url = url_override
+        # Plans return a cached httpx.URL, which saves re-parsing the URL.
+        url: Optional[Union[str, httpx.URL]] = url_override
         if url is None:
-            url = utils.generate_url(
-                self._get_url(base_url, url_variables),
-                path,
-                request if request_has_path_params else None,
-                _globals if request_has_path_params else None,
-            )
-
-            query_params = utils.get_query_params(
-                request if request_has_query_params else None,
-                _globals if request_has_query_params else None,
+            url = plan.generate_url(
+                self._get_url(base_url, url_variables), request, _globals
             )
+            query_params = plan.get_query_params(request, _globals)
         else:
             # Pick up the query parameter from the override so they can be
             # preserved when building the request later on (necessary as of
@@ -164,18 +169,24 @@ class BaseSDK:
             parsed_override = urlparse(str(url_override))
             query_params = parse_qs(parsed_override.query, keep_blank_values=True)
 
-        headers = utils.get_headers(request, _globals)
-        headers["Accept"] = accept_header_value
+        headers = plan.get_headers(request, _globals)
         headers[user_agent_header] = self.sdk_configuration.user_agent
 
-        if security is not None:
-            if callable(security):
-                security = security()
-        security = utils.get_security_from_env(security, models.Security)
-        if security is not None:
-            security_headers, security_query_params = utils.get_security(security)
+        if isinstance(security, utils.CredentialProvider):
+            security_headers, security_query_params = security.get(
+                background=background_refresh
+            )
             headers = {**headers, **security_headers}
             query_params = {**query_params, **security_query_params}
+        else:
+            if security is not None:
+                if callable(security):
+                    security = security()
+            security = utils.get_security_from_env(security, models.Security)
+            if security is not None:
+                security_headers, security_query_params = utils.get_security(security)
+                headers = {**headers, **security_headers}
+                query_params = {**query_params, **security_query_params}
 
         serialized_request_body = SerializedRequestBody()
         if get_serialized_body is not None:
@@ -200,12 +211,17 @@ class BaseSDK:
             for header, value in http_headers.items():
                 headers[header] = value
 
-        timeout = timeout_ms / 1000 if timeout_ms is not None else None
+        transport_config = self.sdk_configuration.transport_config
+        if transport_config is not None:
+            timeout = transport_config.get_timeout(timeout_ms)
+        else:
+            timeout = timeout_ms / 1000 if timeout_ms is not None else None
 
         return client.build_request(
             method,
             url,
-            params=query_params,
+            # Empty params would make httpx copy the parsed URL for nothing.
+            params=query_params or None,
             content=serialized_request_body.content,
             data=serialized_request_body.data,
             files=serialized_request_body.files,
@@ -221,8 +237,12 @@ class BaseSDK:
         stream=False,
         retry_config: Optional[Tuple[RetryConfig, List[str]]] = None,
     ) -> httpx.Response:
-        client = self.sdk_configuration.client
+        client = self.sdk_configuration.get_client()
         logger = self.sdk_configuration.debug_logger
+        security = self.sdk_configuration.security
+        # Formatting bodies is only worth it when the records are emitted.
+        debug = utils.is_debug_enabled(logger)
+        trace = self._request_trace(hook_ctx.operation_id)
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
@@ -230,18 +250,36 @@ class BaseSDK:
             http_res = None
             try:
                 req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
-                logger.debug(
-                    "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                    req.method,
-                    req.url,
-                    req.headers,
-                    get_body_content(req),
-                )
+                if debug:
+                    logger.debug(
+                        "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                        req.method,
+                        req.url,
+                        req.headers,
+                        get_body_content(req),
+                    )
 
                 if client is None:
                     raise ValueError("client is required")
 
+                if trace is not None:
+                    trace.send(req)
                 http_res = client.send(req, stream=stream)
+                if trace is not None:
+                    trace.receive(http_res, stream)
+                if http_res.status_code == 401 and isinstance(
+                    security, utils.CredentialProvider
+                ):
+                    security_headers = security.reauthorize(req.headers)
+                    if security_headers is not None:
+                        logger.debug("Resending request with refreshed credentials")
+                        http_res.close()
+                        req.headers.update(security_headers)
+                        if trace is not None:
+                            trace.send(req)
+                        http_res = client.send(req, stream=stream)
+                        if trace is not None:
+                            trace.receive(http_res, stream)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -252,13 +290,14 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
-            logger.debug(
-                "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                http_res.status_code,
-                http_res.url,
-                http_res.headers,
-                "<streaming response>" if stream else http_res.text,
-            )
+            if debug:
+                logger.debug(
+                    "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                    http_res.status_code,
+                    http_res.url,
+                    http_res.headers,
+                    "<streaming response>" if stream else http_res.text,
+                )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
                 result, err = hooks.after_error(
@@ -275,14 +314,23 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
-        else:
-            http_res = do()
-
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
-            http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
-
+        try:
+            if retry_config is not None:
+                http_res = utils.retry(
+                    do, utils.Retries(retry_config[0], retry_config[1])
+                )
+            else:
+                http_res = do()
+
+            if not utils.match_status_codes(error_status_codes, http_res.status_code):
+                http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
+        except Exception as e:
+            if trace is not None:
+                trace.finish(e)
+            raise
+
+        if trace is not None:
+            trace.finish()
         return http_res
 
     async def do_request_async(
@@ -293,8 +341,12 @@ class BaseSDK:
         stream=False,
         retry_config: Optional[Tuple[RetryConfig, List[str]]] = None,
     ) -> httpx.Response:
-        client = self.sdk_configuration.async_client
+        client = self.sdk_configuration.get_async_client()
         logger = self.sdk_configuration.debug_logger
+        security = self.sdk_configuration.security
+        # Formatting bodies is only worth it when the records are emitted.
+        debug = utils.is_debug_enabled(logger)
+        trace = self._request_trace(hook_ctx.operation_id)
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
 
@@ -302,18 +354,36 @@ class BaseSDK:
             http_res = None
             try:
                 req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
-                logger.debug(
-                    "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                    req.method,
-                    req.url,
-                    req.headers,
-                    get_body_content(req),
-                )
+                if debug:
+                    logger.debug(
+                        "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                        req.method,
+                        req.url,
+                        req.headers,
+                        get_body_content(req),
+                    )
 
                 if client is None:
                     raise ValueError("client is required")
 
+                if trace is not None:
+                    trace.send(req)
                 http_res = await client.send(req, stream=stream)
+                if trace is not None:
+                    trace.receive(http_res, stream)
+                if http_res.status_code == 401 and isinstance(
+                    security, utils.CredentialProvider
+                ):
+                    security_headers = await security.reauthorize_async(req.headers)
+                    if security_headers is not None:
+                        logger.debug("Resending request with refreshed credentials")
+                        await http_res.aclose()
+                        req.headers.update(security_headers)
+                        if trace is not None:
+                            trace.send(req)
+                        http_res = await client.send(req, stream=stream)
+                        if trace is not None:
+                            trace.receive(http_res, stream)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -324,13 +394,14 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
-            logger.debug(
-                "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                http_res.status_code,
-                http_res.url,
-                http_res.headers,
-                "<streaming response>" if stream else http_res.text,
-            )
+            if debug:
+                logger.debug(
+                    "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                    http_res.status_code,
+                    http_res.url,
+                    http_res.headers,
+                    "<streaming response>" if stream else http_res.text,
+                )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
                 result, err = hooks.after_error(
@@ -347,14 +418,89 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
+        try:
+            if retry_config is not None:
+                http_res = await utils.retry_async(
+                    do, utils.Retries(retry_config[0], retry_config[1])
+                )
+            else:
+                http_res = await do()
+
+            if not utils.match_status_codes(error_status_codes, http_res.status_code):
+                http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
+        except Exception as e:
+            if trace is not None:
+                trace.finish(e)
+            raise
+
+        if trace is not None:
+            trace.finish()
+        return http_res
+
+    def _request_trace(self, operation_id: str) -> Optional[utils.RequestTrace]:
+        config = self.sdk_configuration.trace_config
+        if config is None:
+            return None
+        return utils.RequestTrace(
+            operation_id, config, self.sdk_configuration.debug_logger
+        )
+
+    def _stream_metrics(self, operation_id: str) -> utils.StreamMetrics:
+        # Always recorded, as it is cheap; only publishing needs a sink.
+        return utils.StreamMetrics(
+            operation_id,
+            self.sdk_configuration.metrics_sink,
+            self.sdk_configuration.debug_logger,
+        )
+
+    def _stream_reconnector(
+        self,
+        hook_ctx,
+        request,
+        error_status_codes,
+        retry_config: Optional[Tuple[RetryConfig, List[str]]] = None,
+    ) -> Callable[[Optional[str]], httpx.Response]:
+        def reconnect(last_event_id: Optional[str]) -> httpx.Response:
+            if last_event_id is not None:
+                request.headers["Last-Event-ID"] = last_event_id
+            http_res = self.do_request(
+                hook_ctx=hook_ctx,
+                request=request,
+                error_status_codes=error_status_codes,
+                stream=True,
+                retry_config=retry_config,
             )
-        else:
-            http_res = await do()
+            if not utils.match_response(http_res, "200", "text/event-stream"):
+                http_res_text = utils.stream_to_text(http_res)
+                raise errors.SudoDefaultError(
+                    "Unexpected response when resuming stream", http_res, http_res_text
+                )
+            return http_res
 
-        if not utils.match_status_codes(error_status_codes, http_res.status_code):
-            http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
+        return reconnect
 
-        return http_res
+    def _stream_reconnector_async(
+        self,
+        hook_ctx,
+        request,
+        error_status_codes,
+        retry_config: Optional[Tuple[RetryConfig, List[str]]] = None,
+    ) -> Callable[[Optional[str]], Awaitable[httpx.Response]]:
+        async def reconnect(last_event_id: Optional[str]) -> httpx.Response:
+            if last_event_id is not None:
+                request.headers["Last-Event-ID"] = last_event_id
+            http_res = await self.do_request_async(
+                hook_ctx=hook_ctx,
+                request=request,
+                error_status_codes=error_status_codes,
+                stream=True,
+                retry_config=retry_config,
+            )
+            if not utils.match_response(http_res, "200", "text/event-stream"):
+                http_res_text = await utils.stream_to_text_async(http_res)
+                raise errors.SudoDefaultError(
+                    "Unexpected response when resuming stream", http_res, http_res_text
+                )
+            return http_res
+
+        return reconnect
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
     from .errorresponse import ErrorResponse, ErrorResponseData
     from .no_response_error import NoResponseError
     from .responsevalidationerror import ResponseValidationError
+    from .stream_detached_error import StreamDetachedError
+    from .stream_interrupted_error import StreamInterruptedError
     from .sudodefaulterror import SudoDefaultError
 
 __all__ = [
@@ -17,6 +19,8 @@ __all__ = [
     "ErrorResponseData",
     "NoResponseError",
     "ResponseValidationError",
+    "StreamDetachedError",
+    "StreamInterruptedError",
     "SudoDefaultError",
     "SudoError",
 ]
@@ -26,6 +30,8 @@ _dynamic_imports: dict[str, str] = {
     "ErrorResponseData": ".errorresponse",
     "NoResponseError": ".no_response_error",
     "ResponseValidationError": ".responsevalidationerror",
+    "StreamDetachedError": ".stream_detached_error",
+    "StreamInterruptedError": ".stream_interrupted_error",
     "SudoDefaultError": ".sudodefaulterror",
 }
 
@@ -52,6 +58,8 @@ def __getattr__(attr_name: str) -> object:
     try:
         module = dynamic_import(module_name)
         result = getattr(module, attr_name)
+        # Bind the name so later lookups skip __getattr__.
+        globals()[attr_name] = result
         return result
     except ImportError as e:
         raise ImportError(
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class StreamDetachedError(Exception):
+    """Error raised when a tee consumer fell too far behind and was detached."""
+
+    message: str
+
+    def __init__(self, message: str = "Consumer fell behind and was detached"):
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class StreamInterruptedError(Exception):
+    """Error raised when the upstream read of a tee was interrupted."""
+
+    message: str
+
+    def __init__(self, message: str = "The shared upstream read was interrupted"):
+        object.__setattr__(self, "message", message)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
@@ -103,6 +103,13 @@ def close_clients(
     collected.
     """
 
+    # Clients created on first use, after the finalizer was registered, are
+    # only reachable through the owner.
+    if sync_client is None:
+        sync_client = owner.client
+    if async_client is None:
+        async_client = owner.async_client
+
     # Unset the client/async_client properties so there are no more references
     # to them from the owning SDK instance and they can be reaped.
     owner.client = None
@@ -810,6 +810,8 @@ def __getattr__(attr_name: str) -> object:
     try:
         module = dynamic_import(module_name)
         result = getattr(module, attr_name)
+        # Bind the name so later lookups skip __getattr__.
+        globals()[attr_name] = result
         return result
     except ImportError as e:
         raise ImportError(
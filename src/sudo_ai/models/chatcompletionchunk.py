@@ -6,8 +6,13 @@ from .chatcompletionchunkchoice import (
     ChatCompletionChunkChoiceTypedDict,
 )
 from enum import Enum
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import Any, List, Optional
 from typing_extensions import NotRequired, TypedDict
 
@@ -81,35 +86,11 @@ class ChatCompletionChunkData(BaseModel):
     usage: OptionalNullable[ChatCompletionChunkUsage] = UNSET
     r"""Usage statistics for the completion request. When stream_options.include_usage is set, the final chunk before [DONE] will contain the full usage statistics, and all other chunks will include usage with a null value."""
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["system_fingerprint", "usage"]
-        nullable_fields = ["system_fingerprint", "usage"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["system_fingerprint", "usage"],
+        nullable_fields=["system_fingerprint", "usage"],
+        null_default_fields=[],
+    )
 
 
 class ChatCompletionChunkTypedDict(TypedDict):
@@ -3,8 +3,13 @@
 from __future__ import annotations
 from .toolcall import ToolCall, ToolCallTypedDict
 from enum import Enum
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import List
 from typing_extensions import NotRequired, TypedDict
 
@@ -42,32 +47,8 @@ class ChatCompletionDelta(BaseModel):
     refusal: OptionalNullable[str] = UNSET
     r"""The refusal message generated by the model."""
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["content", "role", "tool_calls", "refusal"]
-        nullable_fields = ["content", "role", "tool_calls", "refusal"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["content", "role", "tool_calls", "refusal"],
+        nullable_fields=["content", "role", "tool_calls", "refusal"],
+        null_default_fields=[],
+    )
@@ -5,8 +5,13 @@ from .chatmessage import ChatMessage, ChatMessageTypedDict
 from .tool import Tool, ToolTypedDict
 from enum import Enum
 import pydantic
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import Any, Dict, List, Optional, Union
 from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
 
@@ -396,9 +401,8 @@ class ChatCompletionRequestJSON(BaseModel):
     top_p: OptionalNullable[float] = UNSET
     r"""An alternative to sampling with temperature, called nucleus sampling, where the model considers the results of the tokens with top_p probability mass. So 0.1 means only the tokens comprising the top 10% probability mass are considered. We generally recommend altering this or temperature but not both."""
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = [
+    serialize_model = unset_aware_serializer(
+        optional_fields=[
             "audio",
             "frequency_penalty",
             "logit_bias",
@@ -424,8 +428,8 @@ class ChatCompletionRequestJSON(BaseModel):
             "tools",
             "top_logprobs",
             "top_p",
-        ]
-        nullable_fields = [
+        ],
+        nullable_fields=[
             "audio",
             "frequency_penalty",
             "logit_bias",
@@ -450,29 +454,6 @@ class ChatCompletionRequestJSON(BaseModel):
             "tools",
             "top_logprobs",
             "top_p",
-        ]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        ],
+        null_default_fields=[],
+    )
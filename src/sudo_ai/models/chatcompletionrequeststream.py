@@ -5,8 +5,13 @@ from .chatmessage import ChatMessage, ChatMessageTypedDict
 from .tool import Tool, ToolTypedDict
 from enum import Enum
 import pydantic
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import Any, Dict, List, Optional, Union
 from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
 
@@ -403,9 +408,8 @@ class ChatCompletionRequestStream(BaseModel):
     user: OptionalNullable[str] = UNSET
     r"""A unique identifier representing your end-user, which can help to monitor and detect abuse."""
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = [
+    serialize_model = unset_aware_serializer(
+        optional_fields=[
             "audio",
             "frequency_penalty",
             "logit_bias",
@@ -432,8 +436,8 @@ class ChatCompletionRequestStream(BaseModel):
             "top_logprobs",
             "top_p",
             "user",
-        ]
-        nullable_fields = [
+        ],
+        nullable_fields=[
             "audio",
             "frequency_penalty",
             "logit_bias",
@@ -459,29 +463,6 @@ class ChatCompletionRequestStream(BaseModel):
             "top_logprobs",
             "top_p",
             "user",
-        ]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        ],
+        null_default_fields=[],
+    )
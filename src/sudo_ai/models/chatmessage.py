@@ -3,8 +3,13 @@
 from __future__ import annotations
 from .messagecontent import MessageContent, MessageContentTypedDict
 from .toolcall import ToolCall, ToolCallTypedDict
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import List
 from typing_extensions import NotRequired, TypedDict
 
@@ -28,32 +33,8 @@ class ChatMessage(BaseModel):
 
     tool_calls: OptionalNullable[List[ToolCall]] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["name", "tool_call_id", "tool_calls"]
-        nullable_fields = ["name", "tool_call_id", "tool_calls"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["name", "tool_call_id", "tool_calls"],
+        nullable_fields=["name", "tool_call_id", "tool_calls"],
+        null_default_fields=[],
+    )
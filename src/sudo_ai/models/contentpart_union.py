@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 import pydantic
+from pydantic import Discriminator, Tag
 from sudo_ai.types import BaseModel
+from sudo_ai.utils import get_tag
 from typing import Optional, Union
 from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
 
@@ -133,5 +135,23 @@ ContentPartUnionTypedDict = TypeAliasType(
 
 
 ContentPartUnion = TypeAliasType(
-    "ContentPartUnion", Union[ContentPart1, ContentPart2, ContentPart3, ContentPart4]
+    "ContentPartUnion",
+    Annotated[
+        Union[
+            Annotated[
+                Union[
+                    Annotated[ContentPart1, Tag("text")],
+                    Annotated[ContentPart2, Tag("image_url")],
+                    Annotated[ContentPart3, Tag("input_audio")],
+                    Annotated[ContentPart4, Tag("file")],
+                ],
+                Discriminator(lambda m: get_tag(m, "type", "type")),
+            ],
+            Union[ContentPart1, ContentPart2, ContentPart3, ContentPart4],
+        ],
+        # Parts are dispatched on their type. Unknown types, and parts that
+        # do not match the variant of their type, are matched against every
+        # variant as before.
+        pydantic.Field(union_mode="left_to_right"),
+    ],
 )
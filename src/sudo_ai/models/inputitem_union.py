@@ -1,12 +1,20 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from __future__ import annotations
-from .item_union import ItemUnion, ItemUnionTypedDict
+from .item_union import Item1, Item2, ItemUnion, ItemUnionTypedDict
 from .messagecontent import MessageContent, MessageContentTypedDict
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
-from typing import Union
-from typing_extensions import NotRequired, TypeAliasType, TypedDict
+import pydantic
+from pydantic import Discriminator, Tag
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
+from sudo_ai.utils import get_tag
+from typing import Any, Union
+from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
 
 
 class InputItem2TypedDict(TypedDict):
@@ -19,35 +27,11 @@ class InputItem2(BaseModel):
 
     type: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["type"]
-        nullable_fields = ["type"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["type"],
+        nullable_fields=["type"],
+        null_default_fields=[],
+    )
 
 
 class InputItem1TypedDict(TypedDict):
@@ -67,6 +51,32 @@ InputItemUnionTypedDict = TypeAliasType(
 )
 
 
+def _input_item_tag(value: Any) -> str:
+    tag = get_tag(value, "type", "type")
+    if tag is None:
+        return "untyped"
+    if tag in ("message", "item_reference"):
+        return tag
+    return "item"
+
+
 InputItemUnion = TypeAliasType(
-    "InputItemUnion", Union[InputItem1, InputItem2, ItemUnion]
+    "InputItemUnion",
+    Annotated[
+        Union[
+            Annotated[
+                Union[
+                    Annotated[Union[InputItem1, InputItem2], Tag("untyped")],
+                    Annotated[Union[InputItem1, Item1, Item2], Tag("message")],
+                    Annotated[InputItem2, Tag("item_reference")],
+                    Annotated[ItemUnion, Tag("item")],
+                ],
+                Discriminator(_input_item_tag),
+            ],
+            Union[InputItem1, InputItem2, ItemUnion],
+        ],
+        # Input items are dispatched on their type. Items that do not match
+        # the variants of their type are matched against every variant.
+        pydantic.Field(union_mode="left_to_right"),
+    ],
 )
@@ -4,10 +4,18 @@ from __future__ import annotations
 from .messagecontent import MessageContent, MessageContentTypedDict
 from .outputmessage import OutputMessage, OutputMessageTypedDict
 from .toolcalloutput import ToolCallOutput, ToolCallOutputTypedDict
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+import pydantic
+from pydantic import Discriminator, Tag
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
+from sudo_ai.utils import get_tag
 from typing import Any, List, Union
-from typing_extensions import NotRequired, TypeAliasType, TypedDict
+from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
 
 
 class Item19TypedDict(TypedDict):
@@ -29,35 +37,11 @@ class Item19(BaseModel):
 
     id: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["id"]
-        nullable_fields = ["id"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["id"],
+        nullable_fields=["id"],
+        null_default_fields=[],
+    )
 
 
 class Item18TypedDict(TypedDict):
@@ -76,35 +60,11 @@ class Item18(BaseModel):
 
     id: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["id"]
-        nullable_fields = ["id"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["id"],
+        nullable_fields=["id"],
+        null_default_fields=[],
+    )
 
 
 class Item17TypedDict(TypedDict):
@@ -138,35 +98,11 @@ class Item17(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["approval_request_id", "error", "output", "status"]
-        nullable_fields = ["approval_request_id", "error", "output", "status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["approval_request_id", "error", "output", "status"],
+        nullable_fields=["approval_request_id", "error", "output", "status"],
+        null_default_fields=[],
+    )
 
 
 class Item16TypedDict(TypedDict):
@@ -188,35 +124,11 @@ class Item16(BaseModel):
 
     reason: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["id", "reason"]
-        nullable_fields = ["id", "reason"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["id", "reason"],
+        nullable_fields=["id", "reason"],
+        null_default_fields=[],
+    )
 
 
 class Item15TypedDict(TypedDict):
@@ -258,35 +170,11 @@ class Item14(BaseModel):
 
     error: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["error"]
-        nullable_fields = ["error"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["error"],
+        nullable_fields=["error"],
+        null_default_fields=[],
+    )
 
 
 class Item13TypedDict(TypedDict):
@@ -305,35 +193,11 @@ class Item13(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["status"]
-        nullable_fields = ["status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["status"],
+        nullable_fields=["status"],
+        null_default_fields=[],
+    )
 
 
 class Item12TypedDict(TypedDict):
@@ -418,35 +282,11 @@ class Item9(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["encrypted_content", "status"]
-        nullable_fields = ["encrypted_content", "status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["encrypted_content", "status"],
+        nullable_fields=["encrypted_content", "status"],
+        null_default_fields=[],
+    )
 
 
 class Item8TypedDict(TypedDict):
@@ -468,35 +308,11 @@ class Item8(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["id", "status"]
-        nullable_fields = ["id", "status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["id", "status"],
+        nullable_fields=["id", "status"],
+        null_default_fields=[],
+    )
 
 
 class Item7TypedDict(TypedDict):
@@ -521,35 +337,11 @@ class Item7(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["id", "status"]
-        nullable_fields = ["id", "status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["id", "status"],
+        nullable_fields=["id", "status"],
+        null_default_fields=[],
+    )
 
 
 class Item6TypedDict(TypedDict):
@@ -591,35 +383,11 @@ class Item5(BaseModel):
 
     status: OptionalNullable[str] = UNSET
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = ["acknowledged_safety_checks", "id", "status"]
-        nullable_fields = ["acknowledged_safety_checks", "id", "status"]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+    serialize_model = unset_aware_serializer(
+        optional_fields=["acknowledged_safety_checks", "id", "status"],
+        nullable_fields=["acknowledged_safety_checks", "id", "status"],
+        null_default_fields=[],
+    )
 
 
 class Item4TypedDict(TypedDict):
@@ -728,27 +496,61 @@ ItemUnionTypedDict = TypeAliasType(
 )
 
 
+_ItemVariants = Union[
+    Item10,
+    Item1,
+    Item6,
+    Item18,
+    Item13,
+    Item2,
+    Item3,
+    Item19,
+    Item8,
+    Item16,
+    Item14,
+    Item15,
+    Item12,
+    Item5,
+    Item11,
+    Item9,
+    Item7,
+    Item4,
+    Item17,
+]
+
+
 ItemUnion = TypeAliasType(
     "ItemUnion",
-    Union[
-        Item10,
-        Item1,
-        Item6,
-        Item18,
-        Item13,
-        Item2,
-        Item3,
-        Item19,
-        Item8,
-        Item16,
-        Item14,
-        Item15,
-        Item12,
-        Item5,
-        Item11,
-        Item9,
-        Item7,
-        Item4,
-        Item17,
+    Annotated[
+        Union[
+            Annotated[
+                Union[
+                    Annotated[Union[Item1, Item2], Tag("message")],
+                    Annotated[Item3, Tag("file_search_call")],
+                    Annotated[Item4, Tag("computer_call")],
+                    Annotated[Item5, Tag("computer_call_output")],
+                    Annotated[Item6, Tag("web_search_call")],
+                    Annotated[Item7, Tag("function_call")],
+                    Annotated[Item8, Tag("function_call_output")],
+                    Annotated[Item9, Tag("reasoning")],
+                    Annotated[Item10, Tag("image_generation_call")],
+                    Annotated[Item11, Tag("code_interpreter_call")],
+                    Annotated[Item12, Tag("local_shell_call")],
+                    Annotated[Item13, Tag("local_shell_call_output")],
+                    Annotated[Item14, Tag("mcp_list_tools")],
+                    Annotated[Item15, Tag("mcp_approval_request")],
+                    Annotated[Item16, Tag("mcp_approval_response")],
+                    Annotated[Item17, Tag("mcp_call")],
+                    Annotated[Item18, Tag("custom_tool_call_output")],
+                    Annotated[Item19, Tag("custom_tool_call")],
+                ],
+                Discriminator(lambda m: get_tag(m, "type", "type")),
+            ],
+            _ItemVariants,
+        ],
+        # Items are dispatched on their type. Unknown types, and items that
+        # do not match the variant of their type, are matched against every
+        # variant as before.
+        pydantic.Field(union_mode="left_to_right"),
     ],
 )
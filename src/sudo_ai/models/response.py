@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 from .item_union import ItemUnion, ItemUnionTypedDict
-from pydantic import model_serializer
-from sudo_ai.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+from sudo_ai.types import (
+    BaseModel,
+    Nullable,
+    OptionalNullable,
+    UNSET,
+    unset_aware_serializer,
+)
 from typing import Any, List, Optional, Union
 from typing_extensions import NotRequired, TypeAliasType, TypedDict
 
@@ -235,9 +240,8 @@ class Response(BaseModel):
     usage: OptionalNullable[ResponseUsage] = UNSET
     r"""Usage statistics for the API call"""
 
-    @model_serializer(mode="wrap")
-    def serialize_model(self, handler):
-        optional_fields = [
+    serialize_model = unset_aware_serializer(
+        optional_fields=[
             "background",
             "conversation",
             "error",
@@ -262,8 +266,8 @@ class Response(BaseModel):
             "top_p",
             "truncation",
             "usage",
-        ]
-        nullable_fields = [
+        ],
+        nullable_fields=[
             "background",
             "conversation",
             "incomplete_details",
@@ -283,29 +287,6 @@ class Response(BaseModel):
             "top_p",
             "truncation",
             "usage",
-        ]
-        null_default_fields = []
-
-        serialized = handler(self)
-
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        ],
+        null_default_fields=[],
+    )
@@ -1,89 +1,672 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from .basesdk import BaseSDK
+import httpx
 from sudo_ai import errors, models, utils
 from sudo_ai._hooks import HookContext
 from sudo_ai.types import OptionalNullable, UNSET
 from sudo_ai.utils import eventstreaming, get_security_from_env
 from sudo_ai.utils.unmarshal_json_response import unmarshal_json_response
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Callable, List, Mapping, Optional, TypeVar, Union
+
+T = TypeVar("T")
 
 
 class Responses(BaseSDK):
     def create_response(
         self,
         *,
-        background: OptionalNullable[bool] = UNSET,
-        conversation: OptionalNullable[
-            Union[
-                models.ResponsesRequestConversation,
-                models.ResponsesRequestConversationTypedDict,
-            ]
-        ] = UNSET,
-        include: OptionalNullable[List[Any]] = UNSET,
-        input_: OptionalNullable[
-            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
-        ] = UNSET,
-        instructions: OptionalNullable[str] = UNSET,
-        max_output_tokens: OptionalNullable[int] = UNSET,
-        max_tool_calls: OptionalNullable[int] = UNSET,
-        metadata: Optional[Any] = None,
-        model: OptionalNullable[str] = UNSET,
-        parallel_tool_calls: OptionalNullable[bool] = UNSET,
-        previous_response_id: OptionalNullable[str] = UNSET,
-        prompt: Optional[Any] = None,
-        prompt_cache_key: OptionalNullable[str] = UNSET,
-        reasoning: Optional[Any] = None,
-        safety_identifier: OptionalNullable[str] = UNSET,
-        service_tier: OptionalNullable[str] = UNSET,
-        store: OptionalNullable[bool] = UNSET,
-        stream: Optional[bool] = False,
-        stream_options: Optional[Any] = None,
-        temperature: OptionalNullable[float] = UNSET,
-        text: Optional[Any] = None,
-        tool_choice: OptionalNullable[
-            Union[
-                models.ResponsesRequestToolChoice,
-                models.ResponsesRequestToolChoiceTypedDict,
-            ]
-        ] = UNSET,
-        tools: OptionalNullable[List[Any]] = UNSET,
-        top_logprobs: OptionalNullable[int] = UNSET,
-        top_p: OptionalNullable[float] = UNSET,
-        truncation: OptionalNullable[str] = UNSET,
+        background: OptionalNullable[bool] = UNSET,
+        conversation: OptionalNullable[
+            Union[
+                models.ResponsesRequestConversation,
+                models.ResponsesRequestConversationTypedDict,
+            ]
+        ] = UNSET,
+        include: OptionalNullable[List[Any]] = UNSET,
+        input_: OptionalNullable[
+            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
+        ] = UNSET,
+        instructions: OptionalNullable[str] = UNSET,
+        max_output_tokens: OptionalNullable[int] = UNSET,
+        max_tool_calls: OptionalNullable[int] = UNSET,
+        metadata: Optional[Any] = None,
+        model: OptionalNullable[str] = UNSET,
+        parallel_tool_calls: OptionalNullable[bool] = UNSET,
+        previous_response_id: OptionalNullable[str] = UNSET,
+        prompt: Optional[Any] = None,
+        prompt_cache_key: OptionalNullable[str] = UNSET,
+        reasoning: Optional[Any] = None,
+        safety_identifier: OptionalNullable[str] = UNSET,
+        service_tier: OptionalNullable[str] = UNSET,
+        store: OptionalNullable[bool] = UNSET,
+        stream: Optional[bool] = False,
+        stream_options: Optional[Any] = None,
+        temperature: OptionalNullable[float] = UNSET,
+        text: Optional[Any] = None,
+        tool_choice: OptionalNullable[
+            Union[
+                models.ResponsesRequestToolChoice,
+                models.ResponsesRequestToolChoiceTypedDict,
+            ]
+        ] = UNSET,
+        tools: OptionalNullable[List[Any]] = UNSET,
+        top_logprobs: OptionalNullable[int] = UNSET,
+        top_p: OptionalNullable[float] = UNSET,
+        truncation: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.Response:
+        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+
+        :param background:
+        :param conversation:
+        :param include:
+        :param input:
+        :param instructions:
+        :param max_output_tokens:
+        :param max_tool_calls:
+        :param metadata:
+        :param model:
+        :param parallel_tool_calls:
+        :param previous_response_id:
+        :param prompt:
+        :param prompt_cache_key:
+        :param reasoning:
+        :param safety_identifier:
+        :param service_tier:
+        :param store:
+        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
+        :param stream_options:
+        :param temperature:
+        :param text:
+        :param tool_choice:
+        :param tools:
+        :param top_logprobs:
+        :param top_p:
+        :param truncation:
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        request = models.ResponsesRequest(
+            background=background,
+            conversation=conversation,
+            include=include,
+            input=utils.get_pydantic_model(
+                input_, OptionalNullable[models.ResponsesRequestInput]
+            ),
+            instructions=instructions,
+            max_output_tokens=max_output_tokens,
+            max_tool_calls=max_tool_calls,
+            metadata=metadata,
+            model=model,
+            parallel_tool_calls=parallel_tool_calls,
+            previous_response_id=previous_response_id,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+            reasoning=reasoning,
+            safety_identifier=safety_identifier,
+            service_tier=service_tier,
+            store=store,
+            stream=stream,
+            stream_options=stream_options,
+            temperature=temperature,
+            text=text,
+            tool_choice=tool_choice,
+            tools=tools,
+            top_logprobs=top_logprobs,
+            top_p=top_p,
+            truncation=truncation,
+        )
+
+        return self._create_response(
+            request,
+            retries,
+            server_url,
+            timeout_ms,
+            http_headers,
+            lambda http_res: unmarshal_json_response(models.Response, http_res),
+        )
+
+    async def create_response_async(
+        self,
+        *,
+        background: OptionalNullable[bool] = UNSET,
+        conversation: OptionalNullable[
+            Union[
+                models.ResponsesRequestConversation,
+                models.ResponsesRequestConversationTypedDict,
+            ]
+        ] = UNSET,
+        include: OptionalNullable[List[Any]] = UNSET,
+        input_: OptionalNullable[
+            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
+        ] = UNSET,
+        instructions: OptionalNullable[str] = UNSET,
+        max_output_tokens: OptionalNullable[int] = UNSET,
+        max_tool_calls: OptionalNullable[int] = UNSET,
+        metadata: Optional[Any] = None,
+        model: OptionalNullable[str] = UNSET,
+        parallel_tool_calls: OptionalNullable[bool] = UNSET,
+        previous_response_id: OptionalNullable[str] = UNSET,
+        prompt: Optional[Any] = None,
+        prompt_cache_key: OptionalNullable[str] = UNSET,
+        reasoning: Optional[Any] = None,
+        safety_identifier: OptionalNullable[str] = UNSET,
+        service_tier: OptionalNullable[str] = UNSET,
+        store: OptionalNullable[bool] = UNSET,
+        stream: Optional[bool] = False,
+        stream_options: Optional[Any] = None,
+        temperature: OptionalNullable[float] = UNSET,
+        text: Optional[Any] = None,
+        tool_choice: OptionalNullable[
+            Union[
+                models.ResponsesRequestToolChoice,
+                models.ResponsesRequestToolChoiceTypedDict,
+            ]
+        ] = UNSET,
+        tools: OptionalNullable[List[Any]] = UNSET,
+        top_logprobs: OptionalNullable[int] = UNSET,
+        top_p: OptionalNullable[float] = UNSET,
+        truncation: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> models.Response:
+        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+
+        :param background:
+        :param conversation:
+        :param include:
+        :param input:
+        :param instructions:
+        :param max_output_tokens:
+        :param max_tool_calls:
+        :param metadata:
+        :param model:
+        :param parallel_tool_calls:
+        :param previous_response_id:
+        :param prompt:
+        :param prompt_cache_key:
+        :param reasoning:
+        :param safety_identifier:
+        :param service_tier:
+        :param store:
+        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
+        :param stream_options:
+        :param temperature:
+        :param text:
+        :param tool_choice:
+        :param tools:
+        :param top_logprobs:
+        :param top_p:
+        :param truncation:
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        request = models.ResponsesRequest(
+            background=background,
+            conversation=conversation,
+            include=include,
+            input=utils.get_pydantic_model(
+                input_, OptionalNullable[models.ResponsesRequestInput]
+            ),
+            instructions=instructions,
+            max_output_tokens=max_output_tokens,
+            max_tool_calls=max_tool_calls,
+            metadata=metadata,
+            model=model,
+            parallel_tool_calls=parallel_tool_calls,
+            previous_response_id=previous_response_id,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+            reasoning=reasoning,
+            safety_identifier=safety_identifier,
+            service_tier=service_tier,
+            store=store,
+            stream=stream,
+            stream_options=stream_options,
+            temperature=temperature,
+            text=text,
+            tool_choice=tool_choice,
+            tools=tools,
+            top_logprobs=top_logprobs,
+            top_p=top_p,
+            truncation=truncation,
+        )
+
+        return await self._create_response_async(
+            request,
+            retries,
+            server_url,
+            timeout_ms,
+            http_headers,
+            lambda http_res: unmarshal_json_response(models.Response, http_res),
+        )
+
+    def create_response_with_raw_response(
+        self,
+        *,
+        background: OptionalNullable[bool] = UNSET,
+        conversation: OptionalNullable[
+            Union[
+                models.ResponsesRequestConversation,
+                models.ResponsesRequestConversationTypedDict,
+            ]
+        ] = UNSET,
+        include: OptionalNullable[List[Any]] = UNSET,
+        input_: OptionalNullable[
+            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
+        ] = UNSET,
+        instructions: OptionalNullable[str] = UNSET,
+        max_output_tokens: OptionalNullable[int] = UNSET,
+        max_tool_calls: OptionalNullable[int] = UNSET,
+        metadata: Optional[Any] = None,
+        model: OptionalNullable[str] = UNSET,
+        parallel_tool_calls: OptionalNullable[bool] = UNSET,
+        previous_response_id: OptionalNullable[str] = UNSET,
+        prompt: Optional[Any] = None,
+        prompt_cache_key: OptionalNullable[str] = UNSET,
+        reasoning: Optional[Any] = None,
+        safety_identifier: OptionalNullable[str] = UNSET,
+        service_tier: OptionalNullable[str] = UNSET,
+        store: OptionalNullable[bool] = UNSET,
+        stream: Optional[bool] = False,
+        stream_options: Optional[Any] = None,
+        temperature: OptionalNullable[float] = UNSET,
+        text: Optional[Any] = None,
+        tool_choice: OptionalNullable[
+            Union[
+                models.ResponsesRequestToolChoice,
+                models.ResponsesRequestToolChoiceTypedDict,
+            ]
+        ] = UNSET,
+        tools: OptionalNullable[List[Any]] = UNSET,
+        top_logprobs: OptionalNullable[int] = UNSET,
+        top_p: OptionalNullable[float] = UNSET,
+        truncation: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> utils.RawResponse[models.Response]:
+        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+
+        Returns the undecoded response in a `utils.RawResponse`, whose `parse()` validates it into `models.Response` on first call.
+
+        :param background:
+        :param conversation:
+        :param include:
+        :param input:
+        :param instructions:
+        :param max_output_tokens:
+        :param max_tool_calls:
+        :param metadata:
+        :param model:
+        :param parallel_tool_calls:
+        :param previous_response_id:
+        :param prompt:
+        :param prompt_cache_key:
+        :param reasoning:
+        :param safety_identifier:
+        :param service_tier:
+        :param store:
+        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
+        :param stream_options:
+        :param temperature:
+        :param text:
+        :param tool_choice:
+        :param tools:
+        :param top_logprobs:
+        :param top_p:
+        :param truncation:
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        request = models.ResponsesRequest(
+            background=background,
+            conversation=conversation,
+            include=include,
+            input=utils.get_pydantic_model(
+                input_, OptionalNullable[models.ResponsesRequestInput]
+            ),
+            instructions=instructions,
+            max_output_tokens=max_output_tokens,
+            max_tool_calls=max_tool_calls,
+            metadata=metadata,
+            model=model,
+            parallel_tool_calls=parallel_tool_calls,
+            previous_response_id=previous_response_id,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+            reasoning=reasoning,
+            safety_identifier=safety_identifier,
+            service_tier=service_tier,
+            store=store,
+            stream=stream,
+            stream_options=stream_options,
+            temperature=temperature,
+            text=text,
+            tool_choice=tool_choice,
+            tools=tools,
+            top_logprobs=top_logprobs,
+            top_p=top_p,
+            truncation=truncation,
+        )
+
+        return self._create_response(
+            request,
+            retries,
+            server_url,
+            timeout_ms,
+            http_headers,
+            lambda http_res: utils.RawResponse(http_res, models.Response),
+        )
+
+    async def create_response_with_raw_response_async(
+        self,
+        *,
+        background: OptionalNullable[bool] = UNSET,
+        conversation: OptionalNullable[
+            Union[
+                models.ResponsesRequestConversation,
+                models.ResponsesRequestConversationTypedDict,
+            ]
+        ] = UNSET,
+        include: OptionalNullable[List[Any]] = UNSET,
+        input_: OptionalNullable[
+            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
+        ] = UNSET,
+        instructions: OptionalNullable[str] = UNSET,
+        max_output_tokens: OptionalNullable[int] = UNSET,
+        max_tool_calls: OptionalNullable[int] = UNSET,
+        metadata: Optional[Any] = None,
+        model: OptionalNullable[str] = UNSET,
+        parallel_tool_calls: OptionalNullable[bool] = UNSET,
+        previous_response_id: OptionalNullable[str] = UNSET,
+        prompt: Optional[Any] = None,
+        prompt_cache_key: OptionalNullable[str] = UNSET,
+        reasoning: Optional[Any] = None,
+        safety_identifier: OptionalNullable[str] = UNSET,
+        service_tier: OptionalNullable[str] = UNSET,
+        store: OptionalNullable[bool] = UNSET,
+        stream: Optional[bool] = False,
+        stream_options: Optional[Any] = None,
+        temperature: OptionalNullable[float] = UNSET,
+        text: Optional[Any] = None,
+        tool_choice: OptionalNullable[
+            Union[
+                models.ResponsesRequestToolChoice,
+                models.ResponsesRequestToolChoiceTypedDict,
+            ]
+        ] = UNSET,
+        tools: OptionalNullable[List[Any]] = UNSET,
+        top_logprobs: OptionalNullable[int] = UNSET,
+        top_p: OptionalNullable[float] = UNSET,
+        truncation: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+    ) -> utils.RawResponse[models.Response]:
+        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+
+        Returns the undecoded response in a `utils.RawResponse`, whose `parse()` validates it into `models.Response` on first call.
+
+        :param background:
+        :param conversation:
+        :param include:
+        :param input:
+        :param instructions:
+        :param max_output_tokens:
+        :param max_tool_calls:
+        :param metadata:
+        :param model:
+        :param parallel_tool_calls:
+        :param previous_response_id:
+        :param prompt:
+        :param prompt_cache_key:
+        :param reasoning:
+        :param safety_identifier:
+        :param service_tier:
+        :param store:
+        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
+        :param stream_options:
+        :param temperature:
+        :param text:
+        :param tool_choice:
+        :param tools:
+        :param top_logprobs:
+        :param top_p:
+        :param truncation:
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        """
+        request = models.ResponsesRequest(
+            background=background,
+            conversation=conversation,
+            include=include,
+            input=utils.get_pydantic_model(
+                input_, OptionalNullable[models.ResponsesRequestInput]
+            ),
+            instructions=instructions,
+            max_output_tokens=max_output_tokens,
+            max_tool_calls=max_tool_calls,
+            metadata=metadata,
+            model=model,
+            parallel_tool_calls=parallel_tool_calls,
+            previous_response_id=previous_response_id,
+            prompt=prompt,
+            prompt_cache_key=prompt_cache_key,
+            reasoning=reasoning,
+            safety_identifier=safety_identifier,
+            service_tier=service_tier,
+            store=store,
+            stream=stream,
+            stream_options=stream_options,
+            temperature=temperature,
+            text=text,
+            tool_choice=tool_choice,
+            tools=tools,
+            top_logprobs=top_logprobs,
+            top_p=top_p,
+            truncation=truncation,
+        )
+
+        return await self._create_response_async(
+            request,
+            retries,
+            server_url,
+            timeout_ms,
+            http_headers,
+            lambda http_res: utils.RawResponse(http_res, models.Response),
+        )
+
+    def _create_response(
+        self,
+        request: models.ResponsesRequest,
+        retries: OptionalNullable[utils.RetryConfig],
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+        handle_success: Callable[[httpx.Response], T],
+    ) -> T:
+        r"""Sends the request and maps error responses. A 200 response is passed to `handle_success`."""
+        base_url = None
+        url_variables = None
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+
+        if server_url is not None:
+            base_url = server_url
+        else:
+            base_url = self._get_url(base_url, url_variables)
+
+        req = self._build_request(
+            method="POST",
+            path="/v1/responses",
+            base_url=base_url,
+            url_variables=url_variables,
+            request=request,
+            request_body_required=True,
+            request_has_path_params=False,
+            request_has_query_params=True,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.ResponsesRequest
+            ),
+            timeout_ms=timeout_ms,
+        )
+
+        if retries == UNSET:
+            if self.sdk_configuration.retry_config is not UNSET:
+                retries = self.sdk_configuration.retry_config
+
+        retry_config = None
+        if isinstance(retries, utils.RetryConfig):
+            retry_config = (retries, ["429", "500", "502", "503", "504"])
+
+        http_res = self.do_request(
+            hook_ctx=HookContext(
+                config=self.sdk_configuration,
+                base_url=base_url or "",
+                operation_id="createResponse",
+                oauth2_scopes=None,
+                security_source=get_security_from_env(
+                    self.sdk_configuration.security, models.Security
+                ),
+            ),
+            request=req,
+            error_status_codes=["400", "401", "4XX", "500", "502", "5XX"],
+            retry_config=retry_config,
+        )
+
+        response_data: Any = None
+        if utils.match_response(http_res, "200", "application/json"):
+            return handle_success(http_res)
+        if utils.match_response(http_res, ["400", "401"], "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
+            raise errors.ErrorResponse(response_data, http_res)
+        if utils.match_response(http_res, ["500", "502"], "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
+            raise errors.ErrorResponse(response_data, http_res)
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = utils.stream_to_text(http_res)
+            raise errors.SudoDefaultError("API error occurred", http_res, http_res_text)
+        if utils.match_response(http_res, "5XX", "*"):
+            http_res_text = utils.stream_to_text(http_res)
+            raise errors.SudoDefaultError("API error occurred", http_res, http_res_text)
+
+        raise errors.SudoDefaultError("Unexpected response received", http_res)
+
+    async def _create_response_async(
+        self,
+        request: models.ResponsesRequest,
+        retries: OptionalNullable[utils.RetryConfig],
+        server_url: Optional[str],
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+        handle_success: Callable[[httpx.Response], T],
+    ) -> T:
+        r"""Sends the request and maps error responses. A 200 response is passed to `handle_success`."""
+        base_url = None
+        url_variables = None
+        if timeout_ms is None:
+            timeout_ms = self.sdk_configuration.timeout_ms
+
+        if server_url is not None:
+            base_url = server_url
+        else:
+            base_url = self._get_url(base_url, url_variables)
+
+        req = self._build_request_async(
+            method="POST",
+            path="/v1/responses",
+            base_url=base_url,
+            url_variables=url_variables,
+            request=request,
+            request_body_required=True,
+            request_has_path_params=False,
+            request_has_query_params=True,
+            user_agent_header="user-agent",
+            accept_header_value="application/json",
+            http_headers=http_headers,
+            security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.ResponsesRequest
+            ),
+            timeout_ms=timeout_ms,
+        )
+
+        if retries == UNSET:
+            if self.sdk_configuration.retry_config is not UNSET:
+                retries = self.sdk_configuration.retry_config
+
+        retry_config = None
+        if isinstance(retries, utils.RetryConfig):
+            retry_config = (retries, ["429", "500", "502", "503", "504"])
+
+        http_res = await self.do_request_async(
+            hook_ctx=HookContext(
+                config=self.sdk_configuration,
+                base_url=base_url or "",
+                operation_id="createResponse",
+                oauth2_scopes=None,
+                security_source=get_security_from_env(
+                    self.sdk_configuration.security, models.Security
+                ),
+            ),
+            request=req,
+            error_status_codes=["400", "401", "4XX", "500", "502", "5XX"],
+            retry_config=retry_config,
+        )
+
+        response_data: Any = None
+        if utils.match_response(http_res, "200", "application/json"):
+            return handle_success(http_res)
+        if utils.match_response(http_res, ["400", "401"], "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
+            raise errors.ErrorResponse(response_data, http_res)
+        if utils.match_response(http_res, ["500", "502"], "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
+            raise errors.ErrorResponse(response_data, http_res)
+        if utils.match_response(http_res, "4XX", "*"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            raise errors.SudoDefaultError("API error occurred", http_res, http_res_text)
+        if utils.match_response(http_res, "5XX", "*"):
+            http_res_text = await utils.stream_to_text_async(http_res)
+            raise errors.SudoDefaultError("API error occurred", http_res, http_res_text)
+
+        raise errors.SudoDefaultError("Unexpected response received", http_res)
+
+    def create_response_raw(
+        self,
+        *,
+        body: Union[bytes, Mapping[str, Any]],
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
     ) -> models.Response:
-        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+        r"""Create a model response from a pre-encoded request body.
 
-        :param background:
-        :param conversation:
-        :param include:
-        :param input:
-        :param instructions:
-        :param max_output_tokens:
-        :param max_tool_calls:
-        :param metadata:
-        :param model:
-        :param parallel_tool_calls:
-        :param previous_response_id:
-        :param prompt:
-        :param prompt_cache_key:
-        :param reasoning:
-        :param safety_identifier:
-        :param service_tier:
-        :param store:
-        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
-        :param stream_options:
-        :param temperature:
-        :param text:
-        :param tool_choice:
-        :param tools:
-        :param top_logprobs:
-        :param top_p:
-        :param truncation:
+        Sends `body` as the JSON request body without building or validating `models.ResponsesRequest`, for callers that already hold the request JSON. Hooks, retries, security and error mapping apply as for the typed method. The body must not set `stream`.
+
+        :param body: The request body as encoded JSON bytes, or a dict that is encoded as is
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -99,53 +682,20 @@ class Responses(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ResponsesRequest(
-            background=background,
-            conversation=conversation,
-            include=include,
-            input=utils.get_pydantic_model(
-                input_, OptionalNullable[models.ResponsesRequestInput]
-            ),
-            instructions=instructions,
-            max_output_tokens=max_output_tokens,
-            max_tool_calls=max_tool_calls,
-            metadata=metadata,
-            model=model,
-            parallel_tool_calls=parallel_tool_calls,
-            previous_response_id=previous_response_id,
-            prompt=prompt,
-            prompt_cache_key=prompt_cache_key,
-            reasoning=reasoning,
-            safety_identifier=safety_identifier,
-            service_tier=service_tier,
-            store=store,
-            stream=stream,
-            stream_options=stream_options,
-            temperature=temperature,
-            text=text,
-            tool_choice=tool_choice,
-            tools=tools,
-            top_logprobs=top_logprobs,
-            top_p=top_p,
-            truncation=truncation,
-        )
-
         req = self._build_request(
             method="POST",
             path="/v1/responses",
             base_url=base_url,
             url_variables=url_variables,
-            request=request,
+            request=None,
             request_body_required=True,
             request_has_path_params=False,
-            request_has_query_params=True,
+            request_has_query_params=False,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.ResponsesRequest
-            ),
+            get_serialized_body=lambda: utils.serialize_raw_request_body(body),
             timeout_ms=timeout_ms,
         )
 
@@ -190,80 +740,20 @@ class Responses(BaseSDK):
 
         raise errors.SudoDefaultError("Unexpected response received", http_res)
 
-    async def create_response_async(
+    async def create_response_raw_async(
         self,
         *,
-        background: OptionalNullable[bool] = UNSET,
-        conversation: OptionalNullable[
-            Union[
-                models.ResponsesRequestConversation,
-                models.ResponsesRequestConversationTypedDict,
-            ]
-        ] = UNSET,
-        include: OptionalNullable[List[Any]] = UNSET,
-        input_: OptionalNullable[
-            Union[models.ResponsesRequestInput, models.ResponsesRequestInputTypedDict]
-        ] = UNSET,
-        instructions: OptionalNullable[str] = UNSET,
-        max_output_tokens: OptionalNullable[int] = UNSET,
-        max_tool_calls: OptionalNullable[int] = UNSET,
-        metadata: Optional[Any] = None,
-        model: OptionalNullable[str] = UNSET,
-        parallel_tool_calls: OptionalNullable[bool] = UNSET,
-        previous_response_id: OptionalNullable[str] = UNSET,
-        prompt: Optional[Any] = None,
-        prompt_cache_key: OptionalNullable[str] = UNSET,
-        reasoning: Optional[Any] = None,
-        safety_identifier: OptionalNullable[str] = UNSET,
-        service_tier: OptionalNullable[str] = UNSET,
-        store: OptionalNullable[bool] = UNSET,
-        stream: Optional[bool] = False,
-        stream_options: Optional[Any] = None,
-        temperature: OptionalNullable[float] = UNSET,
-        text: Optional[Any] = None,
-        tool_choice: OptionalNullable[
-            Union[
-                models.ResponsesRequestToolChoice,
-                models.ResponsesRequestToolChoiceTypedDict,
-            ]
-        ] = UNSET,
-        tools: OptionalNullable[List[Any]] = UNSET,
-        top_logprobs: OptionalNullable[int] = UNSET,
-        top_p: OptionalNullable[float] = UNSET,
-        truncation: OptionalNullable[str] = UNSET,
+        body: Union[bytes, Mapping[str, Any]],
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
     ) -> models.Response:
-        r"""*[OpenAI Only]* Responses API: Create a model response for the given input
+        r"""Create a model response from a pre-encoded request body.
 
-        :param background:
-        :param conversation:
-        :param include:
-        :param input:
-        :param instructions:
-        :param max_output_tokens:
-        :param max_tool_calls:
-        :param metadata:
-        :param model:
-        :param parallel_tool_calls:
-        :param previous_response_id:
-        :param prompt:
-        :param prompt_cache_key:
-        :param reasoning:
-        :param safety_identifier:
-        :param service_tier:
-        :param store:
-        :param stream: If set, partial message deltas and streaming events will be sent. For regular HTTP responses, this must be false.
-        :param stream_options:
-        :param temperature:
-        :param text:
-        :param tool_choice:
-        :param tools:
-        :param top_logprobs:
-        :param top_p:
-        :param truncation:
+        Sends `body` as the JSON request body without building or validating `models.ResponsesRequest`, for callers that already hold the request JSON. Hooks, retries, security and error mapping apply as for the typed method. The body must not set `stream`.
+
+        :param body: The request body as encoded JSON bytes, or a dict that is encoded as is
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -279,53 +769,20 @@ class Responses(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ResponsesRequest(
-            background=background,
-            conversation=conversation,
-            include=include,
-            input=utils.get_pydantic_model(
-                input_, OptionalNullable[models.ResponsesRequestInput]
-            ),
-            instructions=instructions,
-            max_output_tokens=max_output_tokens,
-            max_tool_calls=max_tool_calls,
-            metadata=metadata,
-            model=model,
-            parallel_tool_calls=parallel_tool_calls,
-            previous_response_id=previous_response_id,
-            prompt=prompt,
-            prompt_cache_key=prompt_cache_key,
-            reasoning=reasoning,
-            safety_identifier=safety_identifier,
-            service_tier=service_tier,
-            store=store,
-            stream=stream,
-            stream_options=stream_options,
-            temperature=temperature,
-            text=text,
-            tool_choice=tool_choice,
-            tools=tools,
-            top_logprobs=top_logprobs,
-            top_p=top_p,
-            truncation=truncation,
-        )
-
         req = self._build_request_async(
             method="POST",
             path="/v1/responses",
             base_url=base_url,
             url_variables=url_variables,
-            request=request,
+            request=None,
             request_body_required=True,
             request_has_path_params=False,
-            request_has_query_params=True,
+            request_has_query_params=False,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.ResponsesRequest
-            ),
+            get_serialized_body=lambda: utils.serialize_raw_request_body(body),
             timeout_ms=timeout_ms,
         )
 
@@ -415,6 +872,8 @@ class Responses(BaseSDK):
         top_p: OptionalNullable[float] = UNSET,
         truncation: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        resume: Optional[utils.ResumeConfig] = None,
+        stop_condition: Optional[utils.StopCondition] = None,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
@@ -448,6 +907,8 @@ class Responses(BaseSDK):
         :param top_p:
         :param truncation:
         :param retries: Override the default retry configuration for this method
+        :param resume: Reconnect and continue the stream when the connection drops
+        :param stop_condition: End the stream early and close the connection when a condition is met
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
@@ -520,16 +981,20 @@ class Responses(BaseSDK):
         if isinstance(retries, utils.RetryConfig):
             retry_config = (retries, ["429", "500", "502", "503", "504"])
 
-        http_res = self.do_request(
-            hook_ctx=HookContext(
-                config=self.sdk_configuration,
-                base_url=base_url or "",
-                operation_id="createStreamingResponse",
-                oauth2_scopes=None,
-                security_source=get_security_from_env(
-                    self.sdk_configuration.security, models.Security
-                ),
+        hook_ctx = HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="createStreamingResponse",
+            oauth2_scopes=None,
+            security_source=get_security_from_env(
+                self.sdk_configuration.security, models.Security
             ),
+        )
+
+        metrics = self._stream_metrics("createStreamingResponse")
+
+        http_res = self.do_request(
+            hook_ctx=hook_ctx,
             request=req,
             error_status_codes=["400", "401", "4XX", "500", "502", "5XX"],
             stream=True,
@@ -540,9 +1005,19 @@ class Responses(BaseSDK):
         if utils.match_response(http_res, "200", "text/event-stream"):
             return eventstreaming.EventStream(
                 http_res,
-                lambda raw: utils.unmarshal_json(raw, models.ResponseEvent),
+                lambda event: utils.unmarshal_event(event, models.ResponseEvent),
                 sentinel="[DONE]",
                 client_ref=self,
+                resume=resume,
+                reconnect=self._stream_reconnector(
+                    hook_ctx,
+                    req,
+                    ["400", "401", "4XX", "500", "502", "5XX"],
+                    retry_config,
+                ),
+                position=eventstreaming.sequence_number,
+                metrics=metrics,
+                stop_condition=stop_condition,
             )
         if utils.match_response(http_res, ["400", "401"], "application/json"):
             http_res_text = utils.stream_to_text(http_res)
@@ -613,6 +1088,8 @@ class Responses(BaseSDK):
         top_p: OptionalNullable[float] = UNSET,
         truncation: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        resume: Optional[utils.ResumeConfig] = None,
+        stop_condition: Optional[utils.StopCondition] = None,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
@@ -646,6 +1123,8 @@ class Responses(BaseSDK):
         :param top_p:
         :param truncation:
         :param retries: Override the default retry configuration for this method
+        :param resume: Reconnect and continue the stream when the connection drops
+        :param stop_condition: End the stream early and close the connection when a condition is met
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
@@ -718,16 +1197,20 @@ class Responses(BaseSDK):
         if isinstance(retries, utils.RetryConfig):
             retry_config = (retries, ["429", "500", "502", "503", "504"])
 
-        http_res = await self.do_request_async(
-            hook_ctx=HookContext(
-                config=self.sdk_configuration,
-                base_url=base_url or "",
-                operation_id="createStreamingResponse",
-                oauth2_scopes=None,
-                security_source=get_security_from_env(
-                    self.sdk_configuration.security, models.Security
-                ),
+        hook_ctx = HookContext(
+            config=self.sdk_configuration,
+            base_url=base_url or "",
+            operation_id="createStreamingResponse",
+            oauth2_scopes=None,
+            security_source=get_security_from_env(
+                self.sdk_configuration.security, models.Security
             ),
+        )
+
+        metrics = self._stream_metrics("createStreamingResponse")
+
+        http_res = await self.do_request_async(
+            hook_ctx=hook_ctx,
             request=req,
             error_status_codes=["400", "401", "4XX", "500", "502", "5XX"],
             stream=True,
@@ -738,9 +1221,19 @@ class Responses(BaseSDK):
         if utils.match_response(http_res, "200", "text/event-stream"):
             return eventstreaming.EventStreamAsync(
                 http_res,
-                lambda raw: utils.unmarshal_json(raw, models.ResponseEvent),
+                lambda event: utils.unmarshal_event(event, models.ResponseEvent),
                 sentinel="[DONE]",
                 client_ref=self,
+                resume=resume,
+                reconnect=self._stream_reconnector_async(
+                    hook_ctx,
+                    req,
+                    ["400", "401", "4XX", "500", "502", "5XX"],
+                    retry_config,
+                ),
+                position=eventstreaming.sequence_number,
+                metrics=metrics,
+                stop_condition=stop_condition,
             )
         if utils.match_response(http_res, ["400", "401"], "application/json"):
             http_res_text = await utils.stream_to_text_async(http_res)
@@ -3,15 +3,20 @@
 from .basesdk import BaseSDK
 from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
 from .sdkconfiguration import SDKConfiguration
+from .utils.credentials import CredentialProvider
 from .utils.logger import Logger, get_default_logger
+from .utils.metrics import MetricsSink
 from .utils.retries import RetryConfig
+from .utils.tracing import TraceConfig
+from .utils.transport import TransportConfig
+from functools import partial
 import httpx
 import importlib
 from sudo_ai import models
 from sudo_ai._hooks import SDKHooks
 from sudo_ai.types import OptionalNullable, UNSET
 import sys
-from typing import Any, Callable, Optional, TYPE_CHECKING, Union, cast
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union, cast
 import weakref
 
 if TYPE_CHECKING:
@@ -39,6 +44,10 @@ class Sudo(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        api_key_ttl_ms: int = 0,
+        trace_config: Optional[TraceConfig] = None,
+        transport_config: Optional[TransportConfig] = None,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -50,32 +59,52 @@ class Sudo(BaseSDK):
         :param async_client: The Async HTTP client to use for all asynchronous methods
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
+        :param metrics_sink: Receives the timing metrics of every event stream once it ends
+        :param api_key_ttl_ms: How long the headers resolved from a callable api_key are reused, in milliseconds. The default of 0 calls it for every request
+        :param trace_config: Publishes a structured trace of every operation call to a sink
+        :param transport_config: Connection pool, HTTP/2 and timeout settings for the HTTP clients
         """
+        # Only built when a default client will be created from them.
+        client_options: Dict[str, Any] = {}
+        if transport_config is not None and (client is None or async_client is None):
+            client_options = transport_config.get_client_options()
+
+        # Clients that are not supplied are created on first use, as most
+        # programs only make sync or only make async calls.
         client_supplied = True
+        client_factory = None
         if client is None:
-            client = httpx.Client(follow_redirects=True)
+            client_factory = partial(
+                httpx.Client, follow_redirects=True, **client_options
+            )
             client_supplied = False
-
-        assert issubclass(
-            type(client), HttpClient
-        ), "The provided client must implement the HttpClient protocol."
+        else:
+            assert issubclass(
+                type(client), HttpClient
+            ), "The provided client must implement the HttpClient protocol."
 
         async_client_supplied = True
+        async_client_factory = None
         if async_client is None:
-            async_client = httpx.AsyncClient(follow_redirects=True)
+            async_client_factory = partial(
+                httpx.AsyncClient, follow_redirects=True, **client_options
+            )
             async_client_supplied = False
+        else:
+            assert issubclass(
+                type(async_client), AsyncHttpClient
+            ), "The provided async_client must implement the AsyncHttpClient protocol."
 
         if debug_logger is None:
             debug_logger = get_default_logger()
 
-        assert issubclass(
-            type(async_client), AsyncHttpClient
-        ), "The provided async_client must implement the AsyncHttpClient protocol."
-
         security: Any = None
         if callable(api_key):
-            # pylint: disable=unnecessary-lambda-assignment
-            security = lambda: models.Security(api_key=api_key())
+            security = CredentialProvider(
+                lambda: models.Security(api_key=api_key()),
+                models.Security,
+                api_key_ttl_ms,
+            )
         else:
             security = models.Security(api_key=api_key)
 
@@ -91,6 +120,11 @@ class Sudo(BaseSDK):
                 retry_config=retry_config,
                 timeout_ms=timeout_ms,
                 debug_logger=debug_logger,
+                metrics_sink=metrics_sink,
+                trace_config=trace_config,
+                transport_config=transport_config,
+                client_factory=client_factory,
+                async_client_factory=async_client_factory,
             ),
             parent_ref=self,
         )
@@ -100,6 +134,11 @@ class Sudo(BaseSDK):
         # pylint: disable=protected-access
         self.sdk_configuration.__dict__["_hooks"] = hooks
 
+        # SDK init hooks may read or wrap the clients, so they get built ones.
+        if hooks.sdk_init_hooks:
+            self.sdk_configuration.get_client()
+            self.sdk_configuration.get_async_client()
+
         self.sdk_configuration = hooks.sdk_init(self.sdk_configuration)
 
         weakref.finalize(
@@ -157,12 +196,15 @@ class Sudo(BaseSDK):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Only the sync side is closed. Async calls keep working and still
+        # create the async client on first use, until `async with` exits.
         if (
             self.sdk_configuration.client is not None
             and not self.sdk_configuration.client_supplied
         ):
             self.sdk_configuration.client.close()
         self.sdk_configuration.client = None
+        self.sdk_configuration.client_factory = None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if (
@@ -171,3 +213,4 @@ class Sudo(BaseSDK):
         ):
             await self.sdk_configuration.async_client.aclose()
         self.sdk_configuration.async_client = None
+        self.sdk_configuration.async_client_factory = None
@@ -7,11 +7,19 @@ from ._version import (
     __version__,
 )
 from .httpclient import AsyncHttpClient, HttpClient
-from .utils import Logger, RetryConfig, remove_suffix
-from dataclasses import dataclass
+from .utils import (
+    Logger,
+    MetricsSink,
+    RetryConfig,
+    TraceConfig,
+    TransportConfig,
+    remove_suffix,
+)
+from dataclasses import dataclass, field
 from pydantic import Field
 from sudo_ai import models
 from sudo_ai.types import OptionalNullable, UNSET
+import threading
 from typing import Callable, Dict, Optional, Tuple, Union
 
 
@@ -31,6 +39,40 @@ class SDKConfiguration:
     user_agent: str = __user_agent__
     retry_config: OptionalNullable[RetryConfig] = Field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = None
+    metrics_sink: Optional[MetricsSink] = None
+    trace_config: Optional[TraceConfig] = None
+    transport_config: Optional[TransportConfig] = None
+    client_factory: Optional[Callable[[], HttpClient]] = None
+    async_client_factory: Optional[Callable[[], AsyncHttpClient]] = None
+    _client_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
 
     def get_server_details(self) -> Tuple[str, Dict[str, str]]:
         return remove_suffix(self.server_url, "/"), {}
+
+    def get_client(self) -> Union[HttpClient, None]:
+        r"""The sync client, created by `client_factory` on first use."""
+        client = self.client
+        if client is None and self.client_factory is not None:
+            with self._client_lock:
+                if self.client is None and self.client_factory is not None:
+                    self.client = self.client_factory()
+                    self.client_factory = None
+                client = self.client
+        return client
+
+    def get_async_client(self) -> Union[AsyncHttpClient, None]:
+        r"""The async client, created by `async_client_factory` on first use.
+
+        Creating an `httpx.AsyncClient` does not await or bind it to an event
+        loop, so the thread lock also serializes callers on different loops.
+        """
+        async_client = self.async_client
+        if async_client is None and self.async_client_factory is not None:
+            with self._client_lock:
+                if self.async_client is None and self.async_client_factory is not None:
+                    self.async_client = self.async_client_factory()
+                    self.async_client_factory = None
+                async_client = self.async_client
+        return async_client
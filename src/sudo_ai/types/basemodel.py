@@ -1,8 +1,18 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+from copy import copy
 from pydantic import ConfigDict, model_serializer
 from pydantic import BaseModel as PydanticBaseModel
-from typing import TYPE_CHECKING, Literal, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from typing_extensions import TypeAliasType, TypeAlias
 
 
@@ -20,6 +30,11 @@ class Unset(BaseModel):
     def __bool__(self) -> Literal[False]:
         return False
 
+    def __hash__(self) -> int:
+        # Unhashable defaults are deep-copied by pydantic on every validation.
+        # All instances are equal, so hashing makes UNSET a shared default.
+        return hash(Unset)
+
 
 UNSET = Unset()
 UNSET_SENTINEL = "~?~unset~?~sentinel~?~"
@@ -35,5 +50,82 @@ else:
         "OptionalNullable", Union[Optional[Nullable[T]], Unset], type_params=(T,)
     )
 
+
+def unset_aware_serializer(
+    optional_fields: Iterable[str] = (),
+    nullable_fields: Iterable[str] = (),
+    null_default_fields: Iterable[str] = (),
+):
+    r"""Builds the wrap serializer that drops UNSET fields from a model dump.
+
+    A None value is kept for required fields, for fields listed in
+    `null_default_fields`, and for nullable fields that were explicitly set.
+    UNSET values are always dropped. The rules are resolved once per class
+    into a plan, and dumps that hold no None values are returned as they are.
+    """
+    optional = frozenset(optional_fields)
+    nullable = frozenset(nullable_fields)
+    null_default = frozenset(null_default_fields)
+    plans: Dict[type, Tuple[Tuple[str, str, Optional[bool]], ...]] = {}
+
+    def build_plan(cls):
+        fields = []
+        for n, f in cls.model_fields.items():
+            k = f.alias or n
+            if k not in optional or k in null_default:
+                keep_none = True
+            elif k in nullable:
+                keep_none = None  # only when explicitly set
+            else:
+                keep_none = False
+            fields.append((n, k, keep_none))
+        return tuple(fields)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        cls = type(self)
+        fields = plans.get(cls)
+        if fields is None:
+            fields = plans[cls] = build_plan(cls)
+
+        # Serializing UNSET through its union costs far more than the field
+        # itself, so UNSET fields are set to None before the handler runs.
+        # They are not deleted: a model with missing fields no longer matches
+        # its type when it is serialized as a member of a union.
+        unset = {n for n, v in self.__dict__.items() if v is UNSET}
+        if unset:
+            target = copy(self)
+            for n in unset:
+                target.__dict__[n] = None
+            serialized = handler(target)
+        else:
+            serialized = handler(self)
+
+        values = serialized.values()
+        if (
+            not unset
+            and len(serialized) == len(fields)
+            and None not in values
+            and UNSET_SENTINEL not in values
+        ):
+            return serialized
+
+        fields_set = self.__pydantic_fields_set__
+        m = {}
+        for n, k, keep_none in fields:
+            if n in unset:
+                continue
+            val = serialized.get(k)
+            if val is None:
+                if keep_none or (keep_none is None and n in fields_set):
+                    m[k] = val
+            elif val != UNSET_SENTINEL:
+                m[k] = val
+
+        return m
+
+    return serialize_model
+
+
 UnrecognizedInt: TypeAlias = int
 UnrecognizedStr: TypeAlias = str
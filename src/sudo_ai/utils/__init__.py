@@ -6,9 +6,12 @@ import builtins
 import sys
 
 if TYPE_CHECKING:
-    from .annotations import get_discriminator
+    from .accumulators import ChatCompletionAccumulator, ResponseAccumulator
+    from .annotations import get_discriminator, get_tag
+    from .credentials import CredentialProvider
     from .datetimes import parse_datetime
     from .enums import OpenEnumMeta
+    from .eventstreaming import ResumeConfig, StopCondition, StopReport
     from .headers import get_headers, get_response_headers
     from .metadata import (
         FieldMetadata,
@@ -21,16 +24,26 @@ if TYPE_CHECKING:
         RequestMetadata,
         SecurityMetadata,
     )
+    from .projection import JsonPath, Projection
     from .queryparams import get_query_params
+    from .raw_response import RawResponse
     from .retries import BackoffStrategy, Retries, retry, retry_async, RetryConfig
-    from .requestbodies import serialize_request_body, SerializedRequestBody
+    from .requestbodies import (
+        serialize_raw_request_body,
+        serialize_request_body,
+        SerializedRequestBody,
+    )
+    from .requestplans import get_request_plan, RequestPlan
     from .security import get_security, get_security_from_env
 
     from .serializers import (
         get_pydantic_model,
+        get_type_adapter,
         marshal_json,
+        marshal_json_bytes,
         unmarshal,
         unmarshal_json,
+        unmarshal_event,
         serialize_decimal,
         serialize_float,
         serialize_int,
@@ -52,47 +65,79 @@ if TYPE_CHECKING:
         match_response,
         cast_partial,
     )
-    from .logger import Logger, get_body_content, get_default_logger
+    from .logger import Logger, get_body_content, get_default_logger, is_debug_enabled
+    from .metrics import MetricsSink, StreamMetrics
+    from .multiplexer import EventStreamMultiplexer
+    from .sinks import Sink
+    from .tee import TeeStream, TeeStreamAsync
+    from .tracing import RequestTrace, TraceConfig, TraceSink
+    from .transport import TransportConfig
 
 __all__ = [
     "BackoffStrategy",
+    "CredentialProvider",
+    "ChatCompletionAccumulator",
+    "EventStreamMultiplexer",
     "FieldMetadata",
     "find_metadata",
     "FormMetadata",
     "generate_url",
     "get_body_content",
     "get_default_logger",
+    "is_debug_enabled",
     "get_discriminator",
+    "get_tag",
     "parse_datetime",
     "get_global_from_env",
     "get_headers",
     "get_pydantic_model",
+    "get_type_adapter",
     "get_query_params",
+    "get_request_plan",
     "get_response_headers",
     "get_security",
     "get_security_from_env",
     "HeaderMetadata",
+    "JsonPath",
     "Logger",
+    "MetricsSink",
     "marshal_json",
+    "marshal_json_bytes",
     "match_content_type",
     "match_status_codes",
     "match_response",
     "MultipartFormMetadata",
     "OpenEnumMeta",
     "PathParamMetadata",
+    "Projection",
     "QueryParamMetadata",
+    "RawResponse",
     "remove_suffix",
+    "RequestPlan",
+    "RequestTrace",
     "Retries",
     "retry",
     "retry_async",
     "RetryConfig",
+    "ResumeConfig",
+    "StopCondition",
+    "StopReport",
     "RequestMetadata",
+    "ResponseAccumulator",
     "SecurityMetadata",
     "serialize_decimal",
     "serialize_float",
     "serialize_int",
+    "serialize_raw_request_body",
     "serialize_request_body",
     "SerializedRequestBody",
+    "Sink",
+    "StreamMetrics",
+    "TeeStream",
+    "TeeStreamAsync",
+    "TraceConfig",
+    "TraceSink",
+    "TransportConfig",
     "stream_to_text",
     "stream_to_text_async",
     "stream_to_bytes",
@@ -100,6 +145,7 @@ __all__ = [
     "template_url",
     "unmarshal",
     "unmarshal_json",
+    "unmarshal_event",
     "validate_decimal",
     "validate_const",
     "validate_float",
@@ -110,50 +156,77 @@ __all__ = [
 
 _dynamic_imports: dict[str, str] = {
     "BackoffStrategy": ".retries",
+    "CredentialProvider": ".credentials",
+    "ChatCompletionAccumulator": ".accumulators",
+    "EventStreamMultiplexer": ".multiplexer",
     "FieldMetadata": ".metadata",
     "find_metadata": ".metadata",
     "FormMetadata": ".metadata",
     "generate_url": ".url",
     "get_body_content": ".logger",
     "get_default_logger": ".logger",
+    "is_debug_enabled": ".logger",
     "get_discriminator": ".annotations",
+    "get_tag": ".annotations",
     "parse_datetime": ".datetimes",
     "get_global_from_env": ".values",
     "get_headers": ".headers",
     "get_pydantic_model": ".serializers",
+    "get_type_adapter": ".serializers",
     "get_query_params": ".queryparams",
     "get_response_headers": ".headers",
     "get_security": ".security",
     "get_security_from_env": ".security",
     "HeaderMetadata": ".metadata",
+    "JsonPath": ".projection",
     "Logger": ".logger",
     "marshal_json": ".serializers",
+    "marshal_json_bytes": ".serializers",
     "match_content_type": ".values",
     "match_status_codes": ".values",
     "match_response": ".values",
+    "MetricsSink": ".metrics",
     "MultipartFormMetadata": ".metadata",
     "OpenEnumMeta": ".enums",
     "PathParamMetadata": ".metadata",
+    "Projection": ".projection",
     "QueryParamMetadata": ".metadata",
+    "RawResponse": ".raw_response",
     "remove_suffix": ".url",
     "Retries": ".retries",
     "retry": ".retries",
     "retry_async": ".retries",
     "RetryConfig": ".retries",
     "RequestMetadata": ".metadata",
+    "RequestPlan": ".requestplans",
+    "RequestTrace": ".tracing",
+    "ResponseAccumulator": ".accumulators",
+    "ResumeConfig": ".eventstreaming",
+    "StopCondition": ".eventstreaming",
+    "StopReport": ".eventstreaming",
     "SecurityMetadata": ".metadata",
     "serialize_decimal": ".serializers",
     "serialize_float": ".serializers",
     "serialize_int": ".serializers",
+    "serialize_raw_request_body": ".requestbodies",
     "serialize_request_body": ".requestbodies",
+    "get_request_plan": ".requestplans",
     "SerializedRequestBody": ".requestbodies",
+    "Sink": ".sinks",
     "stream_to_text": ".serializers",
     "stream_to_text_async": ".serializers",
     "stream_to_bytes": ".serializers",
     "stream_to_bytes_async": ".serializers",
+    "StreamMetrics": ".metrics",
+    "TeeStream": ".tee",
+    "TeeStreamAsync": ".tee",
+    "TraceConfig": ".tracing",
+    "TraceSink": ".tracing",
+    "TransportConfig": ".transport",
     "template_url": ".url",
     "unmarshal": ".serializers",
     "unmarshal_json": ".serializers",
+    "unmarshal_event": ".serializers",
     "validate_decimal": ".serializers",
     "validate_const": ".serializers",
     "validate_float": ".serializers",
@@ -184,7 +257,10 @@ def __getattr__(attr_name: str) -> object:
 
     try:
         module = dynamic_import(module_name)
-        return getattr(module, attr_name)
+        result = getattr(module, attr_name)
+        # Bind the name so later lookups skip __getattr__.
+        globals()[attr_name] = result
+        return result
     except ImportError as e:
         raise ImportError(
             f"Failed to import {attr_name} from {module_name}: {e}"
@@ -0,0 +1,468 @@
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sudo_ai import models
+from ..types.basemodel import Unset
+
+from .eventstreaming import RawEvent
+
+T = TypeVar("T")
+
+
+def _field(obj: Any, name: str) -> Any:
+    r"""Reads `name` from a model or a parsed JSON object, mapping UNSET to None."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    value = getattr(obj, name, None)
+    return None if isinstance(value, Unset) else value
+
+
+def _event_data(event: Any) -> Any:
+    if isinstance(event, (RawEvent, models.ChatCompletionChunk, models.ResponseEvent)):
+        return event.data
+    return event
+
+
+class _Text:
+    r"""Collects string fragments and joins them once when read."""
+
+    __slots__ = ("_parts",)
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._parts)
+
+    def append(self, fragment: str):
+        self._parts.append(fragment)
+
+    def value(self) -> str:
+        parts = self._parts
+        if len(parts) > 1:
+            # Keep the joined value so repeated reads stay linear overall.
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+
+class _ToolCallBuffer:
+    __slots__ = ("id", "type", "name", "arguments")
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.type = "function"
+        self.name = ""
+        self.arguments = _Text()
+
+    def build(self) -> models.ToolCall:
+        return models.ToolCall(
+            id=self.id,
+            type=self.type,
+            function=models.ToolCallFunction(
+                name=self.name, arguments=self.arguments.value()
+            ),
+        )
+
+
+class _ChoiceBuffer:
+    __slots__ = ("role", "content", "refusal", "tool_calls", "finish_reason")
+
+    def __init__(self) -> None:
+        self.role = "assistant"
+        self.content = _Text()
+        self.refusal = _Text()
+        self.tool_calls: Dict[Any, _ToolCallBuffer] = {}
+        self.finish_reason: Optional[str] = None
+
+    def add_tool_call(self, position: int, delta: Any):
+        r"""Merges a tool call fragment into its buffer.
+
+        OpenAI style fragments carry an `index` and only the first one has an
+        id. Fragments without an index are matched by id, and continuation
+        fragments without either extend the most recent call.
+        """
+        index = _field(delta, "index")
+        call_id = _field(delta, "id")
+        if index is not None:
+            key: Any = ("index", index)
+        elif call_id:
+            key = ("id", call_id)
+        elif self.tool_calls:
+            key = next(reversed(self.tool_calls))
+        else:
+            key = ("index", position)
+
+        call = self.tool_calls.get(key)
+        if call is None:
+            call = self.tool_calls[key] = _ToolCallBuffer()
+
+        if call_id:
+            call.id = call_id
+        call_type = _field(delta, "type")
+        if call_type:
+            call.type = call_type
+        function = _field(delta, "function")
+        if function is not None:
+            name = _field(function, "name")
+            if name:
+                call.name = name
+            arguments = _field(function, "arguments")
+            if arguments:
+                call.arguments.append(arguments)
+
+    def build(self, index: int) -> models.Choice:
+        tool_calls = [call.build() for call in self.tool_calls.values()]
+        message = models.MessageResponse(
+            role=self.role,
+            content=self.content.value() if self.content else None,
+        )
+        if self.refusal:
+            message.refusal = self.refusal.value()
+        if tool_calls:
+            message.tool_calls = tool_calls
+        return models.Choice(
+            index=index,
+            finish_reason=self.finish_reason or "",
+            message=message,
+        )
+
+
+class ChatCompletionAccumulator:
+    r"""Rebuilds a `models.ChatCompletion` from streamed chat completion chunks.
+
+    Content, refusal and tool call argument fragments are buffered per choice
+    and joined only when read, so accumulating a stream takes linear time.
+    Chunks can be `models.ChatCompletionChunk`s, `RawEvent`s from a stream in
+    raw mode, or already parsed chunk data.
+
+    ```python
+    accumulator = ChatCompletionAccumulator()
+    with res as event_stream:
+        for chunk in accumulator.attach(event_stream):
+            ...
+    completion = accumulator.completion()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.id: Optional[str] = None
+        self.created: Optional[int] = None
+        self.model: Optional[str] = None
+        self.system_fingerprint: Optional[str] = None
+        self.service_tier: Optional[str] = None
+        self.usage: Optional[models.Usage] = None
+        self._choices: Dict[int, _ChoiceBuffer] = {}
+
+    def add(self, chunk: Any) -> None:
+        r"""Merges one chunk into the accumulated state."""
+        data = _event_data(chunk)
+        if data is None or isinstance(data, str):
+            return
+
+        if self.id is None:
+            self.id = _field(data, "id")
+            self.created = _field(data, "created")
+            self.model = _field(data, "model")
+        fingerprint = _field(data, "system_fingerprint")
+        if fingerprint is not None:
+            self.system_fingerprint = fingerprint
+        service_tier = _field(data, "service_tier")
+        if service_tier is not None:
+            self.service_tier = service_tier
+
+        usage = _field(data, "usage")
+        if usage is not None:
+            self.usage = models.Usage.model_validate(
+                usage if isinstance(usage, dict) else usage.model_dump()
+            )
+
+        for choice in _field(data, "choices") or ():
+            index = _field(choice, "index") or 0
+            buffer = self._choices.get(index)
+            if buffer is None:
+                buffer = self._choices[index] = _ChoiceBuffer()
+
+            finish_reason = _field(choice, "finish_reason")
+            if finish_reason is not None:
+                buffer.finish_reason = getattr(finish_reason, "value", finish_reason)
+
+            delta = _field(choice, "delta")
+            if delta is None:
+                continue
+            role = _field(delta, "role")
+            if role is not None:
+                buffer.role = getattr(role, "value", role)
+            content = _field(delta, "content")
+            if content:
+                buffer.content.append(content)
+            refusal = _field(delta, "refusal")
+            if refusal:
+                buffer.refusal.append(refusal)
+            for position, tool_call in enumerate(_field(delta, "tool_calls") or ()):
+                buffer.add_tool_call(position, tool_call)
+
+    def attach(self, stream: Iterable[T]) -> Generator[T, None, None]:
+        r"""Yields the stream's chunks unchanged while accumulating them."""
+        for chunk in stream:
+            self.add(chunk)
+            yield chunk
+
+    async def attach_async(self, stream: AsyncIterable[T]) -> AsyncGenerator[T, None]:
+        r"""Yields the stream's chunks unchanged while accumulating them."""
+        async for chunk in stream:
+            self.add(chunk)
+            yield chunk
+
+    def content(self, index: int = 0) -> str:
+        r"""Returns the content accumulated so far for choice `index`."""
+        buffer = self._choices.get(index)
+        return buffer.content.value() if buffer is not None else ""
+
+    def tool_calls(self, index: int = 0) -> List[models.ToolCall]:
+        r"""Returns the tool calls accumulated so far for choice `index`."""
+        buffer = self._choices.get(index)
+        if buffer is None:
+            return []
+        return [call.build() for call in buffer.tool_calls.values()]
+
+    def finish_reason(self, index: int = 0) -> Optional[str]:
+        r"""Returns the finish reason of choice `index`, or None while it is open."""
+        buffer = self._choices.get(index)
+        return buffer.finish_reason if buffer is not None else None
+
+    def completion(self) -> models.ChatCompletion:
+        r"""Returns the accumulated state as a `models.ChatCompletion`.
+
+        Can be called at any point. Choices that have not finished yet have an
+        empty `finish_reason`, and usage is zero until the stream reports it.
+        """
+        completion = models.ChatCompletion(
+            id=self.id or "",
+            object="chat.completion",
+            created=self.created or 0,
+            model=self.model or "",
+            choices=[
+                self._choices[index].build(index) for index in sorted(self._choices)
+            ],
+            usage=self.usage
+            or models.Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+        )
+        if self.system_fingerprint is not None:
+            completion.system_fingerprint = self.system_fingerprint
+        if self.service_tier is not None:
+            completion.service_tier = self.service_tier
+        return completion
+
+
+def _copy_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    r"""Copies an output item so that filling in its content leaves the event as is."""
+    item = dict(item)
+    content = item.get("content")
+    if isinstance(content, list):
+        item["content"] = [dict(p) if isinstance(p, dict) else p for p in content]
+    return item
+
+
+_RESPONSE_EVENTS = frozenset(
+    [
+        "response.created",
+        "response.queued",
+        "response.in_progress",
+        "response.completed",
+        "response.failed",
+        "response.incomplete",
+    ]
+)
+
+_TERMINAL_EVENTS = frozenset(
+    ["response.completed", "response.failed", "response.incomplete"]
+)
+
+
+class ResponseAccumulator:
+    r"""Rebuilds a `models.Response` from the events of a streaming response.
+
+    Events are applied in `sequence_number` order. Out of order events are
+    held back until the gap is filled and repeated events are ignored. Output
+    items are kept as they arrive and text, refusal and function call
+    argument deltas are buffered and joined only when read, so accumulating a
+    stream takes linear time. Events can be `models.ResponseEvent`s,
+    `RawEvent`s from a stream in raw mode, or already parsed event data.
+
+    ```python
+    accumulator = ResponseAccumulator()
+    with res as event_stream:
+        for event in accumulator.attach(event_stream):
+            ...
+    response = accumulator.response()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.completed = False
+        self._response: Optional[Dict[str, Any]] = None
+        self._final: Optional[models.Response] = None
+        self._items: List[Dict[str, Any]] = []
+        # (output_index, content_index or None) -> (field name, buffer)
+        self._buffers: Dict[Tuple[int, Optional[int]], Tuple[str, _Text]] = {}
+        self._next: Optional[int] = None
+        self._pending: Dict[int, Any] = {}
+
+    def add(self, event: Any) -> None:
+        r"""Applies one event, or holds it back until the events before it arrive."""
+        data = _event_data(event)
+        if data is None or isinstance(data, str):
+            return
+
+        sequence_number = _field(data, "sequence_number")
+        if sequence_number is None:
+            self._apply(data)
+            return
+
+        if self._next is None:
+            self._next = sequence_number
+        if sequence_number < self._next:
+            return
+
+        self._pending[sequence_number] = data
+        while self._next in self._pending:
+            self._apply(self._pending.pop(self._next))
+            self._next += 1
+
+    def flush(self) -> None:
+        r"""Applies held back events in order, skipping over missing ones."""
+        for sequence_number in sorted(self._pending):
+            self._apply(self._pending.pop(sequence_number))
+            self._next = sequence_number + 1
+
+    def attach(self, stream: Iterable[T]) -> Generator[T, None, None]:
+        r"""Yields the stream's events unchanged while accumulating them."""
+        for event in stream:
+            self.add(event)
+            yield event
+        self.flush()
+
+    async def attach_async(self, stream: AsyncIterable[T]) -> AsyncGenerator[T, None]:
+        r"""Yields the stream's events unchanged while accumulating them."""
+        async for event in stream:
+            self.add(event)
+            yield event
+        self.flush()
+
+    def text(self) -> str:
+        r"""Returns the output text accumulated so far across all output items."""
+        self._write_buffers()
+        return "".join(
+            part.get("text") or ""
+            for item in self._items
+            if item.get("type") == "message"
+            for part in item.get("content") or ()
+            if isinstance(part, dict) and part.get("type") == "output_text"
+        )
+
+    def response(self) -> Optional[models.Response]:
+        r"""Returns the response, or None before the first response event.
+
+        After `response.completed` (or `failed` / `incomplete`) this is the
+        final response sent by the server. Before that it is the latest
+        response snapshot with the output accumulated so far.
+        """
+        if self._final is not None:
+            return self._final
+        if self._response is None:
+            return None
+
+        self._write_buffers()
+        data = dict(self._response)
+        if not data.get("output") and self._items:
+            data["output"] = [item for item in self._items if item]
+        response = models.Response.model_validate(data)
+        if self.completed:
+            self._final = response
+        return response
+
+    def _apply(self, data: Any):
+        typ = _field(data, "type")
+        if typ in _RESPONSE_EVENTS:
+            response = _field(data, "response")
+            if response is not None:
+                self._response = response
+            if typ in _TERMINAL_EVENTS:
+                self.completed = True
+            return
+
+        output_index = _field(data, "output_index")
+        if output_index is None:
+            return
+
+        if typ in ("response.output_item.added", "response.output_item.done"):
+            self._item(output_index)
+            self._items[output_index] = _copy_item(_field(data, "item") or {})
+            self._drop_buffers(output_index)
+        elif typ in ("response.content_part.added", "response.content_part.done"):
+            content_index = _field(data, "content_index") or 0
+            self._part(output_index, content_index).update(_field(data, "part") or {})
+            self._buffers.pop((output_index, content_index), None)
+        elif typ == "response.output_text.delta":
+            self._buffer(data, output_index, "text").append(_field(data, "delta") or "")
+        elif typ == "response.output_text.done":
+            self._set(data, output_index, "text", _field(data, "text"))
+        elif typ == "response.refusal.delta":
+            self._buffer(data, output_index, "refusal").append(
+                _field(data, "delta") or ""
+            )
+        elif typ == "response.refusal.done":
+            self._set(data, output_index, "refusal", _field(data, "refusal"))
+        elif typ == "response.function_call_arguments.delta":
+            key = (output_index, None)
+            if key not in self._buffers:
+                self._buffers[key] = ("arguments", _Text())
+            self._buffers[key][1].append(_field(data, "delta") or "")
+        elif typ == "response.function_call_arguments.done":
+            self._buffers.pop((output_index, None), None)
+            self._item(output_index)["arguments"] = _field(data, "arguments") or ""
+
+    def _item(self, output_index: int) -> Dict[str, Any]:
+        items = self._items
+        while len(items) <= output_index:
+            items.append({})
+        return items[output_index]
+
+    def _part(self, output_index: int, content_index: int) -> Dict[str, Any]:
+        content = self._item(output_index).setdefault("content", [])
+        while len(content) <= content_index:
+            content.append({})
+        return content[content_index]
+
+    def _buffer(self, data: Any, output_index: int, field: str) -> _Text:
+        key = (output_index, _field(data, "content_index") or 0)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = (field, _Text())
+        return buffer[1]
+
+    def _set(self, data: Any, output_index: int, field: str, value: Any):
+        content_index = _field(data, "content_index") or 0
+        self._buffers.pop((output_index, content_index), None)
+        self._part(output_index, content_index)[field] = value or ""
+
+    def _drop_buffers(self, output_index: int):
+        for key in [key for key in self._buffers if key[0] == output_index]:
+            del self._buffers[key]
+
+    def _write_buffers(self):
+        for (output_index, content_index), (field, buffer) in self._buffers.items():
+            if content_index is None:
+                self._item(output_index)[field] = buffer.value()
+            else:
+                self._part(output_index, content_index)[field] = buffer.value()
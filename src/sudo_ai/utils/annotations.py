@@ -77,3 +77,28 @@ def get_discriminator(model: Any, fieldname: str, key: str) -> str:
         return discriminator
 
     raise ValueError(f"Could not find discriminator field {fieldname} in {model}")
+
+
+def get_tag(model: Any, fieldname: str, key: str) -> Optional[str]:
+    """
+    Read the discriminator value at the top level of a model or dictionary.
+
+    Unlike `get_discriminator`, nested values are not searched, and None is
+    returned when the value is absent or not a string, so that a tagged union
+    can fall back to trying each of its variants.
+
+    Args:
+        model (Any): The model or dictionary to read from.
+        fieldname (str): The name of the discriminator attribute on models.
+        key (str): The discriminator key in dictionaries.
+
+    Returns:
+        Optional[str]: The discriminator value, if any.
+    """
+    if isinstance(model, dict):
+        value = model.get(key)
+    else:
+        value = getattr(model, fieldname, None)
+    if isinstance(value, Enum):
+        value = value.value
+    return value if isinstance(value, str) else None
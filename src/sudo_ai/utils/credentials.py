@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .security import get_security, get_security_from_env
+
+# Async callers start refreshing in the background once this fraction of the
+# TTL is left, so the source is not called on the request path.
+_REFRESH_AHEAD = 0.2
+
+
+class _Resolved:
+    __slots__ = ("security", "headers", "query_params", "expires_at")
+
+    def __init__(
+        self,
+        security: Any,
+        headers: Dict[str, str],
+        query_params: Dict[str, List[str]],
+        expires_at: float,
+    ):
+        self.security = security
+        self.headers = headers
+        self.query_params = query_params
+        self.expires_at = expires_at
+
+
+_UNRESOLVED = _Resolved(None, {}, {}, float("-inf"))
+
+
+class CredentialProvider:
+    r"""Caches the security headers resolved from a callable credential source.
+
+    `source` returns a security model, such as `models.Security` built from a
+    callable `api_key`. It is called at most once per `ttl_ms`, or again when
+    the API rejects the cached credentials with a 401. `get()` refreshes
+    inline once the TTL has passed. When building requests for the async
+    client, `get(background=True)` starts the refresh in the event loop's
+    default executor during the last fifth of the TTL and keeps serving the
+    cached headers meanwhile, so a slow source only delays the first request
+    and requests after an idle period longer than the TTL.
+
+    Calling the provider returns the cached security model, so it can stand
+    in wherever a security callable is accepted. Hooks are given `source`
+    itself as their `security_source`.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], Any],
+        security_class: Any,
+        ttl_ms: int,
+    ):
+        self._source = source
+        self._security_class = security_class
+        self._ttl = ttl_ms / 1000
+        self._lock = threading.Lock()
+        self._resolved = _UNRESOLVED
+        self._refreshing: Optional["asyncio.Future[None]"] = None
+
+    @property
+    def source(self) -> Callable[[], Any]:
+        return self._source
+
+    def __call__(self) -> Any:
+        self.get()
+        return self._resolved.security
+
+    def get(
+        self, background: bool = False
+    ) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        resolved = self._resolved
+        remaining = resolved.expires_at - time.monotonic()
+        if remaining <= 0:
+            resolved = self._refresh(resolved)
+        elif background and remaining < self._ttl * _REFRESH_AHEAD:
+            self._refresh_in_background()
+
+        return resolved.headers, resolved.query_params
+
+    def refresh(self) -> None:
+        r"""Call the source now and cache the headers it resolves to."""
+        with self._lock:
+            self._resolve()
+
+    def reauthorize(self, sent: Mapping[str, str]) -> Optional[Dict[str, str]]:
+        r"""Handle a 401 for a request sent with the headers `sent`.
+
+        Refreshes unless another request already replaced the rejected
+        credentials, and returns the current headers if they differ from the
+        ones sent, or None when resending would not help.
+        """
+        with self._lock:
+            if _sent_with(sent, self._resolved.headers):
+                self._resolve()
+
+        headers = self._resolved.headers
+        if _sent_with(sent, headers):
+            return None
+        return dict(headers)
+
+    async def reauthorize_async(
+        self, sent: Mapping[str, str]
+    ) -> Optional[Dict[str, str]]:
+        r"""Like `reauthorize()`, but runs the source in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.reauthorize, sent)
+
+    def _refresh(self, stale: _Resolved) -> _Resolved:
+        with self._lock:
+            # Another thread may have refreshed while this one waited.
+            if self._resolved is stale:
+                self._resolve()
+            return self._resolved
+
+    def _resolve(self) -> None:
+        security = get_security_from_env(self._source(), self._security_class)
+        headers, query_params = get_security(security)
+        self._resolved = _Resolved(
+            security, headers, query_params, time.monotonic() + self._ttl
+        )
+
+    def _refresh_in_background(self) -> None:
+        if self._refreshing is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._refreshing = loop.run_in_executor(None, self.refresh)
+        self._refreshing.add_done_callback(self._refreshed)
+
+    def _refreshed(self, future: "asyncio.Future[None]") -> None:
+        self._refreshing = None
+        # A failed background refresh keeps the cached headers until they
+        # expire, when the next request refreshes inline and raises.
+        if not future.cancelled():
+            future.exception()
+
+
+def _sent_with(sent: Mapping[str, str], headers: Dict[str, str]) -> bool:
+    return all(sent.get(name) == value for name, value in headers.items())
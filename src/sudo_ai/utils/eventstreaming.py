@@ -1,38 +1,502 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
-import re
-import json
 from typing import (
+    Any,
     Callable,
+    Dict,
     Generic,
     TypeVar,
     Optional,
     Generator,
     AsyncGenerator,
+    List,
+    Set,
     Tuple,
+    Awaitable,
+    Iterator,
 )
+import asyncio
+import json
+import queue
+import re
+import threading
+import time
 import httpx
+from pydantic_core import from_json
+
+from .metrics import StreamMetrics
+from .serializers import decode_event_data
+from .tee import Overflow, TeeStream, TeeStreamAsync, tee, tee_async
 
 T = TypeVar("T")
 
 
+class ServerEvent:
+    id: Optional[str] = None
+    event: Optional[str] = None
+    data: Optional[bytes] = None
+    r"""The raw bytes of the event's data lines, joined by newlines."""
+    retry: Optional[int] = None
+
+
+_UNPARSED: Any = object()
+
+
+def str_decoder(decoder: Callable[[str], T]) -> Callable[[ServerEvent], T]:
+    r"""Adapts a decoder written for the JSON string of an event.
+
+    `EventStream` decoders used to receive the event serialized as a JSON
+    object string, and now receive the `ServerEvent` itself, with `data` as
+    raw bytes. The adapter rebuilds the string the old decoders expect, at
+    the cost of the extra encode and parse this change removed.
+    """
+
+    def decode(event: ServerEvent) -> T:
+        fields: Dict[str, Any] = {}
+        if event.id is not None:
+            fields["id"] = event.id
+        if event.event is not None:
+            fields["event"] = event.event
+        if event.retry is not None:
+            fields["retry"] = event.retry
+        if event.data is not None:
+            fields["data"] = decode_event_data(event.data)
+        return decoder(json.dumps(fields))
+
+    return decode
+
+
+class RawEvent(Generic[T]):
+    r"""A server-sent event that is parsed and validated only on demand.
+
+    `data` is the event's JSON data as plain Python objects, parsed on first
+    access. `raw_data` holds the undecoded bytes, and `validate()` returns the
+    fully validated model that the stream would otherwise have yielded.
+    """
+
+    __slots__ = ("_event", "_decoder", "_data", "_model")
+
+    def __init__(self, event: ServerEvent, decoder: Callable[[ServerEvent], T]):
+        self._event = event
+        self._decoder = decoder
+        self._data: Any = _UNPARSED
+        self._model: Any = _UNPARSED
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._event.id
+
+    @property
+    def event(self) -> Optional[str]:
+        return self._event.event
+
+    @property
+    def retry(self) -> Optional[int]:
+        return self._event.retry
+
+    @property
+    def raw_data(self) -> Optional[bytes]:
+        return self._event.data
+
+    @property
+    def data(self) -> Any:
+        if self._data is _UNPARSED:
+            raw = self._event.data
+            if raw is None:
+                self._data = None
+            else:
+                try:
+                    self._data = from_json(raw)
+                except ValueError:
+                    self._data = raw.decode()
+        return self._data
+
+    def validate(self) -> T:
+        if self._model is _UNPARSED:
+            self._model = self._decoder(self._event)
+        return self._model
+
+
+class ResumeConfig:
+    r"""Resumption of a stream whose connection drops before it has ended.
+
+    The request is sent again with a `Last-Event-ID` header, replayed events
+    are skipped, and the delay before reconnecting follows the server's
+    `retry:` hint once one has been received. A stream whose events carry
+    neither an SSE id nor a position cannot be resumed once an event was
+    delivered, since the server would start over, so the drop is raised.
+    """
+
+    max_attempts: int
+    r"""Reconnection attempts allowed in a row without receiving an event."""
+    retry_ms: int
+    r"""Delay before reconnecting until the server sends a `retry:` hint."""
+
+    def __init__(self, max_attempts: int = 3, retry_ms: int = 1000):
+        self.max_attempts = max_attempts
+        self.retry_ms = retry_ms
+
+
+_SEQUENCE_NUMBER = re.compile(rb'"sequence_number"\s*:\s*(\d+)')
+
+
+def sequence_number(event: ServerEvent) -> Optional[int]:
+    r"""Reads the `sequence_number` of a Responses API event without parsing it."""
+    if event.data is None:
+        return None
+    match = _SEQUENCE_NUMBER.search(event.data)
+    return int(match.group(1)) if match else None
+
+
+class StopCondition:
+    r"""Ends a stream early and closes its connection.
+
+    The stream stops after yielding the first event for which `predicate`
+    returns True, after `max_events` events, once `max_bytes` bytes have
+    been received, or once an event arrives more than `max_duration_ms`
+    after the response headers. The bytes of connections dropped before a
+    resume count towards `max_bytes`. The condition is only checked when an
+    event arrives, so a stream that goes silent is not stopped by
+    `max_duration_ms`; use the client timeouts for that. The connection is
+    closed as soon as the condition fires, so the server stops generating.
+    """
+
+    predicate: Optional[Callable[[Any], bool]]
+    max_events: Optional[int]
+    max_bytes: Optional[int]
+    max_duration_ms: Optional[int]
+
+    def __init__(
+        self,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        max_events: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_duration_ms: Optional[int] = None,
+    ):
+        self.predicate = predicate
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.max_duration_ms = max_duration_ms
+
+    def check(self, event: Any, events: int, received: int, elapsed: float) -> str:
+        r"""Returns the reason to stop after `event`, or an empty string."""
+        if self.predicate is not None and self.predicate(event):
+            return "predicate"
+        if self.max_events is not None and events >= self.max_events:
+            return "max_events"
+        if self.max_bytes is not None and received >= self.max_bytes:
+            return "max_bytes"
+        if self.max_duration_ms is not None and elapsed * 1000 >= self.max_duration_ms:
+            return "max_duration"
+        return ""
+
+
+class StopReport:
+    r"""Why and where a stream was ended by its `StopCondition`."""
+
+    reason: str
+    events: int
+    r"""Events yielded, including the one that fired the condition."""
+    bytes_received: int
+    r"""Bytes received before the connection was closed, across reconnects."""
+    elapsed_ms: float
+    r"""Milliseconds from the response headers to the stop."""
+
+    def __init__(
+        self, reason: str, events: int, bytes_received: int, elapsed_ms: float
+    ):
+        self.reason = reason
+        self.events = events
+        self.bytes_received = bytes_received
+        self.elapsed_ms = elapsed_ms
+
+    def __repr__(self):
+        return (
+            f"StopReport(reason={self.reason!r}, events={self.events}, "
+            f"bytes_received={self.bytes_received}, elapsed_ms={self.elapsed_ms:.1f})"
+        )
+
+
+class _Resumption:
+    r"""Tracks how far a stream has been consumed so that it can be resumed.
+
+    Events are ordered by `position` when one is available, such as the
+    `sequence_number` of Responses API events, and by their SSE `id`
+    otherwise. Events at or before the last position, or with an id that was
+    already seen, are replays and are dropped.
+    """
+
+    def __init__(
+        self,
+        config: ResumeConfig,
+        position: Optional[Callable[[ServerEvent], Optional[int]]] = None,
+    ):
+        self.config = config
+        self.position = position
+        self.retry_ms = config.retry_ms
+        self.attempts = 0
+        self.last_event_id: Optional[str] = None
+        self.last_position: Optional[int] = None
+        self.delivered = False
+        self._seen_ids: Set[str] = set()
+
+    def accept(self, event: ServerEvent) -> bool:
+        if event.retry is not None:
+            self.retry_ms = event.retry
+
+        position = self.position(event) if self.position is not None else None
+        if position is not None:
+            if self.last_position is not None and position <= self.last_position:
+                return False
+            self.last_position = position
+        elif event.id is not None:
+            if event.id in self._seen_ids:
+                return False
+            self._seen_ids.add(event.id)
+
+        if event.id is not None:
+            self.last_event_id = event.id
+        self.attempts = 0
+        self.delivered = True
+        return True
+
+    def resume_from(self) -> Optional[str]:
+        if self.last_event_id is not None:
+            return self.last_event_id
+        if self.last_position is not None:
+            return str(self.last_position)
+        return None
+
+    def next_delay(self, error: Exception) -> float:
+        if self.attempts >= self.config.max_attempts:
+            raise error
+        # Without an id or position to resume from, the request would be
+        # answered from the start and the delivered events replayed.
+        if self.delivered and self.resume_from() is None:
+            raise error
+        self.attempts += 1
+        return self.retry_ms / 1000
+
+
 class EventStream(Generic[T]):
     # Holds a reference to the SDK client to avoid it being garbage collected
     # and cause termination of the underlying httpx client.
     client_ref: Optional[object]
     response: httpx.Response
+    decoder: Callable[[ServerEvent], T]
+    sentinel: Optional[str]
+    metrics: Optional[StreamMetrics]
+    stop_condition: Optional[StopCondition]
+    stopped: Optional[StopReport]
+    r"""Set when the stream was ended by its `StopCondition`."""
+    usage: Optional[Dict[str, Any]]
+    r"""The last `usage` object seen by `frames(peek_usage=True)`."""
+    prefetch_chunks: int
     generator: Generator[T, None, None]
 
     def __init__(
         self,
         response: httpx.Response,
-        decoder: Callable[[str], T],
+        decoder: Callable[[ServerEvent], T],
         sentinel: Optional[str] = None,
         client_ref: Optional[object] = None,
+        resume: Optional[ResumeConfig] = None,
+        reconnect: Optional[Callable[[Optional[str]], httpx.Response]] = None,
+        position: Optional[Callable[[ServerEvent], Optional[int]]] = None,
+        metrics: Optional[StreamMetrics] = None,
+        stop_condition: Optional[StopCondition] = None,
+        prefetch_chunks: int = 0,
+        headers_received: Optional[float] = None,
     ):
         self.response = response
-        self.generator = stream_events(response, decoder, sentinel)
+        self.decoder = decoder
+        self.sentinel = sentinel
         self.client_ref = client_ref
+        self.resume = resume
+        self.reconnect = reconnect
+        self.position = position
+        self.metrics = metrics
+        self.stop_condition = stop_condition
+        self.stopped: Optional[StopReport] = None
+        self.usage: Optional[Dict[str, Any]] = None
+        # Streams are created once the response headers have arrived.
+        if headers_received is None:
+            headers_received = time.perf_counter()
+        self._headers_received = headers_received
+        self._previous_bytes = 0
+        self.prefetch_chunks = prefetch_chunks
+        if resume is not None and reconnect is not None:
+            self.generator = self._resumable_events(_Resumption(resume, position))
+        else:
+            self.generator = stream_events(response, decoder, sentinel, prefetch_chunks)
+        if stop_condition is not None:
+            self.generator = self._stopping_events(self.generator, stop_condition)
+        if metrics is not None:
+            if metrics.headers_received is None:
+                metrics.headers_received = time.perf_counter()
+            self.generator = self._measured_events(self.generator)
+
+    def raw(self) -> "EventStream[RawEvent[T]]":
+        r"""Returns the stream in raw mode, yielding `RawEvent`s.
+
+        Events are not validated unless `RawEvent.validate()` is called, which
+        keeps the per-event cost low for consumers that only read a few
+        fields. Must be called before iteration starts.
+        """
+        decoder = self.decoder
+        return EventStream(
+            self.response,
+            lambda event: RawEvent(event, decoder),
+            self.sentinel,
+            self.client_ref,
+            self.resume,
+            self.reconnect,
+            self.position,
+            self.metrics,
+            self.stop_condition,
+            self.prefetch_chunks,
+            headers_received=self._headers_received,
+        )
+
+    def prefetch(self, max_chunks: int = 64) -> "EventStream[T]":
+        r"""Returns the stream with the network reads moved to a background thread.
+
+        The thread reads up to `max_chunks` chunks of the response ahead of
+        the caller, so waiting for the network overlaps with processing the
+        previous events. It stops when the stream is closed, exhausted or
+        garbage collected. Must be called before iteration starts.
+        """
+        return EventStream(
+            self.response,
+            self.decoder,
+            self.sentinel,
+            self.client_ref,
+            self.resume,
+            self.reconnect,
+            self.position,
+            self.metrics,
+            self.stop_condition,
+            max_chunks,
+            headers_received=self._headers_received,
+        )
+
+    def tee(
+        self, n: int = 2, max_buffered: int = 1024, overflow: Overflow = "detach"
+    ) -> List[TeeStream[T]]:
+        r"""Splits the stream into `n` consumers that share one upstream read.
+
+        Every event is read and decoded once, and the same object is handed
+        to each consumer. Consumers read through their own cursor over a
+        buffer of at most `max_buffered` events. When the buffer is full, the
+        slowest consumers are dropped with `"detach"`, the default, and raise
+        `errors.StreamDetachedError`. With `"block"` the fastest consumer
+        waits for the slowest instead, which needs the consumers to run in
+        separate threads: draining one consumer after the other would wait
+        forever. The response is closed with the last consumer. Must be
+        called before iteration starts.
+        """
+        return tee(self, self.close, n, max_buffered, overflow)
+
+    def frames(self, peek_usage: bool = False) -> Generator[memoryview, None, None]:
+        r"""Yields the raw SSE frames of the response without decoding them.
+
+        Each frame is the bytes of one event including its trailing blank
+        line, ready to be forwarded as is. Frames that arrive within a single
+        network chunk are zero-copy `memoryview`s of that chunk. The sentinel
+        frame is forwarded too, and ends the stream. With `peek_usage`, frames
+        that carry a `usage` object are parsed and the last one is stored in
+        `usage`. Decoding, resumption, stop conditions and metrics do not
+        apply to frames. Must be called before iteration starts.
+        """
+        splitter = _FrameSplitter(self.sentinel, _USAGE if peek_usage else None)
+        for chunk in _iter_bytes(self.response, self.prefetch_chunks):
+            if splitter.discard:
+                continue
+
+            frames = splitter.feed(chunk)
+            if splitter.peeked:
+                self._peek_usage(splitter.peeked)
+            yield from frames
+
+        frames = splitter.flush()
+        if splitter.peeked:
+            self._peek_usage(splitter.peeked)
+        yield from frames
+
+    def _peek_usage(self, frames: List[memoryview]):
+        for frame in frames:
+            usage = _frame_usage(frame)
+            if usage is not None:
+                self.usage = usage
+        frames.clear()
+
+    def _resumable_events(self, resumption: _Resumption) -> Generator[T, None, None]:
+        assert self.reconnect is not None
+        while True:
+            parser = _EventParser(self.sentinel)
+            try:
+                for chunk in _iter_bytes(self.response, self.prefetch_chunks):
+                    if parser.discard:
+                        continue
+
+                    for event in parser.feed(chunk):
+                        if resumption.accept(event):
+                            yield self.decoder(event)
+
+                for event in parser.flush():
+                    if resumption.accept(event):
+                        yield self.decoder(event)
+                return
+            except httpx.TransportError as error:
+                # A drop after the sentinel loses nothing.
+                if parser.discard:
+                    return
+                delay = resumption.next_delay(error)
+                self._previous_bytes += self.response.num_bytes_downloaded
+                self.response.close()
+
+            while True:
+                time.sleep(delay)
+                try:
+                    self.response = self.reconnect(resumption.resume_from())
+                    break
+                except httpx.TransportError as error:
+                    delay = resumption.next_delay(error)
+
+    def _bytes_received(self) -> int:
+        return self._previous_bytes + self.response.num_bytes_downloaded
+
+    def _stopping_events(
+        self, events: Generator[T, None, None], stop: StopCondition
+    ) -> Generator[T, None, None]:
+        count = 0
+        for event in events:
+            count += 1
+            elapsed = time.perf_counter() - self._headers_received
+            received = self._bytes_received()
+            reason = stop.check(event, count, received, elapsed)
+            if reason:
+                events.close()
+                self.response.close()
+                self.stopped = StopReport(reason, count, received, elapsed * 1000)
+                yield event
+                return
+            yield event
+
+    def _measured_events(
+        self, events: Generator[T, None, None]
+    ) -> Generator[T, None, None]:
+        assert self.metrics is not None
+        metrics = self.metrics
+        append = metrics.event_times.append
+        now = time.perf_counter
+        try:
+            for event in events:
+                append(now())
+                yield event
+        finally:
+            metrics.bytes_received += self._bytes_received()
+            metrics.finish()
 
     def __iter__(self):
         return self
@@ -44,6 +508,10 @@ class EventStream(Generic[T]):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.generator.close()
         self.response.close()
 
 
@@ -52,18 +520,202 @@ class EventStreamAsync(Generic[T]):
     # and cause termination of the underlying httpx client.
     client_ref: Optional[object]
     response: httpx.Response
+    decoder: Callable[[ServerEvent], T]
+    sentinel: Optional[str]
+    metrics: Optional[StreamMetrics]
+    stop_condition: Optional[StopCondition]
+    stopped: Optional[StopReport]
+    r"""Set when the stream was ended by its `StopCondition`."""
+    usage: Optional[Dict[str, Any]]
+    r"""The last `usage` object seen by `frames(peek_usage=True)`."""
     generator: AsyncGenerator[T, None]
 
     def __init__(
         self,
         response: httpx.Response,
-        decoder: Callable[[str], T],
+        decoder: Callable[[ServerEvent], T],
         sentinel: Optional[str] = None,
         client_ref: Optional[object] = None,
+        resume: Optional[ResumeConfig] = None,
+        reconnect: Optional[
+            Callable[[Optional[str]], Awaitable[httpx.Response]]
+        ] = None,
+        position: Optional[Callable[[ServerEvent], Optional[int]]] = None,
+        metrics: Optional[StreamMetrics] = None,
+        stop_condition: Optional[StopCondition] = None,
+        headers_received: Optional[float] = None,
     ):
         self.response = response
-        self.generator = stream_events_async(response, decoder, sentinel)
+        self.decoder = decoder
+        self.sentinel = sentinel
         self.client_ref = client_ref
+        self.resume = resume
+        self.reconnect = reconnect
+        self.position = position
+        self.metrics = metrics
+        self.stop_condition = stop_condition
+        self.stopped: Optional[StopReport] = None
+        self.usage: Optional[Dict[str, Any]] = None
+        # Streams are created once the response headers have arrived.
+        if headers_received is None:
+            headers_received = time.perf_counter()
+        self._headers_received = headers_received
+        self._previous_bytes = 0
+        if resume is not None and reconnect is not None:
+            self.generator = self._resumable_events(_Resumption(resume, position))
+        else:
+            self.generator = stream_events_async(response, decoder, sentinel)
+        if stop_condition is not None:
+            self.generator = self._stopping_events(self.generator, stop_condition)
+        if metrics is not None:
+            if metrics.headers_received is None:
+                metrics.headers_received = time.perf_counter()
+            self.generator = self._measured_events(self.generator)
+
+    def raw(self) -> "EventStreamAsync[RawEvent[T]]":
+        r"""Returns the stream in raw mode, yielding `RawEvent`s.
+
+        Events are not validated unless `RawEvent.validate()` is called, which
+        keeps the per-event cost low for consumers that only read a few
+        fields. Must be called before iteration starts.
+        """
+        decoder = self.decoder
+        return EventStreamAsync(
+            self.response,
+            lambda event: RawEvent(event, decoder),
+            self.sentinel,
+            self.client_ref,
+            self.resume,
+            self.reconnect,
+            self.position,
+            self.metrics,
+            self.stop_condition,
+            headers_received=self._headers_received,
+        )
+
+    def tee(
+        self, n: int = 2, max_buffered: int = 1024, overflow: Overflow = "detach"
+    ) -> List[TeeStreamAsync[T]]:
+        r"""Splits the stream into `n` consumers that share one upstream read.
+
+        Every event is read and decoded once, and the same object is handed
+        to each consumer. Consumers read through their own cursor over a
+        buffer of at most `max_buffered` events. When the buffer is full, the
+        slowest consumers are dropped with `"detach"`, the default, and raise
+        `errors.StreamDetachedError`. With `"block"` the fastest consumer
+        waits for the slowest instead, which needs the consumers to run in
+        separate tasks: draining one consumer after the other would wait
+        forever. The response is closed with the last consumer. Must be
+        called before iteration starts.
+        """
+        return tee_async(self, self.aclose, n, max_buffered, overflow)
+
+    async def frames(
+        self, peek_usage: bool = False
+    ) -> AsyncGenerator[memoryview, None]:
+        r"""Yields the raw SSE frames of the response without decoding them.
+
+        Each frame is the bytes of one event including its trailing blank
+        line, ready to be forwarded as is. Frames that arrive within a single
+        network chunk are zero-copy `memoryview`s of that chunk. The sentinel
+        frame is forwarded too, and ends the stream. With `peek_usage`, frames
+        that carry a `usage` object are parsed and the last one is stored in
+        `usage`. Decoding, resumption, stop conditions and metrics do not
+        apply to frames. Must be called before iteration starts.
+        """
+        splitter = _FrameSplitter(self.sentinel, _USAGE if peek_usage else None)
+        async for chunk in self.response.aiter_bytes():
+            if splitter.discard:
+                continue
+
+            frames = splitter.feed(chunk)
+            if splitter.peeked:
+                self._peek_usage(splitter.peeked)
+            for frame in frames:
+                yield frame
+
+        frames = splitter.flush()
+        if splitter.peeked:
+            self._peek_usage(splitter.peeked)
+        for frame in frames:
+            yield frame
+
+    def _peek_usage(self, frames: List[memoryview]):
+        for frame in frames:
+            usage = _frame_usage(frame)
+            if usage is not None:
+                self.usage = usage
+        frames.clear()
+
+    async def _resumable_events(
+        self, resumption: _Resumption
+    ) -> AsyncGenerator[T, None]:
+        assert self.reconnect is not None
+        while True:
+            parser = _EventParser(self.sentinel)
+            try:
+                async for chunk in self.response.aiter_bytes():
+                    if parser.discard:
+                        continue
+
+                    for event in parser.feed(chunk):
+                        if resumption.accept(event):
+                            yield self.decoder(event)
+
+                for event in parser.flush():
+                    if resumption.accept(event):
+                        yield self.decoder(event)
+                return
+            except httpx.TransportError as error:
+                # A drop after the sentinel loses nothing.
+                if parser.discard:
+                    return
+                delay = resumption.next_delay(error)
+                self._previous_bytes += self.response.num_bytes_downloaded
+                await self.response.aclose()
+
+            while True:
+                await asyncio.sleep(delay)
+                try:
+                    self.response = await self.reconnect(resumption.resume_from())
+                    break
+                except httpx.TransportError as error:
+                    delay = resumption.next_delay(error)
+
+    def _bytes_received(self) -> int:
+        return self._previous_bytes + self.response.num_bytes_downloaded
+
+    async def _stopping_events(
+        self, events: AsyncGenerator[T, None], stop: StopCondition
+    ) -> AsyncGenerator[T, None]:
+        count = 0
+        async for event in events:
+            count += 1
+            elapsed = time.perf_counter() - self._headers_received
+            received = self._bytes_received()
+            reason = stop.check(event, count, received, elapsed)
+            if reason:
+                await events.aclose()
+                await self.response.aclose()
+                self.stopped = StopReport(reason, count, received, elapsed * 1000)
+                yield event
+                return
+            yield event
+
+    async def _measured_events(
+        self, events: AsyncGenerator[T, None]
+    ) -> AsyncGenerator[T, None]:
+        assert self.metrics is not None
+        metrics = self.metrics
+        append = metrics.event_times.append
+        now = time.perf_counter
+        try:
+            async for event in events:
+                append(now())
+                yield event
+        finally:
+            metrics.bytes_received += self._bytes_received()
+            metrics.finish()
 
     def __aiter__(self):
         return self
@@ -75,14 +727,11 @@ class EventStreamAsync(Generic[T]):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.response.aclose()
+        await self.aclose()
 
-
-class ServerEvent:
-    id: Optional[str] = None
-    event: Optional[str] = None
-    data: Optional[str] = None
-    retry: Optional[int] = None
+    async def aclose(self):
+        await self.generator.aclose()
+        await self.response.aclose()
 
 
 MESSAGE_BOUNDARIES = [
@@ -91,158 +740,355 @@ MESSAGE_BOUNDARIES = [
     b"\r\r",
 ]
 
+# Returned by _parse_event when the event carries the sentinel value.
+_SENTINEL = ServerEvent()
+
+
+class _EventParser:
+    r"""Incremental SSE parser that splits a byte stream into events.
+
+    The parser reuses a single buffer for the whole stream and remembers, for
+    every boundary sequence, where it was last found or how far the buffer has
+    already been searched. Each byte is therefore searched a constant number
+    of times regardless of how the stream is chunked. The ``\r`` based
+    boundaries are only searched for once a carriage return has been seen.
+    """
+
+    def __init__(self, sentinel: Optional[str] = None):
+        self.sentinel = sentinel
+        self.discard = False
+        self._buffer = bytearray()
+        self._boundaries: List[bytes] = [b"\n\n"]
+        # Per boundary: index of the next known occurrence, or -1 together
+        # with the length of the buffer that has been searched without a match.
+        self._found: Dict[bytes, int] = {b: -1 for b in MESSAGE_BOUNDARIES}
+        self._searched: Dict[bytes, int] = {b: 0 for b in MESSAGE_BOUNDARIES}
+
+    def feed(self, chunk: bytes) -> List[ServerEvent]:
+        events: List[ServerEvent] = []
+        if self.discard or not chunk:
+            return events
+
+        buffer = self._buffer
+        if len(self._boundaries) == 1 and b"\r" in chunk:
+            self._boundaries = list(MESSAGE_BOUNDARIES)
+        buffer += chunk
+
+        start = 0
+        while True:
+            end, size = self._find_boundary(start)
+            if end < 0:
+                break
+
+            event = _parse_event(buffer[start:end], self.sentinel)
+            start = end + size
+            if event is _SENTINEL:
+                self._discard()
+                return events
+            if event is not None:
+                events.append(event)
+
+        if start:
+            # Deleting from the front of a bytearray does not copy the
+            # remainder, so consumed events are dropped in place.
+            del buffer[:start]
+            for boundary in MESSAGE_BOUNDARIES:
+                if self._found[boundary] >= 0:
+                    self._found[boundary] -= start
+                else:
+                    self._searched[boundary] = max(0, self._searched[boundary] - start)
+
+        return events
+
+    def flush(self) -> List[ServerEvent]:
+        if self.discard or not self._buffer:
+            return []
+
+        event = _parse_event(self._buffer, self.sentinel)
+        self._buffer.clear()
+        if event is _SENTINEL:
+            self._discard()
+            return []
+        return [event] if event is not None else []
+
+    def _discard(self):
+        self.discard = True
+        self._buffer.clear()
+
+    def _find_boundary(self, position: int) -> Tuple[int, int]:
+        buffer = self._buffer
+        end = -1
+        size = 0
+        for boundary in self._boundaries:
+            found = self._found[boundary]
+            if found < position:
+                # A boundary that straddles two chunks may start up to
+                # len(boundary) - 1 bytes before the end of the searched data.
+                resume = self._searched[boundary] - len(boundary) + 1
+                if found >= 0 or resume < position:
+                    resume = position
+                found = buffer.find(boundary, resume)
+                self._found[boundary] = found
+                if found < 0:
+                    self._searched[boundary] = len(buffer)
+
+            if found >= 0 and (end < 0 or found < end):
+                end = found
+                size = len(boundary)
+
+        return end, size
+
+
+_USAGE = re.compile(rb'"usage"\s*:\s*\{')
+
+
+class _FrameSplitter:
+    r"""Splits a byte stream into raw SSE frames without parsing them.
+
+    Frames keep their trailing boundary so that they can be forwarded as
+    they are. A frame within a single chunk is returned as a `memoryview`
+    of the chunk, and only the bytes of frames that span chunks are copied.
+    Frames that match `peek` are also collected in `peeked`.
+    """
+
+    def __init__(
+        self, sentinel: Optional[str] = None, peek: Optional[re.Pattern] = None
+    ):
+        self.sentinel = sentinel
+        self._marker = sentinel.encode() if sentinel is not None else None
+        self.peek = peek
+        self.peeked: List[memoryview] = []
+        self.discard = False
+        self._pending = bytearray()
+        self._boundaries: List[bytes] = [b"\n\n"]
+
+    def feed(self, chunk: bytes) -> List[memoryview]:
+        frames: List[memoryview] = []
+        if self.discard or not chunk:
+            return frames
+
+        if len(self._boundaries) == 1 and b"\r" in chunk:
+            self._boundaries = list(MESSAGE_BOUNDARIES)
+
+        pending = self._pending
+        if pending:
+            # Only join once the pending frame can end, so that a large
+            # frame arriving in many chunks is copied once. Every boundary
+            # ends with a line terminator.
+            if b"\n" not in chunk and b"\r" not in chunk:
+                pending += chunk
+                return frames
+            tail = bytes(pending[-3:]) + chunk[:3]
+            if not any(b in chunk or b in tail for b in self._boundaries):
+                pending += chunk
+                return frames
+            pending += chunk
+            chunk = bytes(pending)
+            pending.clear()
+
+        view = memoryview(chunk)
+        # Per boundary: index of the next occurrence, or -1 if there is none.
+        found: Dict[bytes, int] = {}
+        start = 0
+        while True:
+            end = -1
+            size = 0
+            for boundary in self._boundaries:
+                index = found.get(boundary)
+                if index is None or 0 <= index < start:
+                    index = chunk.find(boundary, start)
+                    found[boundary] = index
+                if index >= 0 and (end < 0 or index < end):
+                    end = index
+                    size = len(boundary)
+            if end < 0:
+                break
+
+            frame = view[start : end + size]
+            frames.append(frame)
+            if self.peek is not None and self.peek.search(chunk, start, end):
+                self.peeked.append(frame)
+            if self._is_sentinel(chunk, start, end):
+                self.discard = True
+                return frames
+            start = end + size
+
+        if start < len(chunk):
+            pending += view[start:]
+        return frames
+
+    def flush(self) -> List[memoryview]:
+        if self.discard or not self._pending:
+            return []
+
+        data = bytes(self._pending)
+        self._pending.clear()
+        frame = memoryview(data)
+        if self.peek is not None and self.peek.search(data):
+            self.peeked.append(frame)
+        return [frame]
+
+    def _is_sentinel(self, chunk: bytes, start: int, end: int) -> bool:
+        if self._marker is None or chunk.find(self._marker, start, end) < 0:
+            return False
+        return _parse_event(bytearray(chunk[start:end]), self.sentinel) is _SENTINEL
+
+
+def _frame_usage(frame: memoryview) -> Optional[Dict[str, Any]]:
+    event = _parse_event(bytearray(frame))
+    if event is None or event is _SENTINEL or event.data is None:
+        return None
+    try:
+        data = from_json(event.data)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    usage = data.get("usage")
+    if usage is None and isinstance(data.get("response"), dict):
+        # Responses API events carry the usage on the response object.
+        usage = data["response"].get("usage")
+    return usage if isinstance(usage, dict) else None
+
 
 async def stream_events_async(
     response: httpx.Response,
-    decoder: Callable[[str], T],
+    decoder: Callable[[ServerEvent], T],
     sentinel: Optional[str] = None,
 ) -> AsyncGenerator[T, None]:
-    buffer = bytearray()
-    position = 0
-    discard = False
+    parser = _EventParser(sentinel)
     async for chunk in response.aiter_bytes():
         # We've encountered the sentinel value and should no longer process
         # incoming data. Instead we throw new data away until the server closes
         # the connection.
-        if discard:
+        if parser.discard:
             continue
 
-        buffer += chunk
-        for i in range(position, len(buffer)):
-            char = buffer[i : i + 1]
-            seq: Optional[bytes] = None
-            if char in [b"\r", b"\n"]:
-                for boundary in MESSAGE_BOUNDARIES:
-                    seq = _peek_sequence(i, buffer, boundary)
-                    if seq is not None:
-                        break
-            if seq is None:
-                continue
-
-            block = buffer[position:i]
-            position = i + len(seq)
-            event, discard = _parse_event(block, decoder, sentinel)
-            if event is not None:
-                yield event
-
-        if position > 0:
-            buffer = buffer[position:]
-            position = 0
+        for event in parser.feed(chunk):
+            yield decoder(event)
 
-    event, discard = _parse_event(buffer, decoder, sentinel)
-    if event is not None:
-        yield event
+    for event in parser.flush():
+        yield decoder(event)
 
 
 def stream_events(
     response: httpx.Response,
-    decoder: Callable[[str], T],
+    decoder: Callable[[ServerEvent], T],
     sentinel: Optional[str] = None,
+    prefetch_chunks: int = 0,
 ) -> Generator[T, None, None]:
-    buffer = bytearray()
-    position = 0
-    discard = False
-    for chunk in response.iter_bytes():
+    parser = _EventParser(sentinel)
+    for chunk in _iter_bytes(response, prefetch_chunks):
         # We've encountered the sentinel value and should no longer process
         # incoming data. Instead we throw new data away until the server closes
         # the connection.
-        if discard:
+        if parser.discard:
             continue
 
-        buffer += chunk
-        for i in range(position, len(buffer)):
-            char = buffer[i : i + 1]
-            seq: Optional[bytes] = None
-            if char in [b"\r", b"\n"]:
-                for boundary in MESSAGE_BOUNDARIES:
-                    seq = _peek_sequence(i, buffer, boundary)
-                    if seq is not None:
-                        break
-            if seq is None:
-                continue
+        for event in parser.feed(chunk):
+            yield decoder(event)
+
+    for event in parser.flush():
+        yield decoder(event)
+
+
+def _iter_bytes(response: httpx.Response, prefetch_chunks: int) -> Iterator[bytes]:
+    if prefetch_chunks > 0:
+        return _prefetched_bytes(response, prefetch_chunks)
+    return response.iter_bytes()
 
-            block = buffer[position:i]
-            position = i + len(seq)
-            event, discard = _parse_event(block, decoder, sentinel)
-            if event is not None:
-                yield event
 
-        if position > 0:
-            buffer = buffer[position:]
-            position = 0
+def _prefetched_bytes(
+    response: httpx.Response, max_chunks: int
+) -> Generator[bytes, None, None]:
+    # The reader thread only holds the response and the queue. It never
+    # references the stream, so an abandoned stream can still be collected,
+    # and closing this generator then stops the thread.
+    chunks: "queue.Queue[Tuple[Optional[bytes], Optional[BaseException]]]"
+    chunks = queue.Queue(max_chunks)
+    closed = threading.Event()
 
-    event, discard = _parse_event(buffer, decoder, sentinel)
-    if event is not None:
-        yield event
+    def put(item) -> bool:
+        while not closed.is_set():
+            try:
+                chunks.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for chunk in response.iter_bytes():
+                if not put((chunk, None)):
+                    break
+            else:
+                put((None, None))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if not closed.is_set():
+                put((None, e))
+        finally:
+            if closed.is_set():
+                response.close()
+
+    thread = threading.Thread(target=read, name="sudo-ai-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk, error = chunks.get()
+            if error is not None:
+                raise error
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        # httpx responses are not thread-safe, so the reader closes the
+        # response itself. Waiting for it means that callers closing the
+        # response afterwards never race with a read, which the client's
+        # read timeout bounds.
+        closed.set()
+        thread.join()
 
 
 def _parse_event(
-    raw: bytearray, decoder: Callable[[str], T], sentinel: Optional[str] = None
-) -> Tuple[Optional[T], bool]:
-    block = raw.decode()
-    lines = re.split(r"\r?\n|\r", block)
+    raw: bytearray, sentinel: Optional[str] = None
+) -> Optional[ServerEvent]:
     publish = False
     event = ServerEvent()
-    data = ""
-    for line in lines:
-        if not line:
-            continue
-
-        delim = line.find(":")
+    data: List[bytearray] = []
+    for line in raw.splitlines():
+        delim = line.find(b":")
         if delim <= 0:
             continue
 
         field = line[0:delim]
-        value = line[delim + 1 :] if delim < len(line) - 1 else ""
-        if len(value) and value[0] == " ":
+        value = line[delim + 1 :]
+        if value[:1] == b" ":
             value = value[1:]
 
-        if field == "event":
-            event.event = value
+        if field == b"event":
+            event.event = value.decode()
             publish = True
-        elif field == "data":
-            data += value + "\n"
+        elif field == b"data":
+            data.append(value)
             publish = True
-        elif field == "id":
-            event.id = value
+        elif field == b"id":
+            event.id = value.decode()
             publish = True
-        elif field == "retry":
+        elif field == b"retry":
             event.retry = int(value) if value.isdigit() else None
             publish = True
 
-    if sentinel and data == f"{sentinel}\n":
-        return None, True
+    if not publish:
+        return None
 
     if data:
-        data = data[:-1]
-        event.data = data
-
-        data_is_primitive = (
-            data.isnumeric() or data == "true" or data == "false" or data == "null"
-        )
-        data_is_json = (
-            data.startswith("{") or data.startswith("[") or data.startswith('"')
-        )
-
-        if data_is_primitive or data_is_json:
-            try:
-                event.data = json.loads(data)
-            except Exception:
-                pass
-
-    out = None
-    if publish:
-        out = decoder(json.dumps(event.__dict__))
-
-    return out, False
-
-
-def _peek_sequence(position: int, buffer: bytearray, sequence: bytes):
-    if len(sequence) > (len(buffer) - position):
-        return None
+        # The data is kept as bytes so the decoder can validate it straight
+        # from JSON without an intermediate Python object or str copy.
+        raw_data = b"\n".join(data)
+        if sentinel and raw_data == sentinel.encode():
+            return _SENTINEL
 
-    for i, seq in enumerate(sequence):
-        if buffer[position + i] != seq:
-            return None
+        event.data = raw_data
 
-    return sequence
+    return event
@@ -3,7 +3,6 @@
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Tuple,
 )
@@ -15,7 +14,8 @@ from .serializers import marshal_json
 from .metadata import (
     FormMetadata,
     MultipartFormMetadata,
-    find_field_metadata,
+    get_field_types,
+    get_fields_metadata,
 )
 from .values import _is_set, _val_to_string
 
@@ -88,19 +88,13 @@ def _populate_form(
 
 def _extract_file_properties(file_obj: Any) -> Tuple[str, Any, Any]:
     """Extract file name, content, and content type from a file object."""
-    file_fields: Dict[str, FieldInfo] = file_obj.__class__.model_fields
+    file_fields = get_fields_metadata(file_obj.__class__, MultipartFormMetadata)
 
     file_name = ""
     content = None
     content_type = None
 
-    for file_field_name in file_fields:
-        file_field = file_fields[file_field_name]
-
-        file_metadata = find_field_metadata(file_field, MultipartFormMetadata)
-        if file_metadata is None:
-            continue
-
+    for file_field_name, _, file_metadata in file_fields:
         if file_metadata.content:
             content = getattr(file_obj, file_field_name, None)
         elif file_field_name == "content_type":
@@ -123,21 +117,16 @@ def serialize_multipart_form(
     if not isinstance(request, BaseModel):
         raise TypeError("invalid request body type")
 
-    request_fields: Dict[str, FieldInfo] = request.__class__.model_fields
-    request_field_types = get_type_hints(request.__class__)
-
-    for name in request_fields:
-        field = request_fields[name]
+    request_fields = get_fields_metadata(request.__class__, MultipartFormMetadata)
+    request_field_types = get_field_types(request.__class__)
 
+    for name, f_name, field_metadata in request_fields:
         val = getattr(request, name)
         if not _is_set(val):
             continue
 
-        field_metadata = find_field_metadata(field, MultipartFormMetadata)
-        if not field_metadata:
-            continue
-
-        f_name = field.alias if field.alias else name
+        # Multipart parts fall back to the field name for an empty alias too.
+        f_name = f_name or name
 
         if field_metadata.file:
             if isinstance(val, List):
@@ -185,21 +174,13 @@ def serialize_form_data(data: Any) -> Dict[str, Any]:
     form: Dict[str, List[str]] = {}
 
     if isinstance(data, BaseModel):
-        data_fields: Dict[str, FieldInfo] = data.__class__.model_fields
-        data_field_types = get_type_hints(data.__class__)
-        for name in data_fields:
-            field = data_fields[name]
-
+        data_fields = get_fields_metadata(data.__class__, FormMetadata)
+        data_field_types = get_field_types(data.__class__)
+        for name, f_name, metadata in data_fields:
             val = getattr(data, name)
             if not _is_set(val):
                 continue
 
-            metadata = find_field_metadata(field, FormMetadata)
-            if metadata is None:
-                continue
-
-            f_name = field.alias if field.alias is not None else name
-
             if metadata.json:
                 form[f_name] = [marshal_json(val, data_field_types[name])]
             else:
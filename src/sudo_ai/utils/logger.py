@@ -16,6 +16,18 @@ class NoOpLogger:
         pass
 
 
+def is_debug_enabled(logger: Logger) -> bool:
+    r"""Whether `logger` would emit debug records.
+
+    Callers check this before computing arguments that are expensive to
+    format, such as request and response bodies.
+    """
+    if isinstance(logger, NoOpLogger):
+        return False
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return is_enabled_for is None or is_enabled_for(logging.DEBUG)
+
+
 def get_body_content(req: httpx.Request) -> str:
     return "<streaming body>" if not hasattr(req, "_content") else str(req.content)
 
@@ -1,7 +1,19 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
-from typing import Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
 from dataclasses import dataclass
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 
@@ -116,3 +128,48 @@ def find_metadata(field_info: FieldInfo, metadata_type: Type[T]) -> Optional[T]:
             return md
 
     return None
+
+
+class FieldMetadataEntry(NamedTuple):
+    name: str
+    f_name: str
+    metadata: Any
+
+
+_fields_metadata: Dict[Tuple[type, type], Tuple[FieldMetadataEntry, ...]] = {}
+_field_types: Dict[type, Dict[str, Any]] = {}
+
+
+def get_fields_metadata(
+    model_type: Type[BaseModel], metadata_type: type
+) -> Tuple[FieldMetadataEntry, ...]:
+    r"""Return the fields of a model class that carry `metadata_type`.
+
+    Each entry holds the field name, its serialized name (the alias, if any)
+    and the metadata with its style and explode settings, in declaration
+    order. Tables are built on first use per class and metadata type and kept
+    for the life of the process, so serializers do not walk
+    `FieldInfo.metadata` on every request.
+    """
+    key = (model_type, metadata_type)
+    entries = _fields_metadata.get(key)
+    if entries is None:
+        table: List[FieldMetadataEntry] = []
+        for name, field in model_type.model_fields.items():
+            metadata = find_field_metadata(field, metadata_type)
+            if metadata is None:
+                continue
+            f_name = field.alias if field.alias is not None else name
+            table.append(FieldMetadataEntry(name, f_name, metadata))
+        entries = tuple(table)
+        _fields_metadata[key] = entries
+    return entries
+
+
+def get_field_types(model_type: type) -> Dict[str, Any]:
+    r"""Return the resolved type hints of a model class, computed once per class."""
+    field_types = _field_types.get(model_type)
+    if field_types is None:
+        field_types = get_type_hints(model_type)
+        _field_types[model_type] = field_types
+    return field_types
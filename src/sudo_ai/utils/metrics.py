@@ -0,0 +1,101 @@
+from array import array
+import time
+from typing import Dict, List, Optional
+
+from .logger import Logger, NoOpLogger
+from .sinks import Sink, publish_to_sink
+
+MetricsSink = Sink["StreamMetrics"]
+
+
+class StreamMetrics:
+    r"""Timings of a single event stream.
+
+    Timestamps are `time.perf_counter()` values in seconds. The time of every
+    event is appended to a compact `array("d")` buffer, and the summary stats
+    are computed from it only when they are read. Metrics are published to
+    the sink once, when the stream is exhausted or closed, through
+    `publish_to_sink`.
+    """
+
+    operation_id: str
+    request_sent: float
+    headers_received: Optional[float]
+    event_times: "array[float]"
+    bytes_received: int
+    finished: Optional[float]
+
+    def __init__(
+        self,
+        operation_id: str,
+        sink: Optional[MetricsSink] = None,
+        logger: Optional[Logger] = None,
+    ):
+        self.operation_id = operation_id
+        self.sink = sink
+        self.logger = logger if logger is not None else NoOpLogger()
+        self.request_sent = time.perf_counter()
+        self.headers_received = None
+        self.event_times = array("d")
+        self.bytes_received = 0
+        self.finished = None
+
+    @property
+    def events(self) -> int:
+        return len(self.event_times)
+
+    @property
+    def ttft(self) -> Optional[float]:
+        r"""Seconds from sending the request to the first event."""
+        if not self.event_times:
+            return None
+        return self.event_times[0] - self.request_sent
+
+    def gaps(self) -> List[float]:
+        r"""Seconds between consecutive events."""
+        times = self.event_times
+        return [b - a for a, b in zip(times, times[1:])]
+
+    def gap_percentile(self, percentile: float) -> Optional[float]:
+        gaps = sorted(self.gaps())
+        if not gaps:
+            return None
+        rank = round(percentile / 100 * (len(gaps) - 1))
+        return gaps[min(max(rank, 0), len(gaps) - 1)]
+
+    @property
+    def duration(self) -> Optional[float]:
+        r"""Seconds from receiving the headers to the end of the stream."""
+        if self.headers_received is None:
+            return None
+        end = self.finished
+        if end is None:
+            end = self.event_times[-1] if self.event_times else self.headers_received
+        return end - self.headers_received
+
+    @property
+    def events_per_second(self) -> Optional[float]:
+        duration = self.duration
+        return self.events / duration if duration else None
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        duration = self.duration
+        return self.bytes_received / duration if duration else None
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "ttft": self.ttft,
+            "p50_gap": self.gap_percentile(50),
+            "p99_gap": self.gap_percentile(99),
+            "events_per_second": self.events_per_second,
+            "bytes_per_second": self.bytes_per_second,
+            "events": self.events,
+            "bytes": self.bytes_received,
+        }
+
+    def finish(self) -> None:
+        if self.finished is not None:
+            return
+        self.finished = time.perf_counter()
+        publish_to_sink(self.sink, self, self.logger, "stream metrics")
@@ -0,0 +1,164 @@
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .eventstreaming import EventStreamAsync
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class EventStreamMultiplexer(Generic[K, T]):
+    r"""Merges many `EventStreamAsync`s into one stream of `(key, event)` pairs.
+
+    Each stream has at most one read in flight. The next read starts only
+    when the previous event is handed to the consumer, so a slow consumer
+    holds back every stream and at most one event per stream is buffered.
+    Events are yielded in the order they arrive. Since a stream only
+    re-enters the queue after its event was taken, streams that are ready
+    together take turns, and a busy stream cannot starve the others.
+
+    A stream that fails is closed. By default the error is raised after all
+    other streams are closed. With `return_exceptions=True` the error is
+    yielded as the stream's last event and the other streams continue.
+    `aclose()`, or leaving `async with`, cancels pending reads and closes
+    every stream's response.
+    """
+
+    def __init__(
+        self,
+        streams: Union[
+            Mapping[K, EventStreamAsync[T]], Iterable[EventStreamAsync[T]]
+        ] = (),
+        return_exceptions: bool = False,
+    ):
+        self.return_exceptions = return_exceptions
+        self._streams: Dict[Any, EventStreamAsync[T]] = {}
+        self._reads: Dict["asyncio.Future[T]", Any] = {}
+        self._done: Deque[Tuple[Any, "asyncio.Future[T]"]] = deque()
+        self._waiter: Optional["asyncio.Future[None]"] = None
+        # Reads start on the first __anext__, in the loop that iterates, so
+        # the multiplexer can be built outside a running loop.
+        self._unread: Optional[List[Any]] = []
+        self._closed = False
+
+        if isinstance(streams, Mapping):
+            for key, stream in streams.items():
+                self.add(key, stream)
+        else:
+            # Streams passed as a sequence are keyed by their position.
+            for index, stream in enumerate(streams):
+                self.add(cast(K, index), stream)
+
+    def add(self, key: K, stream: EventStreamAsync[T]) -> None:
+        if self._closed:
+            raise RuntimeError("the multiplexer is closed")
+        if key in self._streams:
+            raise ValueError(f"duplicate stream key: {key!r}")
+        self._streams[key] = stream
+        if self._unread is not None:
+            self._unread.append(key)
+        else:
+            self._read(key)
+
+    def __len__(self) -> int:
+        r"""Number of streams that have not finished yet."""
+        return len(self._streams)
+
+    def _read(self, key) -> None:
+        loop = asyncio.get_running_loop()
+        read = loop.create_task(self._streams[key].__anext__())
+        self._reads[read] = key
+        read.add_done_callback(self._on_done)
+
+    def _on_done(self, read: "asyncio.Future[T]") -> None:
+        key = self._reads.pop(read, None)
+        if key is None:
+            # Cancelled by aclose().
+            return
+        self._done.append((key, read))
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Tuple[K, Union[T, BaseException]]:
+        if self._unread is not None:
+            unread, self._unread = self._unread, None
+            for key in unread:
+                self._read(key)
+
+        while True:
+            while self._done:
+                key, read = self._done.popleft()
+                if read.cancelled():
+                    error: Optional[BaseException] = asyncio.CancelledError()
+                else:
+                    error = read.exception()
+                if error is None:
+                    self._read(key)
+                    return key, read.result()
+
+                stream = self._streams.pop(key)
+                await stream.aclose()
+                if isinstance(error, StopAsyncIteration):
+                    continue
+                if not self.return_exceptions:
+                    await self.aclose()
+                    raise error
+                return key, error
+
+            if not self._reads:
+                raise StopAsyncIteration
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            except asyncio.CancelledError:
+                await self.aclose()
+                raise
+            finally:
+                self._waiter = None
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._unread = None
+
+        reads = list(self._reads)
+        self._reads.clear()
+        self._done.clear()
+        for read in reads:
+            read.cancel()
+        if reads:
+            await asyncio.gather(*reads, return_exceptions=True)
+
+        streams: List[EventStreamAsync[T]] = list(self._streams.values())
+        self._streams.clear()
+        for stream in streams:
+            try:
+                await stream.aclose()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
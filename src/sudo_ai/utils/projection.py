@@ -0,0 +1,209 @@
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic.fields import FieldInfo
+
+from .serializers import get_type_adapter
+
+P = TypeVar("P", bound="Projection")
+
+_MISSING: Any = object()
+
+
+class JsonPath:
+    r"""The location of a `Projection` field in the response JSON.
+
+    Segments are separated by dots, and integer segments index into arrays,
+    e.g. `"choices.0.message.content"`. Negative indices count from the end.
+    """
+
+    def __init__(self, path: str):
+        if not path:
+            raise ValueError("a JSON path needs at least one segment")
+        self.path = path
+        self.segments: Tuple[Union[str, int], ...] = tuple(
+            int(segment) if segment.lstrip("-").isdigit() else segment
+            for segment in path.split(".")
+        )
+
+    def __repr__(self):
+        return f"JsonPath({self.path!r})"
+
+
+class Projection(BaseModel):
+    r"""A small model filled from selected paths of a larger JSON document.
+
+    Each field is read from the path given by its `JsonPath` annotation, or
+    from the top-level key of the same name. Only the values on those paths
+    are validated and turned into Python objects. Everything else in the
+    document is skipped by the JSON parser. Fields whose path is absent from
+    the document keep their default.
+
+    ```python
+    class Answer(utils.Projection):
+        content: Annotated[
+            Optional[str], utils.JsonPath("choices.0.message.content")
+        ] = None
+        usage: Optional[models.CompletionUsage] = None
+    ```
+    """
+
+    @classmethod
+    def extract(cls: Type[P], data: Union[str, bytes]) -> P:
+        r"""Validates the projected paths of the JSON document `data`."""
+        plan = _plans.get(cls)
+        if plan is None:
+            plan = _plans[cls] = _Plan(cls)
+
+        shape = plan.adapter.validate_json(data)
+        values: Dict[str, Any] = {}
+        for name, steps in plan.paths:
+            value = _walk(shape, steps)
+            if value is not _MISSING:
+                values[name] = value
+        return cls.model_validate(values)
+
+
+_ShapeTree = Dict[Union[str, int], Any]
+
+
+class _Plan:
+    r"""The shape model and attribute paths compiled for a `Projection`.
+
+    The shape mirrors the document with only the projected keys, each
+    optional and defaulting to `_MISSING`. Every element of an array that is
+    indexed into is validated against the same shape, which covers the
+    paths of all of its indices.
+    """
+
+    def __init__(self, cls: Type[Projection]):
+        self.name = cls.__name__
+        tree: _ShapeTree = {}
+        leaves: List[Tuple[str, Tuple[Union[str, int], ...]]] = []
+        for name, field in cls.model_fields.items():
+            segments = _field_path(name, field).segments
+            node = tree
+            for segment in segments[:-1]:
+                child = node.setdefault(segment, {})
+                if not isinstance(child, dict):
+                    raise ValueError(f"{self.name}.{name}: path overlaps a field")
+                node = child
+            if segments[-1] in node:
+                raise ValueError(f"{self.name}.{name}: path overlaps a field")
+            node[segments[-1]] = _Leaf(field.annotation)
+            leaves.append((name, segments))
+
+        self._attributes: Dict[int, Dict[str, str]] = {}
+        self._elements: Dict[int, Any] = {}
+        self.adapter = get_type_adapter(self._shape(tree))
+        self.paths = [(name, self._steps(tree, segments)) for name, segments in leaves]
+
+    def _shape(self, tree: _ShapeTree) -> Any:
+        keys = [k for k in tree if isinstance(k, str)]
+        if not keys:
+            return List[Optional[self._element_shape(tree)]]
+        if len(keys) != len(tree):
+            raise ValueError(f"{self.name}: a path indexes into an object")
+
+        fields: Dict[str, Any] = {}
+        attributes: Dict[str, str] = {}
+        for i, key in enumerate(keys):
+            child = tree[key]
+            typ = child.annotation if isinstance(child, _Leaf) else self._shape(child)
+            attributes[key] = f"f{i}"
+            fields[f"f{i}"] = (Optional[typ], Field(default=_MISSING, alias=key))
+        self._attributes[id(tree)] = attributes
+        return create_model(
+            f"_{self.name}Shape",
+            __config__=ConfigDict(extra="ignore", arbitrary_types_allowed=True),
+            **fields,
+        )
+
+    def _element_shape(self, tree: _ShapeTree) -> Any:
+        element = self._element(tree)
+        if isinstance(element, _Leaf):
+            return element.annotation
+        return self._shape(element)
+
+    def _element(self, tree: _ShapeTree) -> Any:
+        r"""Merges the paths below every index of an array into one tree."""
+        element = self._elements.get(id(tree))
+        if element is not None:
+            return element
+
+        children = list(tree.values())
+        if all(isinstance(child, _Leaf) for child in children):
+            annotations = tuple(child.annotation for child in children)
+            element = _Leaf(Union[annotations])  # type: ignore[valid-type]
+        elif any(isinstance(child, _Leaf) for child in children):
+            raise ValueError(f"{self.name}: an array element is a field and a path")
+        else:
+            element = {}
+            for child in children:
+                _merge_into(element, child, self.name)
+        self._elements[id(tree)] = element
+        return element
+
+    def _steps(
+        self, tree: _ShapeTree, segments: Tuple[Union[str, int], ...]
+    ) -> List[Union[str, int]]:
+        steps: List[Union[str, int]] = []
+        node: Any = tree
+        for segment in segments:
+            if isinstance(segment, int):
+                steps.append(segment)
+                node = self._element(node)
+            else:
+                steps.append(self._attributes[id(node)][segment])
+                node = node[segment]
+        return steps
+
+
+class _Leaf:
+    __slots__ = ("annotation",)
+
+    def __init__(self, annotation: Any):
+        self.annotation = annotation
+
+
+_plans: Dict[type, _Plan] = {}
+
+
+def _field_path(name: str, field: FieldInfo) -> JsonPath:
+    for metadata in field.metadata:
+        if isinstance(metadata, JsonPath):
+            return metadata
+    return JsonPath(field.alias or name)
+
+
+def _merge_into(target: _ShapeTree, tree: _ShapeTree, name: str) -> None:
+    for key, child in tree.items():
+        if key not in target:
+            target[key] = _copy(child)
+        elif isinstance(target[key], dict) and isinstance(child, dict):
+            _merge_into(target[key], child, name)
+        elif isinstance(target[key], _Leaf) and isinstance(child, _Leaf):
+            # The same field read from different elements of an array.
+            annotations = (target[key].annotation, child.annotation)
+            target[key] = _Leaf(Union[annotations])  # type: ignore[valid-type]
+        else:
+            raise ValueError(f"{name}: two paths through {key!r} overlap")
+
+
+def _copy(node: Any) -> Any:
+    if isinstance(node, dict):
+        return {key: _copy(child) for key, child in node.items()}
+    return node
+
+
+def _walk(node: Any, steps: List[Union[str, int]]) -> Any:
+    for step in steps:
+        if node is None or node is _MISSING:
+            return _MISSING
+        if isinstance(step, int):
+            if not -len(node) <= step < len(node):
+                return _MISSING
+            node = node[step]
+        else:
+            node = getattr(node, step)
+    return node
@@ -3,17 +3,16 @@
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
 )
 
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     QueryParamMetadata,
-    find_field_metadata,
+    get_field_types,
+    get_fields_metadata,
 )
 from .values import (
     _get_serialized_params,
@@ -48,18 +47,11 @@ def _populate_query_params(
     if not isinstance(query_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = query_params.__class__.model_fields
-    param_field_types = get_type_hints(query_params.__class__)
-    for name in param_fields:
+    param_fields = get_fields_metadata(query_params.__class__, QueryParamMetadata)
+    for name, f_name, metadata in param_fields:
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-
-        metadata = find_field_metadata(field, QueryParamMetadata)
-        if not metadata:
-            continue
-
         value = getattr(query_params, name) if _is_set(query_params) else None
 
         value, global_found = _populate_from_globals(
@@ -68,37 +60,48 @@ def _populate_query_params(
         if global_found:
             globals_already_populated.append(name)
 
-        f_name = field.alias if field.alias is not None else name
-        serialization = metadata.serialization
-        if serialization is not None:
-            serialized_parms = _get_serialized_params(
-                metadata, f_name, value, param_field_types[name]
-            )
-            for key, value in serialized_parms.items():
-                if key in query_param_values:
-                    query_param_values[key].extend(value)
-                else:
-                    query_param_values[key] = [value]
-        else:
-            style = metadata.style
-            if style == "deepObject":
-                _populate_deep_object_query_params(f_name, value, query_param_values)
-            elif style == "form":
-                _populate_delimited_query_params(
-                    metadata, f_name, value, ",", query_param_values
-                )
-            elif style == "pipeDelimited":
-                _populate_delimited_query_params(
-                    metadata, f_name, value, "|", query_param_values
-                )
-            else:
-                raise NotImplementedError(
-                    f"query param style {style} not yet supported"
-                )
+        _populate_query_param(
+            metadata,
+            f_name,
+            value,
+            get_field_types(query_params.__class__)[name],
+            query_param_values,
+        )
 
     return globals_already_populated
 
 
+def _populate_query_param(
+    metadata: QueryParamMetadata,
+    f_name: str,
+    value: Any,
+    field_type: Any,
+    query_param_values: Dict[str, List[str]],
+):
+    serialization = metadata.serialization
+    if serialization is not None:
+        serialized_parms = _get_serialized_params(metadata, f_name, value, field_type)
+        for key, serialized in serialized_parms.items():
+            if key in query_param_values:
+                query_param_values[key].extend(serialized)
+            else:
+                query_param_values[key] = [serialized]
+    else:
+        style = metadata.style
+        if style == "deepObject":
+            _populate_deep_object_query_params(f_name, value, query_param_values)
+        elif style == "form":
+            _populate_delimited_query_params(
+                metadata, f_name, value, ",", query_param_values
+            )
+        elif style == "pipeDelimited":
+            _populate_delimited_query_params(
+                metadata, f_name, value, "|", query_param_values
+            )
+        else:
+            raise NotImplementedError(f"query param style {style} not yet supported")
+
+
 def _populate_deep_object_query_params(
     field_name: str,
     obj: Any,
@@ -121,18 +124,9 @@ def _populate_deep_object_query_params_basemodel(
     if not _is_set(obj) or not isinstance(obj, BaseModel):
         return
 
-    obj_fields: Dict[str, FieldInfo] = obj.__class__.model_fields
-    for name in obj_fields:
-        obj_field = obj_fields[name]
-
-        f_name = obj_field.alias if obj_field.alias is not None else name
-
+    for name, f_name, _ in get_fields_metadata(obj.__class__, QueryParamMetadata):
         params_key = f"{prior_params_key}[{f_name}]"
 
-        obj_param_metadata = find_field_metadata(obj_field, QueryParamMetadata)
-        if not _is_set(obj_param_metadata):
-            continue
-
         obj_val = getattr(obj, name)
         if not _is_set(obj_val):
             continue
@@ -0,0 +1,68 @@
+from typing import Any, Generic, Type, TypeVar
+
+import httpx
+from pydantic_core import from_json
+
+from sudo_ai import errors
+from .projection import Projection
+from .unmarshal_json_response import unmarshal_json_response
+
+T = TypeVar("T")
+P = TypeVar("P", bound=Projection)
+
+_UNPARSED: Any = object()
+
+
+class RawResponse(Generic[T]):
+    r"""A successful response whose body is parsed only on demand.
+
+    `content` holds the undecoded body bytes, which can be forwarded as they
+    are. `parse()` validates them into the model the method would otherwise
+    have returned, and `json()` parses them into plain Python objects. Both
+    are computed once, on first call. `project()` reads only the paths
+    declared by a `Projection`.
+    """
+
+    __slots__ = ("http_res", "_typ", "_model", "_json")
+
+    def __init__(self, http_res: httpx.Response, typ: Type[T]):
+        self.http_res = http_res
+        self._typ = typ
+        self._model: Any = _UNPARSED
+        self._json: Any = _UNPARSED
+
+    @property
+    def status_code(self) -> int:
+        return self.http_res.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.http_res.headers
+
+    @property
+    def content(self) -> bytes:
+        return self.http_res.content
+
+    def json(self) -> Any:
+        if self._json is _UNPARSED:
+            self._json = from_json(self.http_res.content)
+        return self._json
+
+    def parse(self) -> T:
+        if self._model is _UNPARSED:
+            self._model = unmarshal_json_response(self._typ, self.http_res)
+        return self._model
+
+    def project(self, projection: Type[P]) -> P:
+        try:
+            return projection.extract(self.http_res.content)
+        except Exception as e:
+            raise errors.ResponseValidationError(
+                "Response validation failed", self.http_res, e
+            ) from e
+
+    def __repr__(self):
+        return (
+            f"RawResponse(status_code={self.status_code}, "
+            f"content=<{len(self.content)} bytes>)"
+        )
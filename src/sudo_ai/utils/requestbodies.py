@@ -5,12 +5,16 @@ from dataclasses import dataclass
 import re
 from typing import (
     Any,
+    Mapping,
     Optional,
+    Union,
 )
 
+from pydantic_core import to_json
+
 from .forms import serialize_form_data, serialize_multipart_form
 
-from .serializers import marshal_json
+from .serializers import marshal_json_bytes
 
 SERIALIZATION_METHOD_TO_CONTENT_TYPE = {
     "json": "application/json",
@@ -20,6 +24,27 @@ SERIALIZATION_METHOD_TO_CONTENT_TYPE = {
     "string": "text/plain",
 }
 
+_JSON_MEDIA_TYPE = re.compile(r"(application|text)\/.*?\+*json.*")
+_MULTIPART_MEDIA_TYPE = re.compile(r"multipart\/.*")
+_FORM_MEDIA_TYPE = re.compile(r"application\/x-www-form-urlencoded.*")
+
+
+def _media_type_kind(media_type: str) -> Optional[str]:
+    if _JSON_MEDIA_TYPE.match(media_type) is not None:
+        return "json"
+    if _MULTIPART_MEDIA_TYPE.match(media_type) is not None:
+        return "multipart"
+    if _FORM_MEDIA_TYPE.match(media_type) is not None:
+        return "form"
+    return None
+
+
+# Matched once per serialization method rather than on every request.
+_MEDIA_TYPE_KINDS = {
+    method: _media_type_kind(media_type)
+    for method, media_type in SERIALIZATION_METHOD_TO_CONTENT_TYPE.items()
+}
+
 
 @dataclass
 class SerializedRequestBody:
@@ -41,18 +66,21 @@ def serialize_request_body(
             return None
 
     media_type = SERIALIZATION_METHOD_TO_CONTENT_TYPE[serialization_method]
+    kind = _MEDIA_TYPE_KINDS[serialization_method]
 
     serialized_request_body = SerializedRequestBody(media_type)
 
-    if re.match(r"(application|text)\/.*?\+*json.*", media_type) is not None:
-        serialized_request_body.content = marshal_json(request_body, request_body_type)
-    elif re.match(r"multipart\/.*", media_type) is not None:
+    if kind == "json":
+        serialized_request_body.content = marshal_json_bytes(
+            request_body, request_body_type
+        )
+    elif kind == "multipart":
         (
             serialized_request_body.media_type,
             serialized_request_body.data,
             serialized_request_body.files,
         ) = serialize_multipart_form(media_type, request_body)
-    elif re.match(r"application\/x-www-form-urlencoded.*", media_type) is not None:
+    elif kind == "form":
         serialized_request_body.data = serialize_form_data(request_body)
     elif isinstance(request_body, (bytes, bytearray, io.BytesIO, io.BufferedReader)):
         serialized_request_body.content = request_body
@@ -64,3 +92,21 @@ def serialize_request_body(
         )
 
     return serialized_request_body
+
+
+def serialize_raw_request_body(
+    request_body: Union[bytes, Mapping[str, Any]],
+) -> SerializedRequestBody:
+    r"""Wraps a JSON request body that skips the request models.
+
+    `bytes` are sent as they are. A mapping is encoded without validation, so
+    its keys must already use the wire names.
+    """
+    if isinstance(request_body, (bytes, bytearray, memoryview)):
+        content = bytes(request_body)
+    elif isinstance(request_body, Mapping):
+        content = to_json(request_body)
+    else:
+        raise TypeError("request body must be bytes or a mapping")
+
+    return SerializedRequestBody("application/json", content)
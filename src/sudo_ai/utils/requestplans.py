@@ -0,0 +1,204 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+from pydantic import BaseModel
+
+from .headers import _serialize_header, get_headers
+from .metadata import (
+    HeaderMetadata,
+    PathParamMetadata,
+    QueryParamMetadata,
+    get_field_types,
+    get_fields_metadata,
+)
+from .queryparams import _populate_query_param, get_query_params
+from .url import _populate_path_param, generate_url, remove_suffix
+from .values import _is_set
+
+
+class _Param(NamedTuple):
+    name: str
+    f_name: str
+    metadata: Any
+    field_type: Any
+
+
+class RequestPlan:
+    r"""The parts of an operation's request that are the same on every call.
+
+    Compiled once per operation from its path template and request model:
+    the path, query and header parameter fields with their metadata and
+    resolved type hints, and the static headers. Building a request then
+    only reads the parameter values off the request model. Operations without
+    path parameters also reuse the parsed URL of the last server URL used.
+
+    Globals can change between calls, so when they are passed the plan falls
+    back to the reflective utilities. The request body is not part of the
+    plan: `serialize_request_body` already resolves the media type once per
+    serialization method and the TypeAdapter once per body type.
+    """
+
+    __slots__ = (
+        "path",
+        "has_path_params",
+        "has_query_params",
+        "path_params",
+        "query_params",
+        "header_params",
+        "headers",
+        "_url",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        request_type: Any,
+        request_has_path_params: bool,
+        request_has_query_params: bool,
+        accept_header_value: str,
+    ):
+        self.path = path
+        self.has_path_params = request_has_path_params
+        self.has_query_params = request_has_query_params
+        self.path_params: Tuple[_Param, ...] = ()
+        self.query_params: Tuple[_Param, ...] = ()
+        self.header_params: Tuple[_Param, ...] = ()
+        self.headers = {"Accept": accept_header_value}
+        self._url: Optional[Tuple[str, httpx.URL]] = None
+
+        if not isinstance(request_type, type) or not issubclass(
+            request_type, BaseModel
+        ):
+            return
+
+        if request_has_path_params:
+            self.path_params = _compile_params(request_type, PathParamMetadata)
+        if request_has_query_params:
+            self.query_params = _compile_params(request_type, QueryParamMetadata)
+        self.header_params = _compile_params(request_type, HeaderMetadata)
+
+    def generate_url(
+        self, server_url: str, request: Any, gbls: Optional[Any] = None
+    ) -> Union[str, httpx.URL]:
+        if gbls is not None:
+            if not self.has_path_params:
+                return generate_url(server_url, self.path, None)
+            return generate_url(server_url, self.path, request, gbls)
+
+        if not self.path_params:
+            cached = self._url
+            if cached is None or cached[0] != server_url:
+                cached = (
+                    server_url,
+                    httpx.URL(remove_suffix(server_url, "/") + self.path),
+                )
+                self._url = cached
+            return cached[1]
+
+        path = self.path
+        path_param_values: Dict[str, str] = {}
+        for param in self.path_params:
+            value = getattr(request, param.name)
+            if not _is_set(value):
+                continue
+            _populate_path_param(
+                param.metadata,
+                param.f_name,
+                value,
+                param.field_type,
+                path_param_values,
+            )
+
+        for key, value in path_param_values.items():
+            path = path.replace("{" + key + "}", value, 1)
+
+        return remove_suffix(server_url, "/") + path
+
+    def get_query_params(
+        self, request: Any, gbls: Optional[Any] = None
+    ) -> Dict[str, List[str]]:
+        if gbls is not None:
+            if not self.has_query_params:
+                return {}
+            return get_query_params(request, gbls)
+
+        query_param_values: Dict[str, List[str]] = {}
+        for param in self.query_params:
+            _populate_query_param(
+                param.metadata,
+                param.f_name,
+                getattr(request, param.name),
+                param.field_type,
+                query_param_values,
+            )
+
+        return query_param_values
+
+    def get_headers(self, request: Any, gbls: Optional[Any] = None) -> Dict[str, str]:
+        if gbls is not None:
+            headers = get_headers(request, gbls)
+            headers.update(self.headers)
+            return headers
+
+        headers = {}
+        for param in self.header_params:
+            value = _serialize_header(
+                param.metadata.explode, getattr(request, param.name)
+            )
+            if value != "":
+                headers[param.f_name] = value
+
+        headers.update(self.headers)
+        return headers
+
+
+_plans: Dict[Tuple[Any, ...], RequestPlan] = {}
+
+
+def get_request_plan(
+    method: str,
+    path: str,
+    request_type: Any,
+    request_has_path_params: bool,
+    request_has_query_params: bool,
+    accept_header_value: str,
+) -> RequestPlan:
+    key = (
+        method,
+        path,
+        request_type,
+        request_has_path_params,
+        request_has_query_params,
+        accept_header_value,
+    )
+    plan: Optional[RequestPlan] = _plans.get(key)
+    if plan is None:
+        plan = RequestPlan(
+            path,
+            request_type,
+            request_has_path_params,
+            request_has_query_params,
+            accept_header_value,
+        )
+        _plans[key] = plan
+    return plan
+
+
+def _compile_params(request_type: Any, metadata_type: type) -> Tuple[_Param, ...]:
+    fields = get_fields_metadata(request_type, metadata_type)
+    if not fields:
+        return ()
+
+    field_types = get_field_types(request_type)
+    return tuple(
+        _Param(name, f_name, metadata, field_types[name])
+        for name, f_name, metadata in fields
+    )
@@ -10,11 +10,10 @@ from typing import (
     Tuple,
 )
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     SecurityMetadata,
-    find_field_metadata,
+    get_fields_metadata,
 )
 import os
 
@@ -29,17 +28,12 @@ def get_security(security: Any) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
     if not isinstance(security, BaseModel):
         raise TypeError("security must be a pydantic model")
 
-    sec_fields: Dict[str, FieldInfo] = security.__class__.model_fields
-    for name in sec_fields:
-        sec_field = sec_fields[name]
-
+    sec_fields = get_fields_metadata(security.__class__, SecurityMetadata)
+    for name, _, metadata in sec_fields:
         value = getattr(security, name)
         if value is None:
             continue
 
-        metadata = find_field_metadata(sec_field, SecurityMetadata)
-        if metadata is None:
-            continue
         if metadata.option:
             _parse_security_option(headers, query_params, value)
             return headers, query_params
@@ -76,12 +70,9 @@ def _parse_security_option(
     if not isinstance(option, BaseModel):
         raise TypeError("security option must be a pydantic model")
 
-    opt_fields: Dict[str, FieldInfo] = option.__class__.model_fields
-    for name in opt_fields:
-        opt_field = opt_fields[name]
-
-        metadata = find_field_metadata(opt_field, SecurityMetadata)
-        if metadata is None or not metadata.scheme:
+    opt_fields = get_fields_metadata(option.__class__, SecurityMetadata)
+    for name, _, metadata in opt_fields:
+        if not metadata.scheme:
             continue
         _parse_security_scheme(
             headers, query_params, metadata, name, getattr(option, name)
@@ -106,12 +97,9 @@ def _parse_security_scheme(
             if sub_type == "custom":
                 return
 
-        scheme_fields: Dict[str, FieldInfo] = scheme.__class__.model_fields
-        for name in scheme_fields:
-            scheme_field = scheme_fields[name]
-
-            metadata = find_field_metadata(scheme_field, SecurityMetadata)
-            if metadata is None or metadata.field_name is None:
+        scheme_fields = get_fields_metadata(scheme.__class__, SecurityMetadata)
+        for name, _, metadata in scheme_fields:
+            if metadata.field_name is None:
                 continue
 
             value = getattr(scheme, name)
@@ -172,12 +160,9 @@ def _parse_basic_auth_scheme(headers: Dict[str, str], scheme: Any):
     if not isinstance(scheme, BaseModel):
         raise TypeError("basic auth scheme must be a pydantic model")
 
-    scheme_fields: Dict[str, FieldInfo] = scheme.__class__.model_fields
-    for name in scheme_fields:
-        scheme_field = scheme_fields[name]
-
-        metadata = find_field_metadata(scheme_field, SecurityMetadata)
-        if metadata is None or metadata.field_name is None:
+    scheme_fields = get_fields_metadata(scheme.__class__, SecurityMetadata)
+    for name, _, metadata in scheme_fields:
+        if metadata.field_name is None:
             continue
 
         field_name = metadata.field_name
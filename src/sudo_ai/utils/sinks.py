@@ -0,0 +1,27 @@
+from typing import Optional, Protocol, TypeVar
+
+from .logger import Logger
+
+T_contra = TypeVar("T_contra", contravariant=True)
+
+
+class Sink(Protocol[T_contra]):
+    def publish(self, record: T_contra, /) -> None:
+        pass
+
+
+def publish_to_sink(
+    sink: Optional[Sink[T_contra]], record: T_contra, logger: Logger, what: str
+) -> None:
+    r"""Hands `record` to `sink`, if there is one.
+
+    Sinks are called on the caller's path after the work they describe has
+    finished, so their errors are logged to `logger` as "Failed to publish
+    `what`" and never reach the caller.
+    """
+    if sink is None:
+        return
+    try:
+        sink.publish(record)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.debug("Failed to publish %s", what, exc_info=True)
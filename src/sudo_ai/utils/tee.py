@@ -0,0 +1,339 @@
+import asyncio
+from collections import deque
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from sudo_ai import errors
+
+T = TypeVar("T")
+
+Overflow = Literal["block", "detach"]
+
+
+class _TeeState(Generic[T]):
+    r"""Queue of upstream events shared by the consumers of a tee.
+
+    Every consumer has a cursor, the absolute index of the next event it
+    reads. The buffer holds the events between the slowest and the fastest
+    cursor, and events are dropped as soon as every cursor has passed them.
+    When the buffer holds `max_buffered` events, the fastest consumer either waits for the
+    slowest (`"block"`), or the consumers at the start of the buffer are
+    detached (`"detach"`).
+    """
+
+    def __init__(self, consumers: int, max_buffered: int, overflow: Overflow):
+        if consumers < 1:
+            raise ValueError("a tee needs at least one consumer")
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be at least 1")
+        if overflow not in ("block", "detach"):
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+
+        self.max_buffered = max_buffered
+        self.overflow = overflow
+        self.buffer: Deque[Any] = deque()
+        self.start = 0
+        self.cursors: Dict[int, int] = {i: 0 for i in range(consumers)}
+        self.detached: Set[int] = set()
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.reading = False
+
+    def take(self, consumer: int) -> Any:
+        r"""Returns the consumer's next buffered event.
+
+        Returns `_EMPTY` when the upstream has to be read first, and `_END`
+        at the end of the stream or after the consumer was closed. Raises
+        when the consumer was detached or the upstream failed.
+        """
+        cursor = self.cursors.get(consumer)
+        if cursor is None:
+            if consumer in self.detached:
+                raise errors.StreamDetachedError()
+            return _END
+
+        offset = cursor - self.start
+        if offset < len(self.buffer):
+            event = self.buffer[offset]
+            self.cursors[consumer] = cursor + 1
+            if offset == 0:
+                self.trim()
+            return event
+        if self.error is not None:
+            raise self.error
+        if self.done:
+            return _END
+        return _EMPTY
+
+    def can_read(self) -> bool:
+        r"""Whether the caller should read the next upstream event."""
+        if self.reading:
+            return False
+        if len(self.buffer) < self.max_buffered:
+            return True
+        if self.overflow == "detach":
+            for consumer, cursor in list(self.cursors.items()):
+                if cursor == self.start:
+                    del self.cursors[consumer]
+                    self.detached.add(consumer)
+            self.trim()
+            return True
+        return False
+
+    def release(self, consumer: int) -> bool:
+        r"""Removes a consumer. Returns whether no consumers are left."""
+        self.cursors.pop(consumer, None)
+        self.trim()
+        return not self.cursors
+
+    def trim(self) -> None:
+        end = self.start + len(self.buffer)
+        slowest = min(self.cursors.values(), default=end)
+        for _ in range(slowest - self.start):
+            self.buffer.popleft()
+        self.start = slowest
+
+
+_EMPTY: Any = object()
+_END: Any = object()
+
+
+class _Tee(Generic[T]):
+    def __init__(
+        self,
+        source: Iterator[T],
+        close: Callable[[], None],
+        state: _TeeState[T],
+    ):
+        self.source = source
+        self.close = close
+        self.state = state
+        self.condition = threading.Condition()
+
+    def next(self, consumer: int) -> T:
+        state = self.state
+        with self.condition:
+            while True:
+                event = state.take(consumer)
+                if event is _END:
+                    raise StopIteration
+                if event is not _EMPTY:
+                    self.condition.notify_all()
+                    return event
+                if state.can_read():
+                    state.reading = True
+                    break
+                self.condition.wait()
+
+        try:
+            event = next(self.source)
+        except StopIteration:
+            with self.condition:
+                state.done = True
+                state.reading = False
+                self.condition.notify_all()
+            raise
+        except Exception as e:
+            with self.condition:
+                state.error = e
+                state.reading = False
+                self.condition.notify_all()
+            raise
+        except BaseException:
+            # The interruption is raised inside the upstream generator, which
+            # closes it, so the other consumers must not wait for more events.
+            with self.condition:
+                state.error = errors.StreamInterruptedError()
+                state.reading = False
+                self.condition.notify_all()
+            raise
+
+        with self.condition:
+            state.buffer.append(event)
+            state.reading = False
+            if consumer in state.cursors:
+                state.cursors[consumer] += 1
+            state.trim()
+            self.condition.notify_all()
+        return event
+
+    def release(self, consumer: int) -> None:
+        with self.condition:
+            last = self.state.release(consumer)
+            self.condition.notify_all()
+        if last:
+            self.close()
+
+
+class _TeeAsync(Generic[T]):
+    def __init__(
+        self,
+        source: AsyncIterator[T],
+        aclose: Callable[[], Awaitable[None]],
+        state: _TeeState[T],
+    ):
+        self.source = source
+        self.aclose = aclose
+        self.state = state
+        self._condition: Optional[asyncio.Condition] = None
+        self._reader: Optional["asyncio.Future[None]"] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        # Created on first use so that it binds to the running loop.
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def next(self, consumer: int) -> T:
+        state = self.state
+        condition = self.condition
+        async with condition:
+            while True:
+                event = state.take(consumer)
+                if event is _END:
+                    raise StopAsyncIteration
+                if event is not _EMPTY:
+                    condition.notify_all()
+                    return event
+                if state.can_read():
+                    # The upstream is read in a task of its own, so cancelling
+                    # a waiting consumer never cancels the shared read.
+                    state.reading = True
+                    self._reader = asyncio.ensure_future(self._read())
+                await condition.wait()
+
+    async def _read(self) -> None:
+        state = self.state
+        condition = self.condition
+        try:
+            event = await self.source.__anext__()
+        except StopAsyncIteration:
+            async with condition:
+                state.done = True
+                state.reading = False
+                condition.notify_all()
+            return
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            async with condition:
+                state.error = e
+                state.reading = False
+                condition.notify_all()
+            return
+        except BaseException:
+            # Only cancelled when the tee is closed or the loop shuts down.
+            state.error = errors.StreamInterruptedError()
+            state.reading = False
+            async with condition:
+                condition.notify_all()
+            raise
+
+        async with condition:
+            state.buffer.append(event)
+            state.reading = False
+            state.trim()
+            condition.notify_all()
+
+    async def release(self, consumer: int) -> None:
+        condition = self.condition
+        async with condition:
+            last = self.state.release(consumer)
+            condition.notify_all()
+        if last:
+            reader = self._reader
+            if reader is not None and not reader.done():
+                reader.cancel()
+                await asyncio.wait([reader])
+            await self.aclose()
+
+
+class TeeStream(Generic[T]):
+    r"""One consumer's cursor over a stream shared through `EventStream.tee()`."""
+
+    def __init__(self, shared: _Tee[T], consumer: int):
+        self._tee = shared
+        self._consumer = consumer
+
+    @property
+    def detached(self) -> bool:
+        return self._consumer in self._tee.state.detached
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> T:
+        return self._tee.next(self._consumer)
+
+    def close(self):
+        r"""Stops consuming. The upstream is closed with its last consumer."""
+        self._tee.release(self._consumer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TeeStreamAsync(Generic[T]):
+    r"""One consumer's cursor over a stream shared through `EventStreamAsync.tee()`."""
+
+    def __init__(self, shared: _TeeAsync[T], consumer: int):
+        self._tee = shared
+        self._consumer = consumer
+
+    @property
+    def detached(self) -> bool:
+        return self._consumer in self._tee.state.detached
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._tee.next(self._consumer)
+
+    async def aclose(self):
+        r"""Stops consuming. The upstream is closed with its last consumer."""
+        await self._tee.release(self._consumer)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+def tee(
+    source: Iterator[T],
+    close: Callable[[], None],
+    consumers: int,
+    max_buffered: int,
+    overflow: Overflow,
+) -> List[TeeStream[T]]:
+    shared = _Tee(source, close, _TeeState(consumers, max_buffered, overflow))
+    return [TeeStream(shared, i) for i in range(consumers)]
+
+
+def tee_async(
+    source: AsyncIterator[T],
+    aclose: Callable[[], Awaitable[None]],
+    consumers: int,
+    max_buffered: int,
+    overflow: Overflow,
+) -> List[TeeStreamAsync[T]]:
+    shared = _TeeAsync(source, aclose, _TeeState(consumers, max_buffered, overflow))
+    return [TeeStreamAsync(shared, i) for i in range(consumers)]
@@ -0,0 +1,162 @@
+import random
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .logger import Logger, NoOpLogger
+from .sinks import Sink, publish_to_sink
+
+TraceSink = Sink["RequestTrace"]
+
+
+class TraceConfig:
+    r"""Where request traces are published and how much of the bodies they keep.
+
+    Traces never include headers or query strings, so credentials are not
+    recorded. Bodies are only copied into a trace for the sampled fraction
+    `body_sample_rate` of requests, and then only their first `body_limit`
+    bytes.
+    """
+
+    sink: TraceSink
+    body_sample_rate: float
+    body_limit: int
+
+    def __init__(
+        self, sink: TraceSink, body_sample_rate: float = 0.0, body_limit: int = 1024
+    ):
+        self.sink = sink
+        self.body_sample_rate = body_sample_rate
+        self.body_limit = body_limit
+
+
+class RequestTrace:
+    r"""Structured record of a single operation call.
+
+    Timestamps are `time.perf_counter()` values in seconds. `attempts` counts
+    every request sent, retries and resends with refreshed credentials
+    included, while the other fields describe the last attempt. For streamed
+    responses `response_bytes` is the `Content-Length`, if any, and
+    `response_received` is when the headers arrived. The trace is published
+    to the sink once, when the call returns or raises, through
+    `publish_to_sink`.
+    """
+
+    operation_id: str
+    method: Optional[str]
+    url: Optional[str]
+    status_code: Optional[int]
+    attempts: int
+    request_bytes: Optional[int]
+    response_bytes: Optional[int]
+    started: float
+    request_sent: Optional[float]
+    response_received: Optional[float]
+    finished: Optional[float]
+    error: Optional[str]
+    sampled: bool
+    request_body: Optional[str]
+    response_body: Optional[str]
+
+    def __init__(
+        self,
+        operation_id: str,
+        config: TraceConfig,
+        logger: Optional[Logger] = None,
+    ):
+        self.operation_id = operation_id
+        self.config = config
+        self.logger = logger if logger is not None else NoOpLogger()
+        self.method = None
+        self.url = None
+        self.status_code = None
+        self.attempts = 0
+        self.request_bytes = None
+        self.response_bytes = None
+        self.started = time.perf_counter()
+        self.request_sent = None
+        self.response_received = None
+        self.finished = None
+        self.error = None
+        self.sampled = random.random() < config.body_sample_rate
+        self.request_body = None
+        self.response_body = None
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        r"""Seconds from the start of the call to its end."""
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+    @property
+    def latency(self) -> Optional[float]:
+        r"""Seconds from sending the last attempt to receiving its response."""
+        if self.request_sent is None or self.response_received is None:
+            return None
+        return self.response_received - self.request_sent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operation_id": self.operation_id,
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "attempts": self.attempts,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "elapsed": self.elapsed,
+            "latency": self.latency,
+            "error": self.error,
+            "request_body": self.request_body,
+            "response_body": self.response_body,
+        }
+
+    def send(self, request: httpx.Request) -> None:
+        self.attempts += 1
+        self.method = request.method
+        self.url = str(request.url.copy_with(query=None))
+        self.status_code = None
+        self.response_bytes = None
+        self.response_received = None
+        if hasattr(request, "_content"):
+            content = request.content
+            self.request_bytes = len(content)
+            if self.sampled:
+                self.request_body = self._truncate(content)
+        else:
+            self.request_bytes = _content_length(request.headers)
+        self.request_sent = time.perf_counter()
+
+    def receive(self, response: httpx.Response, stream: bool) -> None:
+        self.response_received = time.perf_counter()
+        self.status_code = response.status_code
+        if stream:
+            self.response_bytes = _content_length(response.headers)
+            return
+
+        content = response.content
+        self.response_bytes = len(content)
+        if self.sampled:
+            self.response_body = self._truncate(content)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        if self.finished is not None:
+            return
+        self.finished = time.perf_counter()
+        if error is not None:
+            self.error = type(error).__name__
+        publish_to_sink(self.config.sink, self, self.logger, "request trace")
+
+    def _truncate(self, content: bytes) -> str:
+        limit = self.config.body_limit
+        text = content[:limit].decode("utf-8", errors="replace")
+        if len(content) > limit:
+            text += f"... ({len(content) - limit} more bytes)"
+        return text
+
+
+def _content_length(headers: httpx.Headers) -> Optional[int]:
+    value = headers.get("content-length")
+    return int(value) if value is not None and value.isdigit() else None
@@ -0,0 +1,90 @@
+import importlib.util
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+
+class TransportConfig:
+    r"""Connection pool, protocol and timeout settings for the SDK's HTTP clients.
+
+    The pool settings are applied when `Sudo` creates its own clients, and
+    are ignored for clients passed in. httpx pools connections per client
+    rather than per host, so with every request going to the one API host
+    `max_connections` is also the per-host limit. `http2` needs the `h2`
+    package, installed with the `http2` extra.
+
+    The timeouts apply to every request, including those sent through
+    supplied clients. Each one left as None falls back to the operation's
+    `timeout_ms`, and to no timeout when that is not set either.
+    """
+
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    keepalive_expiry_ms: Optional[int]
+    http2: bool
+    connect_timeout_ms: Optional[int]
+    read_timeout_ms: Optional[int]
+    write_timeout_ms: Optional[int]
+    pool_timeout_ms: Optional[int]
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry_ms: Optional[int] = 5000,
+        http2: bool = False,
+        connect_timeout_ms: Optional[int] = None,
+        read_timeout_ms: Optional[int] = None,
+        write_timeout_ms: Optional[int] = None,
+        pool_timeout_ms: Optional[int] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_ms = keepalive_expiry_ms
+        self.http2 = http2
+        self.connect_timeout_ms = connect_timeout_ms
+        self.read_timeout_ms = read_timeout_ms
+        self.write_timeout_ms = write_timeout_ms
+        self.pool_timeout_ms = pool_timeout_ms
+
+    def get_client_options(self) -> Dict[str, Any]:
+        r"""Keyword arguments for `httpx.Client` and `httpx.AsyncClient`."""
+        # The clients are created on first use, so check for h2 up front.
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True needs the h2 package, "
+                'install it with `pip install "sudo-ai[http2]"`'
+            )
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=_seconds(self.keepalive_expiry_ms),
+            ),
+            "http2": self.http2,
+        }
+
+    def get_timeout(
+        self, timeout_ms: Optional[int]
+    ) -> Union[httpx.Timeout, float, None]:
+        r"""The request timeout for an operation called with `timeout_ms`."""
+        timeout = _seconds(timeout_ms)
+        phases = {
+            "connect": self.connect_timeout_ms,
+            "read": self.read_timeout_ms,
+            "write": self.write_timeout_ms,
+            "pool": self.pool_timeout_ms,
+        }
+        overrides = {
+            phase: _seconds(value)
+            for phase, value in phases.items()
+            if value is not None
+        }
+        if not overrides:
+            return timeout
+        return httpx.Timeout(timeout, **overrides)
+
+
+def _seconds(ms: Optional[int]) -> Optional[float]:
+    return ms / 1000 if ms is not None else None
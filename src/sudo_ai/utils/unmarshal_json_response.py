@@ -1,6 +1,6 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import httpx
 
@@ -9,10 +9,12 @@ from sudo_ai import errors
 
 
 def unmarshal_json_response(
-    typ: Any, http_res: httpx.Response, body: Optional[str] = None
+    typ: Any, http_res: httpx.Response, body: Optional[Union[str, bytes]] = None
 ) -> Any:
+    # JSON bodies are UTF-8, so they are validated straight from the bytes
+    # without decoding them to a str first.
     if body is None:
-        body = http_res.text
+        body = http_res.content
     try:
         return unmarshal_json(body, typ)
     except Exception as e:
@@ -20,5 +22,5 @@ def unmarshal_json_response(
             "Response validation failed",
             http_res,
             e,
-            body,
+            body if isinstance(body, str) else None,
         ) from e
@@ -4,7 +4,6 @@ from decimal import Decimal
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
     Union,
@@ -12,11 +11,11 @@ from typing import (
     get_origin,
 )
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     PathParamMetadata,
-    find_field_metadata,
+    get_field_types,
+    get_fields_metadata,
 )
 from .values import (
     _get_serialized_params,
@@ -57,18 +56,11 @@ def _populate_path_params(
     if not isinstance(path_params, BaseModel):
         return globals_already_populated
 
-    path_param_fields: Dict[str, FieldInfo] = path_params.__class__.model_fields
-    path_param_field_types = get_type_hints(path_params.__class__)
-    for name in path_param_fields:
+    path_param_fields = get_fields_metadata(path_params.__class__, PathParamMetadata)
+    for name, f_name, param_metadata in path_param_fields:
         if name in skip_fields:
             continue
 
-        field = path_param_fields[name]
-
-        param_metadata = find_field_metadata(field, PathParamMetadata)
-        if param_metadata is None:
-            continue
-
         param = getattr(path_params, name) if _is_set(path_params) else None
         param, global_found = _populate_from_globals(
             name, param, PathParamMetadata, gbls
@@ -79,63 +71,66 @@ def _populate_path_params(
         if not _is_set(param):
             continue
 
-        f_name = field.alias if field.alias is not None else name
-        serialization = param_metadata.serialization
-        if serialization is not None:
-            serialized_params = _get_serialized_params(
-                param_metadata, f_name, param, path_param_field_types[name]
-            )
-            for key, value in serialized_params.items():
-                path_param_values[key] = value
-        else:
-            pp_vals: List[str] = []
-            if param_metadata.style == "simple":
-                if isinstance(param, List):
-                    for pp_val in param:
-                        if not _is_set(pp_val):
-                            continue
-                        pp_vals.append(_val_to_string(pp_val))
-                    path_param_values[f_name] = ",".join(pp_vals)
-                elif isinstance(param, Dict):
-                    for pp_key in param:
-                        if not _is_set(param[pp_key]):
-                            continue
-                        if param_metadata.explode:
-                            pp_vals.append(f"{pp_key}={_val_to_string(param[pp_key])}")
-                        else:
-                            pp_vals.append(f"{pp_key},{_val_to_string(param[pp_key])}")
-                    path_param_values[f_name] = ",".join(pp_vals)
-                elif not isinstance(param, (str, int, float, complex, bool, Decimal)):
-                    param_fields: Dict[str, FieldInfo] = param.__class__.model_fields
-                    for name in param_fields:
-                        param_field = param_fields[name]
-
-                        param_value_metadata = find_field_metadata(
-                            param_field, PathParamMetadata
-                        )
-                        if param_value_metadata is None:
-                            continue
+        _populate_path_param(
+            param_metadata,
+            f_name,
+            param,
+            get_field_types(path_params.__class__)[name],
+            path_param_values,
+        )
 
-                        param_name = (
-                            param_field.alias if param_field.alias is not None else name
-                        )
+    return globals_already_populated
 
-                        param_field_val = getattr(param, name)
-                        if not _is_set(param_field_val):
-                            continue
-                        if param_metadata.explode:
-                            pp_vals.append(
-                                f"{param_name}={_val_to_string(param_field_val)}"
-                            )
-                        else:
-                            pp_vals.append(
-                                f"{param_name},{_val_to_string(param_field_val)}"
-                            )
-                    path_param_values[f_name] = ",".join(pp_vals)
-                elif _is_set(param):
-                    path_param_values[f_name] = _val_to_string(param)
 
-    return globals_already_populated
+def _populate_path_param(
+    param_metadata: PathParamMetadata,
+    f_name: str,
+    param: Any,
+    field_type: Any,
+    path_param_values: Dict[str, str],
+):
+    serialization = param_metadata.serialization
+    if serialization is not None:
+        serialized_params = _get_serialized_params(
+            param_metadata, f_name, param, field_type
+        )
+        for key, value in serialized_params.items():
+            path_param_values[key] = value
+    else:
+        pp_vals: List[str] = []
+        if param_metadata.style == "simple":
+            if isinstance(param, List):
+                for pp_val in param:
+                    if not _is_set(pp_val):
+                        continue
+                    pp_vals.append(_val_to_string(pp_val))
+                path_param_values[f_name] = ",".join(pp_vals)
+            elif isinstance(param, Dict):
+                for pp_key in param:
+                    if not _is_set(param[pp_key]):
+                        continue
+                    if param_metadata.explode:
+                        pp_vals.append(f"{pp_key}={_val_to_string(param[pp_key])}")
+                    else:
+                        pp_vals.append(f"{pp_key},{_val_to_string(param[pp_key])}")
+                path_param_values[f_name] = ",".join(pp_vals)
+            elif not isinstance(param, (str, int, float, complex, bool, Decimal)):
+                param_fields = get_fields_metadata(param.__class__, PathParamMetadata)
+                for name, param_name, _ in param_fields:
+                    param_field_val = getattr(param, name)
+                    if not _is_set(param_field_val):
+                        continue
+                    if param_metadata.explode:
+                        pp_vals.append(
+                            f"{param_name}={_val_to_string(param_field_val)}"
+                        )
+                    else:
+                        pp_vals.append(
+                            f"{param_name},{_val_to_string(param_field_val)}"
+                        )
+                path_param_values[f_name] = ",".join(pp_vals)
+            elif _is_set(param):
+                path_param_values[f_name] = _val_to_string(param)
 
 
 def is_optional(field):
@@ -0,0 +1,295 @@
+"""
+Offline tests for the stream accumulators in sudo_ai.utils.accumulators.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_accumulators.py -v
+"""
+
+import asyncio
+import json
+
+from sudo_ai import models, utils
+from sudo_ai.utils.eventstreaming import RawEvent, ServerEvent
+
+
+def chunk_data(choices, **extra):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": choices,
+        **extra,
+    }
+
+
+def raw_event(data) -> RawEvent:
+    event = ServerEvent()
+    event.data = json.dumps(data).encode()
+    return RawEvent(
+        event, lambda e: utils.unmarshal_event(e, models.ChatCompletionChunk)
+    )
+
+
+def typed_chunk(data) -> models.ChatCompletionChunk:
+    return models.ChatCompletionChunk(data=data)
+
+
+class TestChatCompletionAccumulator:
+    """Test rebuilding a ChatCompletion from chunks."""
+
+    def test_content_from_typed_chunks(self):
+        accumulator = utils.ChatCompletionAccumulator()
+        chunks = [
+            typed_chunk(chunk_data([{"index": 0, "delta": {"role": "assistant"}}])),
+            typed_chunk(chunk_data([{"index": 0, "delta": {"content": "Hel"}}])),
+            typed_chunk(chunk_data([{"index": 0, "delta": {"content": "lo"}}])),
+            typed_chunk(
+                chunk_data(
+                    [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                    usage={
+                        "prompt_tokens": 3,
+                        "completion_tokens": 2,
+                        "total_tokens": 5,
+                    },
+                )
+            ),
+        ]
+
+        assert list(accumulator.attach(chunks)) == chunks
+        completion = accumulator.completion()
+
+        assert isinstance(completion, models.ChatCompletion)
+        assert completion.id == "chatcmpl-1"
+        assert completion.object == "chat.completion"
+        assert completion.choices[0].message.content == "Hello"
+        assert completion.choices[0].message.role == "assistant"
+        assert completion.choices[0].finish_reason == "stop"
+        assert completion.usage.total_tokens == 5
+
+    def test_partial_state(self):
+        accumulator = utils.ChatCompletionAccumulator()
+        accumulator.add(
+            raw_event(chunk_data([{"index": 0, "delta": {"content": "a"}}]))
+        )
+        assert accumulator.content() == "a"
+        assert accumulator.finish_reason() is None
+
+        accumulator.add(
+            raw_event(chunk_data([{"index": 0, "delta": {"content": "b"}}]))
+        )
+        completion = accumulator.completion()
+
+        assert accumulator.content() == "ab"
+        assert completion.choices[0].finish_reason == ""
+        assert completion.usage.total_tokens == 0
+
+    def test_tool_call_fragments_and_multiple_choices(self):
+        """OpenAI style fragments are merged by index, per choice."""
+        accumulator = utils.ChatCompletionAccumulator()
+        fragments = [
+            [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_a",
+                                "type": "function",
+                                "function": {"name": "lookup", "arguments": ""},
+                            }
+                        ]
+                    },
+                },
+                {"index": 1, "delta": {"content": "second"}},
+            ],
+            [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '{"q": '}},
+                            {
+                                "index": 1,
+                                "id": "call_b",
+                                "function": {"name": "other", "arguments": "{}"},
+                            },
+                        ]
+                    },
+                }
+            ],
+            [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [{"index": 0, "function": {"arguments": '"x"}'}}]
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ],
+        ]
+        for choices in fragments:
+            accumulator.add(raw_event(chunk_data(choices)))
+
+        completion = accumulator.completion()
+        first, second = completion.choices
+
+        assert [call.id for call in first.message.tool_calls] == ["call_a", "call_b"]
+        assert first.message.tool_calls[0].function.name == "lookup"
+        assert first.message.tool_calls[0].function.arguments == '{"q": "x"}'
+        assert first.message.tool_calls[1].function.arguments == "{}"
+        assert first.message.content is None
+        assert first.finish_reason == "tool_calls"
+        assert second.index == 1
+        assert second.message.content == "second"
+
+    def test_attach_async(self):
+        async def stream():
+            for text in ("x", "y", "z"):
+                yield raw_event(chunk_data([{"index": 0, "delta": {"content": text}}]))
+
+        async def consume(accumulator):
+            return [chunk async for chunk in accumulator.attach_async(stream())]
+
+        accumulator = utils.ChatCompletionAccumulator()
+        assert len(asyncio.run(consume(accumulator))) == 3
+        assert accumulator.completion().choices[0].message.content == "xyz"
+
+
+RESPONSE = {
+    "id": "resp_1",
+    "object": "response",
+    "created_at": 1700000000,
+    "model": "gpt-4o",
+    "status": "in_progress",
+    "output": [],
+}
+
+
+def response_events():
+    message = {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "status": "in_progress",
+        "content": [],
+    }
+    call = {
+        "id": "fc_1",
+        "type": "function_call",
+        "call_id": "call_1",
+        "name": "lookup",
+        "arguments": "",
+        "status": "in_progress",
+    }
+    part = {"type": "output_text", "text": "", "annotations": []}
+    events = [
+        {"type": "response.created", "response": RESPONSE},
+        {"type": "response.output_item.added", "output_index": 0, "item": message},
+        {
+            "type": "response.content_part.added",
+            "output_index": 0,
+            "content_index": 0,
+            "part": part,
+        },
+        {
+            "type": "response.output_text.delta",
+            "output_index": 0,
+            "content_index": 0,
+            "delta": "Hel",
+        },
+        {
+            "type": "response.output_text.delta",
+            "output_index": 0,
+            "content_index": 0,
+            "delta": "lo",
+        },
+        {"type": "response.output_item.added", "output_index": 1, "item": call},
+        {
+            "type": "response.function_call_arguments.delta",
+            "output_index": 1,
+            "delta": '{"q":',
+        },
+        {
+            "type": "response.function_call_arguments.delta",
+            "output_index": 1,
+            "delta": ' "x"}',
+        },
+    ]
+    return [dict(event, sequence_number=i) for i, event in enumerate(events)]
+
+
+class TestResponseAccumulator:
+    """Test rebuilding a Response from streaming events."""
+
+    def test_snapshot_before_completion(self):
+        accumulator = utils.ResponseAccumulator()
+        for event in response_events():
+            accumulator.add(event)
+
+        response = accumulator.response()
+
+        assert isinstance(response, models.Response)
+        assert not accumulator.completed
+        assert accumulator.text() == "Hello"
+        assert response.output[0].content[0].text == "Hello"
+        assert response.output[1].arguments == '{"q": "x"}'
+
+    def test_out_of_order_and_repeated_events(self):
+        events = response_events()
+        shuffled = [events[0], events[1], events[4], events[3], events[3], events[2]]
+        shuffled += events[5:] + [events[6]]
+
+        accumulator = utils.ResponseAccumulator()
+        for event in shuffled:
+            accumulator.add(event)
+
+        assert accumulator.text() == "Hello"
+        assert accumulator.response().output[1].arguments == '{"q": "x"}'
+
+    def test_completed_response_is_final(self):
+        events = response_events()
+        completed = dict(
+            RESPONSE,
+            status="completed",
+            output=[
+                {
+                    "id": "msg_1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [
+                        {"type": "output_text", "text": "Hello", "annotations": []}
+                    ],
+                }
+            ],
+        )
+        events.append(
+            {
+                "type": "response.completed",
+                "sequence_number": len(events),
+                "response": completed,
+            }
+        )
+
+        accumulator = utils.ResponseAccumulator()
+        typed = [models.ResponseEvent(data=event) for event in events]
+        assert list(accumulator.attach(typed)) == typed
+
+        response = accumulator.response()
+        assert accumulator.completed
+        assert response.status == "completed"
+        assert len(response.output) == 1
+        assert accumulator.response() is response
+
+    def test_events_are_not_modified(self):
+        events = response_events()
+        accumulator = utils.ResponseAccumulator()
+        for event in events:
+            accumulator.add(event)
+        accumulator.response()
+
+        assert events[1]["item"]["content"] == []
+        assert events[2]["part"]["text"] == ""
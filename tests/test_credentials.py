@@ -0,0 +1,232 @@
+"""
+Offline tests for utils.CredentialProvider and callable api_key handling.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_credentials.py -v
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, errors, models, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+ERROR = {"error": {"message": "invalid api key", "type": "auth"}}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class KeySource:
+    """Callable api_key returning key-1, key-2, ... on successive calls."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        time.sleep(self.delay)
+        self.calls += 1
+        return f"key-{self.calls}"
+
+
+def handler(requests, valid=lambda key: True):
+    def handle(request):
+        requests.append(request.headers["Authorization"])
+        if not valid(request.headers["Authorization"]):
+            return httpx.Response(401, json=ERROR)
+        return httpx.Response(200, json=COMPLETION)
+
+    return handle
+
+
+def create_sdk(api_key, requests, asynchronous=False, ttl_ms=300000, **kwargs):
+    transport = httpx.MockTransport(handler(requests, **kwargs))
+    if asynchronous:
+        return Sudo(
+            server_url="http://sse.test",
+            api_key=api_key,
+            async_client=httpx.AsyncClient(transport=transport),
+            api_key_ttl_ms=ttl_ms,
+        )
+    return Sudo(
+        server_url="http://sse.test",
+        api_key=api_key,
+        client=httpx.Client(transport=transport),
+        api_key_ttl_ms=ttl_ms,
+    )
+
+
+class TestCredentialProvider:
+    """Test caching and refreshing of the resolved headers."""
+
+    def test_headers_are_cached_for_the_ttl(self):
+        source = KeySource()
+        provider = utils.CredentialProvider(
+            lambda: models.Security(api_key=source()), models.Security, 60000
+        )
+
+        assert provider.get() == ({"Authorization": "Bearer key-1"}, {})
+        assert provider.get() == ({"Authorization": "Bearer key-1"}, {})
+        assert provider().api_key == "key-1"
+        assert source.calls == 1
+
+        provider.refresh()
+
+        assert provider.get()[0] == {"Authorization": "Bearer key-2"}
+
+    def test_expired_headers_are_refreshed(self):
+        source = KeySource()
+        provider = utils.CredentialProvider(
+            lambda: models.Security(api_key=source()), models.Security, 20
+        )
+        provider.get()
+        time.sleep(0.03)
+
+        assert provider.get()[0] == {"Authorization": "Bearer key-2"}
+
+    def test_concurrent_callers_refresh_once(self):
+        source = KeySource(delay=0.05)
+        provider = utils.CredentialProvider(
+            lambda: models.Security(api_key=source()), models.Security, 60000
+        )
+        threads = [threading.Thread(target=provider.get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert source.calls == 1
+
+    def test_reauthorize(self):
+        source = KeySource()
+        provider = utils.CredentialProvider(
+            lambda: models.Security(api_key=source()), models.Security, 60000
+        )
+        sent = httpx.Headers(provider.get()[0])
+
+        assert provider.reauthorize(sent) == {"Authorization": "Bearer key-2"}
+        # A second request rejected with key-1 reuses the refreshed headers.
+        assert provider.reauthorize(sent) == {"Authorization": "Bearer key-2"}
+        assert source.calls == 2
+
+    def test_reauthorize_with_unchanged_credentials(self):
+        provider = utils.CredentialProvider(
+            lambda: models.Security(api_key="same"), models.Security, 60000
+        )
+
+        assert provider.reauthorize(httpx.Headers(provider.get()[0])) is None
+
+
+class TestCallableApiKey:
+    """Test callable api_key values passed to Sudo."""
+
+    def test_called_once_per_ttl(self):
+        source, requests = KeySource(), []
+        sdk = create_sdk(source, requests)
+        for _ in range(3):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert requests == ["Bearer key-1"] * 3
+        assert source.calls == 1
+
+    def test_called_for_every_request_by_default(self):
+        source, requests = KeySource(), []
+        transport = httpx.MockTransport(handler(requests))
+        sdk = Sudo(
+            server_url="http://sse.test",
+            api_key=source,
+            client=httpx.Client(transport=transport),
+        )
+        for _ in range(2):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert requests == ["Bearer key-1", "Bearer key-2"]
+
+    def test_hooks_receive_the_security_callable(self):
+        sources = []
+
+        class Hook:
+            def before_request(self, hook_ctx, request):
+                sources.append(hook_ctx.security_source)
+                return request
+
+        source, requests = KeySource(), []
+        sdk = create_sdk(source, requests)
+        sdk.sdk_configuration.__dict__["_hooks"].register_before_request_hook(Hook())
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert not isinstance(sources[0], utils.CredentialProvider)
+        assert sources[0]() == models.Security(api_key="key-2")
+
+    def test_401_refreshes_and_resends_once(self):
+        source, requests = KeySource(), []
+        sdk = create_sdk(source, requests, valid=lambda key: key != "Bearer key-1")
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert requests == ["Bearer key-1", "Bearer key-2"]
+
+    def test_env_key_does_not_override(self, monkeypatch):
+        monkeypatch.setenv("SUDO_API_KEY", "env-key")
+        source, requests = KeySource(), []
+        sdk = create_sdk(source, requests)
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert requests == ["Bearer key-1"]
+
+    def test_401_with_rejected_refresh_raises(self):
+        source, requests = KeySource(), []
+        sdk = create_sdk(source, requests, valid=lambda key: False)
+
+        with pytest.raises(errors.ErrorResponse):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+        assert requests == ["Bearer key-1", "Bearer key-2"]
+
+    def test_async_refreshes_in_background(self):
+        source, requests = KeySource(delay=0.2), []
+        sdk = create_sdk(source, requests, asynchronous=True)
+        provider = sdk.sdk_configuration.security
+
+        async def run():
+            await sdk.router.create_async(messages=MESSAGES, model="gpt-4o")
+            # Move into the refresh-ahead window of the TTL.
+            provider._resolved.expires_at = time.monotonic() + 1
+            start = time.perf_counter()
+            await sdk.router.create_async(messages=MESSAGES, model="gpt-4o")
+            elapsed = time.perf_counter() - start
+            await provider._refreshing
+            await sdk.router.create_async(messages=MESSAGES, model="gpt-4o")
+            return elapsed
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed < 0.1
+        assert requests == ["Bearer key-1", "Bearer key-1", "Bearer key-2"]
+
+    def test_async_401_refreshes_and_resends_once(self):
+        source, requests = KeySource(), []
+        sdk = create_sdk(
+            source,
+            requests,
+            asynchronous=True,
+            valid=lambda key: key != "Bearer key-1",
+        )
+
+        asyncio.run(sdk.router.create_async(messages=MESSAGES, model="gpt-4o"))
+
+        assert requests == ["Bearer key-1", "Bearer key-2"]
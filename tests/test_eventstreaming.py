@@ -0,0 +1,194 @@
+"""
+Offline tests for the server-sent event handling in sudo_ai.utils.eventstreaming.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_eventstreaming.py -v
+"""
+
+import json
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from sudo_ai import models, utils
+from sudo_ai.utils.eventstreaming import (
+    EventStream,
+    RawEvent,
+    ServerEvent,
+    str_decoder,
+    stream_events,
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for httpx.Response that yields pre-split chunks."""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self.chunks = [
+            data[i : i + chunk_size] for i in range(0, len(data), chunk_size)
+        ]
+
+    def iter_bytes(self):
+        return iter(self.chunks)
+
+
+def collect(data: bytes, chunk_size: int, sentinel=None):
+    response = FakeResponse(data, chunk_size)
+    return [
+        dict(vars(event))
+        for event in stream_events(response, lambda event: event, sentinel)
+    ]
+
+
+class TestEventParser:
+    """Test splitting byte streams into events."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+    def test_chunking_does_not_change_events(self, chunk_size, newline):
+        """Events are identical however the stream is split into chunks."""
+        stream = newline.join(
+            [
+                b": keep-alive",
+                b"",
+                b"id: 1",
+                b'data: {"text": "caf\xc3\xa9"}',
+                b"",
+                b"event: message",
+                b"data: line one",
+                b"data: line two",
+                b"",
+                b"retry: 1500",
+                b"data: 42",
+                b"",
+                b"",
+            ]
+        )
+
+        events = collect(stream, chunk_size)
+
+        assert events == [
+            {"id": "1", "data": b'{"text": "caf\xc3\xa9"}'},
+            {"event": "message", "data": b"line one\nline two"},
+            {"retry": 1500, "data": b"42"},
+        ]
+
+    def test_sentinel_stops_processing(self):
+        """Nothing after the sentinel event is decoded."""
+        stream = b"data: 1\n\ndata: [DONE]\n\ndata: 2\n\n"
+
+        assert collect(stream, 5, sentinel="[DONE]") == [{"data": b"1"}]
+
+    def test_trailing_event_without_boundary(self):
+        """An event that is not terminated by a blank line is still emitted."""
+        assert collect(b"data: 1\n\ndata: 2", 3) == [{"data": b"1"}, {"data": b"2"}]
+
+
+class TestEventDecoding:
+    """Test decoding events into models."""
+
+    def test_chunk_is_validated_from_raw_data(self):
+        """The data bytes are validated straight into the model."""
+        event = ServerEvent()
+        event.id = "7"
+        event.data = (
+            b'{"id": "c1", "object": "chat.completion.chunk", "created": 1,'
+            b' "model": "gpt-4o", "choices": [{"index": 0, "delta": {"content": "Hi"}}]}'
+        )
+
+        chunk = utils.unmarshal_event(event, models.ChatCompletionChunk)
+
+        assert isinstance(chunk, models.ChatCompletionChunk)
+        assert chunk.data.choices[0].delta.content == "Hi"
+
+    def test_invalid_json_data_is_passed_as_string(self):
+        """Data that only looks like JSON is validated as a plain string."""
+        event = ServerEvent()
+        event.data = b"{not json"
+
+        with pytest.raises(Exception) as exc_info:
+            utils.unmarshal_event(event, models.ResponseEvent)
+
+        assert "{not json" in str(exc_info.value)
+
+    def test_trailing_data_does_not_override_event_fields(self):
+        """Data holding more than one JSON value is kept as a string."""
+
+        class Envelope(BaseModel):
+            event: str
+            data: Any
+
+        event = ServerEvent()
+        event.event = "message"
+        event.data = b'{"a":1},"event":"x"'
+
+        decoded = utils.unmarshal_event(event, Envelope)
+
+        assert decoded.event == "message"
+        assert decoded.data == '{"a":1},"event":"x"'
+
+
+class TestStrDecoder:
+    """Test adapting decoders written for the JSON string of an event."""
+
+    def test_decoder_receives_the_event_as_a_json_string(self):
+        received = []
+        stream = EventStream(
+            FakeResponse(b'id: 1\ndata: {"a": 1}\n\ndata: hi\n\n', 7),
+            str_decoder(lambda text: received.append(text) or len(received)),
+        )
+
+        assert list(stream) == [1, 2]
+        assert [json.loads(text) for text in received] == [
+            {"id": "1", "data": {"a": 1}},
+            {"data": "hi"},
+        ]
+
+
+class TestRawMode:
+    """Test EventStream.raw() and RawEvent."""
+
+    STREAM = (
+        b'data: {"id": "c1", "object": "chat.completion.chunk", "created": 1,'
+        b' "model": "gpt-4o", "choices": [{"index": 0, "delta": {"content": "Hi"}}]}'
+        b"\n\ndata: [DONE]\n\n"
+    )
+
+    @staticmethod
+    def decoder(event):
+        return utils.unmarshal_event(event, models.ChatCompletionChunk)
+
+    def test_raw_events_are_not_validated(self):
+        """Raw mode yields RawEvents and only validates on request."""
+        calls = []
+
+        def decoder(event):
+            calls.append(event)
+            return self.decoder(event)
+
+        stream = EventStream(FakeResponse(self.STREAM, 32), decoder, "[DONE]")
+        events = list(stream.raw())
+
+        assert len(events) == 1
+        assert isinstance(events[0], RawEvent)
+        assert events[0].data["choices"][0]["delta"]["content"] == "Hi"
+        assert events[0].raw_data.startswith(b'{"id": "c1"')
+        assert calls == []
+
+        chunk = events[0].validate()
+        assert isinstance(chunk, models.ChatCompletionChunk)
+        assert chunk.data.choices[0].delta.content == "Hi"
+        assert events[0].validate() is chunk
+        assert len(calls) == 1
+
+    def test_non_json_data_is_returned_as_string(self):
+        event = ServerEvent()
+        event.event = "ping"
+        event.data = b"keep-alive"
+
+        raw = RawEvent(event, self.decoder)
+
+        assert raw.event == "ping"
+        assert raw.data == "keep-alive"
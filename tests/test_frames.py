@@ -0,0 +1,159 @@
+"""
+Offline tests for forwarding raw SSE frames with EventStream.frames().
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_frames.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from sudo_ai import Sudo
+from sudo_ai.utils.eventstreaming import EventStream, EventStreamAsync
+
+SERVER_URL = "http://sse.test"
+
+
+def chunk_event(i: int, usage=None) -> bytes:
+    data = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": f"{i} "}}],
+        "usage": usage,
+    }
+    return f"data: {json.dumps(data)}\n\n".encode()
+
+
+USAGE = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+BODY = [chunk_event(0), chunk_event(1), chunk_event(2, USAGE), b"data: [DONE]\n\n"]
+
+
+class FakeResponse:
+    """Stand-in for httpx.Response that sends the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def iter_bytes(self):
+        yield from self.chunks
+
+    async def aiter_bytes(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+
+def frames_of(chunks, sentinel="[DONE]"):
+    return [
+        bytes(f) for f in EventStream(FakeResponse(chunks), None, sentinel).frames()
+    ]
+
+
+class TestFrames:
+    """Test splitting the response into raw frames without decoding."""
+
+    def test_frames_are_forwarded_unchanged(self):
+        assert frames_of(BODY) == BODY
+
+    def test_frames_within_a_chunk_are_not_copied(self):
+        body = b"".join(BODY)
+        frames = list(EventStream(FakeResponse([body]), None, "[DONE]").frames())
+
+        assert all(isinstance(frame, memoryview) for frame in frames)
+        assert all(frame.obj is body for frame in frames)
+        assert b"".join(frames) == body
+
+    def test_any_chunking_gives_the_same_frames(self):
+        body = b"".join(BODY)
+        for size in (1, 2, 3, 7, 64):
+            chunks = [body[i : i + size] for i in range(0, len(body), size)]
+            assert frames_of(chunks) == BODY
+
+    def test_carriage_return_boundaries(self):
+        body = [b"data: a\r\n\r\n", b"data: b\r\r", b"data: c\n\n"]
+        chunks = [b"data: a\r\n", b"\r\ndata: b\r", b"\rdata: c\n\n"]
+
+        assert frames_of(chunks) == body
+
+    def test_comments_are_forwarded(self):
+        body = [b": keep-alive\n\n", chunk_event(0)]
+
+        assert frames_of(body) == body
+
+    def test_data_after_the_sentinel_is_dropped(self):
+        assert frames_of(BODY + [chunk_event(3)]) == BODY
+
+    def test_trailing_frame_without_boundary(self):
+        assert frames_of([b"data: a\n\ndata: b"], sentinel=None) == [
+            b"data: a\n\n",
+            b"data: b",
+        ]
+
+    def test_peek_usage(self):
+        stream = EventStream(FakeResponse(BODY), None, "[DONE]")
+        assert stream.usage is None
+
+        list(stream.frames(peek_usage=True))
+        assert stream.usage == USAGE
+
+    def test_usage_is_not_peeked_by_default(self):
+        stream = EventStream(FakeResponse(BODY), None, "[DONE]")
+        list(stream.frames())
+
+        assert stream.usage is None
+
+    def test_peek_usage_of_responses_events(self):
+        completed = {
+            "type": "response.completed",
+            "sequence_number": 3,
+            "response": {"id": "resp_1", "usage": {"total_tokens": 8}},
+        }
+        body = [
+            b'data: {"type":"response.created","response":{"usage":null}}\n\n',
+            f"data: {json.dumps(completed)}\n\n".encode(),
+        ]
+        stream = EventStream(FakeResponse(body), None)
+        list(stream.frames(peek_usage=True))
+
+        assert stream.usage == {"total_tokens": 8}
+
+    def test_async_frames(self):
+        async def main():
+            stream = EventStreamAsync(FakeResponse(BODY), None, "[DONE]")
+            frames = [bytes(frame) async for frame in stream.frames(peek_usage=True)]
+            return frames, stream.usage
+
+        frames, usage = asyncio.run(main())
+        assert frames == BODY
+        assert usage == USAGE
+
+    def test_create_streaming_frames(self):
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                stream=httpx.ByteStream(b"".join(BODY)),
+            )
+
+        sdk = Sudo(
+            server_url=SERVER_URL,
+            api_key="test",
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        with sdk.router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+        ) as stream:
+            frames = [bytes(frame) for frame in stream.frames(peek_usage=True)]
+
+        assert frames == BODY
+        assert stream.usage == USAGE
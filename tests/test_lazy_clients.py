@@ -0,0 +1,186 @@
+"""
+Offline tests for creating the default sync and async clients on first use.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_lazy_clients.py -v
+"""
+
+import asyncio
+import gc
+import threading
+import time
+
+import httpx
+
+from sudo_ai import Sudo
+from sudo_ai._hooks import sdkhooks
+from sudo_ai.utils import TransportConfig
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def mock_transport():
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=COMPLETION))
+
+
+class CountingFactory:
+    """Client factory that is slow enough for concurrent callers to race."""
+
+    def __init__(self, client_class, **kwargs):
+        self.client_class = client_class
+        self.kwargs = kwargs
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(0.02)
+        return self.client_class(**self.kwargs)
+
+
+def create_sdk():
+    sdk = Sudo(server_url="http://sse.test", api_key="k")
+    config = sdk.sdk_configuration
+    config.client_factory = CountingFactory(httpx.Client, transport=mock_transport())
+    config.async_client_factory = CountingFactory(
+        httpx.AsyncClient, transport=mock_transport()
+    )
+    return sdk
+
+
+class TestLazyClients:
+    """Test that each default client is created once, when first used."""
+
+    def test_no_clients_until_used(self):
+        sdk = Sudo(server_url="http://sse.test", api_key="k")
+
+        assert sdk.sdk_configuration.client is None
+        assert sdk.sdk_configuration.async_client is None
+
+    def test_sync_call_creates_only_the_sync_client(self):
+        sdk = create_sdk()
+        factory = sdk.sdk_configuration.client_factory
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert factory.calls == 1
+        assert isinstance(sdk.sdk_configuration.client, httpx.Client)
+        assert sdk.sdk_configuration.async_client is None
+
+    def test_async_call_creates_only_the_async_client(self):
+        sdk = create_sdk()
+
+        asyncio.run(sdk.router.create_async(messages=MESSAGES, model="gpt-4o"))
+
+        assert isinstance(sdk.sdk_configuration.async_client, httpx.AsyncClient)
+        assert sdk.sdk_configuration.client is None
+
+    def test_concurrent_threads_share_one_client(self):
+        sdk = create_sdk()
+        factory = sdk.sdk_configuration.client_factory
+        clients = []
+
+        def call():
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+            clients.append(sdk.sdk_configuration.get_client())
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.calls == 1
+        assert len(clients) == 8 and all(c is clients[0] for c in clients)
+
+    def test_concurrent_loops_share_one_async_client(self):
+        sdk = create_sdk()
+        factory = sdk.sdk_configuration.async_client_factory
+
+        async def calls():
+            await asyncio.gather(
+                *(
+                    sdk.router.create_async(messages=MESSAGES, model="gpt-4o")
+                    for _ in range(4)
+                )
+            )
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(calls(),)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.calls == 1
+
+    def test_closed_clients_are_not_recreated(self):
+        sdk = create_sdk()
+
+        with sdk:
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        assert sdk.sdk_configuration.get_client() is None
+
+    def test_finalizer_closes_clients_created_later(self):
+        sdk = create_sdk()
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+        client = sdk.sdk_configuration.client
+
+        del sdk
+        gc.collect()
+
+        assert client.is_closed
+
+    def test_sdk_init_hooks_see_built_clients(self, monkeypatch):
+        seen = []
+
+        class RecordingHook:
+            def sdk_init(self, config):
+                seen.append((config.client, config.async_client))
+                return config
+
+        monkeypatch.setattr(
+            sdkhooks,
+            "init_hooks",
+            lambda hooks: hooks.register_sdk_init_hook(RecordingHook()),
+        )
+        Sudo(server_url="http://sse.test", api_key="k")
+
+        ((client, async_client),) = seen
+        assert isinstance(client, httpx.Client)
+        assert isinstance(async_client, httpx.AsyncClient)
+
+    def test_async_calls_work_after_closing_the_sync_side(self):
+        sdk = create_sdk()
+
+        with sdk:
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+        asyncio.run(sdk.router.create_async(messages=MESSAGES, model="gpt-4o"))
+
+        assert sdk.sdk_configuration.get_client() is None
+        assert isinstance(sdk.sdk_configuration.async_client, httpx.AsyncClient)
+
+    def test_transport_options_unused_with_supplied_clients(self, monkeypatch):
+        def fail(self):
+            raise AssertionError("client options should not be built")
+
+        monkeypatch.setattr(TransportConfig, "get_client_options", fail)
+        Sudo(
+            server_url="http://sse.test",
+            api_key="k",
+            client=httpx.Client(transport=mock_transport()),
+            async_client=httpx.AsyncClient(transport=mock_transport()),
+            transport_config=TransportConfig(http2=True),
+        )
@@ -0,0 +1,98 @@
+"""
+Offline tests for the per-class field metadata tables read by the serializers.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_metadata.py -v
+"""
+
+from typing import List, Optional
+
+import pydantic
+from typing_extensions import Annotated
+
+from sudo_ai import models, utils
+from sudo_ai.utils.metadata import get_field_types, get_fields_metadata
+
+
+class Form(pydantic.BaseModel):
+    name: Annotated[str, utils.FieldMetadata(form=True)]
+    tags: Annotated[
+        List[str],
+        pydantic.Field(alias="tag"),
+        utils.FieldMetadata(form=utils.FormMetadata(explode=False)),
+    ]
+    extra: Annotated[dict, utils.FieldMetadata(form=utils.FormMetadata(json=True))]
+    skipped: Optional[str] = None
+
+
+class Upload(pydantic.BaseModel):
+    file_name: Annotated[str, utils.FieldMetadata(multipart=True)]
+    content: Annotated[
+        bytes, utils.FieldMetadata(multipart=utils.MultipartFormMetadata(content=True))
+    ]
+
+
+class Multipart(pydantic.BaseModel):
+    file: Annotated[
+        Upload, utils.FieldMetadata(multipart=utils.MultipartFormMetadata(file=True))
+    ]
+    purpose: Annotated[str, utils.FieldMetadata(multipart=True)]
+
+
+class TestFieldsMetadata:
+    """Test the tables and the serializers reading them."""
+
+    def test_table_lists_fields_with_the_metadata(self):
+        table = get_fields_metadata(
+            models.ListChatCompletionsRequest, utils.QueryParamMetadata
+        )
+
+        assert [(name, f_name) for name, f_name, _ in table] == [
+            ("after", "after"),
+            ("limit", "limit"),
+            ("metadata", "metadata"),
+            ("model", "model"),
+            ("order", "order"),
+        ]
+        assert all(m.style == "form" and m.explode for _, _, m in table)
+        assert not get_fields_metadata(
+            models.ListChatCompletionsRequest, utils.PathParamMetadata
+        )
+
+    def test_tables_are_built_once(self):
+        args = (models.GetChatCompletionMessagesRequest, utils.PathParamMetadata)
+
+        assert get_fields_metadata(*args) is get_fields_metadata(*args)
+        assert get_field_types(Form) is get_field_types(Form)
+
+    def test_aliases(self):
+        table = get_fields_metadata(Form, utils.FormMetadata)
+
+        assert [f_name for _, f_name, _ in table] == ["name", "tag", "extra"]
+
+    def test_form_data(self):
+        form = Form(name="n", tag=["a", "b"], extra={"k": 1}, skipped="s")
+
+        assert utils.serialize_request_body(form, False, False, "form", Form).data == {
+            "name": ["n"],
+            "tag": ["a,b"],
+            "extra": ['{"k":1}'],
+        }
+
+    def test_multipart_form(self):
+        body = Multipart(file=Upload(file_name="a.txt", content=b"x"), purpose="p")
+
+        serialized = utils.serialize_request_body(
+            body, False, False, "multipart", Multipart
+        )
+
+        assert serialized.data == {"purpose": "p"}
+        assert serialized.files == [("file", ("a.txt", b"x"))]
+
+    def test_security_headers(self):
+        headers, query_params = utils.get_security(models.Security(api_key="k"))
+
+        assert headers == {"Authorization": "Bearer k"}
+        assert query_params == {}
+        assert utils.get_security(models.Security()) == ({}, {})
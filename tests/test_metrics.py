@@ -0,0 +1,170 @@
+"""
+Offline tests for the stream timing metrics in sudo_ai.utils.metrics.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_metrics.py -v
+"""
+
+import asyncio
+import json
+from array import array
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, utils
+
+SERVER_URL = "http://sse.test"
+
+
+def sse_body(count: int) -> bytes:
+    frames = []
+    for i in range(count):
+        data = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": f"{i} "}}],
+        }
+        frames.append(f"data: {json.dumps(data)}\n\n".encode())
+    frames.append(b"data: [DONE]\n\n")
+    return b"".join(frames)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        stream=httpx.ByteStream(sse_body(5)),
+    )
+
+
+class CollectingSink:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, metrics: utils.StreamMetrics) -> None:
+        self.published.append(metrics)
+
+
+def create_stream(sink=None):
+    sdk = Sudo(
+        server_url=SERVER_URL,
+        api_key="test",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        metrics_sink=sink,
+    )
+    return sdk.router.create_streaming(
+        messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+    )
+
+
+class TestStreamMetrics:
+    """Test recording and publishing stream timings."""
+
+    def test_recorded_without_sink(self):
+        stream = create_stream()
+        assert len(list(stream)) == 5
+
+        metrics = stream.metrics
+        assert metrics.events == 5
+        assert metrics.ttft is not None
+        assert metrics.bytes_received == len(sse_body(5))
+        assert metrics.finished is not None
+
+    def test_published_once_when_exhausted(self):
+        sink = CollectingSink()
+        stream = create_stream(sink)
+        assert len(list(stream)) == 5
+        list(stream)
+
+        assert sink.published == [stream.metrics]
+        metrics = stream.metrics
+        assert metrics.operation_id == "createStreaming"
+        assert metrics.events == 5
+        assert metrics.bytes_received == len(sse_body(5))
+        assert isinstance(metrics.event_times, array)
+        assert 0 < metrics.request_sent <= metrics.headers_received
+        assert metrics.headers_received <= metrics.event_times[0] <= metrics.finished
+        assert metrics.ttft == metrics.event_times[0] - metrics.request_sent
+        assert set(metrics.summary()) == {
+            "ttft",
+            "p50_gap",
+            "p99_gap",
+            "events_per_second",
+            "bytes_per_second",
+            "events",
+            "bytes",
+        }
+
+    def test_published_when_closed_early(self):
+        sink = CollectingSink()
+        with create_stream(sink) as stream:
+            next(stream)
+
+        assert len(sink.published) == 1
+        assert sink.published[0].events == 1
+
+    def test_raw_mode_is_measured(self):
+        sink = CollectingSink()
+        assert len(list(create_stream(sink).raw())) == 5
+        assert sink.published[0].events == 5
+
+    def test_async_stream(self):
+        sink = CollectingSink()
+
+        async def consume():
+            sdk = Sudo(
+                server_url=SERVER_URL,
+                api_key="test",
+                async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                metrics_sink=sink,
+            )
+            stream = await sdk.router.create_streaming_async(
+                messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+            )
+            return [chunk async for chunk in stream]
+
+        assert len(asyncio.run(consume())) == 5
+        assert sink.published[0].events == 5
+
+    def test_summary_stats(self):
+        metrics = utils.StreamMetrics("op")
+        metrics.request_sent = 0.0
+        metrics.headers_received = 0.5
+        metrics.event_times.extend([1.0, 1.1, 1.2, 1.4, 2.0])
+        metrics.bytes_received = 300
+        metrics.finished = 3.5
+
+        assert metrics.ttft == 1.0
+        assert metrics.gap_percentile(50) == pytest.approx(0.15, abs=0.05)
+        assert metrics.gap_percentile(99) == pytest.approx(0.6)
+        assert metrics.events_per_second == pytest.approx(5 / 3)
+        assert metrics.bytes_per_second == pytest.approx(100)
+
+    def test_empty_stream(self):
+        metrics = utils.StreamMetrics("op")
+        assert metrics.ttft is None
+        assert metrics.gap_percentile(50) is None
+        assert metrics.events_per_second is None
+
+    def test_sink_errors_do_not_reach_the_consumer(self):
+        class FailingSink:
+            def publish(self, metrics):
+                raise RuntimeError("sink down")
+
+        class RecordingLogger:
+            def __init__(self):
+                self.messages = []
+
+            def debug(self, msg, *args, **kwargs):
+                self.messages.append(msg % args)
+
+        logger = RecordingLogger()
+        metrics = utils.StreamMetrics("op", FailingSink(), logger)
+        metrics.finish()
+
+        assert metrics.finished is not None
+        assert logger.messages == ["Failed to publish stream metrics"]
@@ -0,0 +1,156 @@
+"""
+Offline tests for EventStreamMultiplexer in sudo_ai.utils.multiplexer.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_multiplexer.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from sudo_ai import utils
+from sudo_ai.utils.eventstreaming import EventStreamAsync
+
+
+class FakeAsyncResponse:
+    """Stand-in for httpx.Response that sends one event per tick."""
+
+    def __init__(self, events, delay=0.0, error=None):
+        self.events = events
+        self.delay = delay
+        self.error = error
+        self.sent = 0
+        self.closed = False
+
+    async def aiter_bytes(self):
+        for event in self.events:
+            await asyncio.sleep(self.delay)
+            self.sent += 1
+            yield f"data: {event}\n\n".encode()
+        if self.error is not None:
+            raise self.error
+
+    async def aclose(self):
+        self.closed = True
+
+
+def make_stream(events, **kwargs):
+    response = FakeAsyncResponse(events, **kwargs)
+    return EventStreamAsync(response, lambda event: event.data.decode()), response
+
+
+def run(coro):
+    return asyncio.run(coro())
+
+
+class TestEventStreamMultiplexer:
+    """Test merging several async event streams."""
+
+    def test_merges_all_events_with_keys(self):
+        async def main():
+            a, _ = make_stream(["a1", "a2"])
+            b, _ = make_stream(["b1", "b2", "b3"])
+            async with utils.EventStreamMultiplexer({"a": a, "b": b}) as mux:
+                return [item async for item in mux]
+
+        events = run(main)
+        assert sorted(events) == [
+            ("a", "a1"),
+            ("a", "a2"),
+            ("b", "b1"),
+            ("b", "b2"),
+            ("b", "b3"),
+        ]
+        assert [e for k, e in events if k == "b"] == ["b1", "b2", "b3"]
+
+    def test_round_robin_when_all_streams_are_ready(self):
+        async def main():
+            streams = [make_stream([f"{i}{j}" for j in range(3)])[0] for i in range(3)]
+            mux = utils.EventStreamMultiplexer(streams)
+            return [key async for key, _ in mux]
+
+        assert run(main) == [0, 1, 2] * 3
+
+    def test_backpressure_limits_reads_to_one_per_stream(self):
+        async def main():
+            pairs = [make_stream([str(j) for j in range(50)]) for _ in range(4)]
+            mux = utils.EventStreamMultiplexer([stream for stream, _ in pairs])
+            await mux.__anext__()
+            await asyncio.sleep(0.01)
+            sent = [response.sent for _, response in pairs]
+            await mux.aclose()
+            return sent, [response.closed for _, response in pairs]
+
+        sent, closed = run(main)
+        # One yielded event, plus at most one buffered event per stream.
+        assert sum(sent) <= 1 + 4
+        assert all(closed)
+
+    def test_error_closes_all_streams(self):
+        async def main():
+            good, good_response = make_stream(["x"] * 10, delay=0.01)
+            bad, bad_response = make_stream(["y"], error=ValueError("boom"))
+            mux = utils.EventStreamMultiplexer({"good": good, "bad": bad})
+            with pytest.raises(ValueError, match="boom"):
+                async for _ in mux:
+                    pass
+            return good_response.closed, bad_response.closed
+
+        assert run(main) == (True, True)
+
+    def test_return_exceptions_keeps_other_streams(self):
+        async def main():
+            good, _ = make_stream(["x", "x"], delay=0.01)
+            bad, _ = make_stream([], error=ValueError("boom"))
+            mux = utils.EventStreamMultiplexer(
+                {"good": good, "bad": bad}, return_exceptions=True
+            )
+            return [item async for item in mux]
+
+        events = run(main)
+        assert isinstance(events[0][1], ValueError)
+        assert events[1:] == [("good", "x"), ("good", "x")]
+
+    def test_cancellation_closes_responses(self):
+        async def main():
+            pairs = [make_stream(["x"] * 100, delay=0.05) for _ in range(3)]
+            mux = utils.EventStreamMultiplexer([stream for stream, _ in pairs])
+
+            async def consume():
+                async for _ in mux:
+                    pass
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return [response.closed for _, response in pairs]
+
+        assert all(run(main))
+
+    def test_streams_can_be_added(self):
+        async def main():
+            mux = utils.EventStreamMultiplexer()
+            mux.add("late", make_stream(["z"])[0])
+            with pytest.raises(ValueError):
+                mux.add("late", make_stream(["z"])[0])
+            return [item async for item in mux], len(mux)
+
+        assert run(main) == ([("late", "z")], 0)
+
+    def test_built_outside_a_running_loop(self):
+        first, _ = make_stream(["a", "b"])
+        second, _ = make_stream(["c"])
+        mux = utils.EventStreamMultiplexer({"first": first, "second": second})
+
+        async def main():
+            return sorted([item async for item in mux])
+
+        assert asyncio.run(main()) == [
+            ("first", "a"),
+            ("first", "b"),
+            ("second", "c"),
+        ]
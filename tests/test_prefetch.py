@@ -0,0 +1,138 @@
+"""
+Offline tests for the background prefetching reader, EventStream.prefetch().
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_prefetch.py -v
+"""
+
+import gc
+import threading
+import time
+
+import pytest
+
+from sudo_ai.utils.eventstreaming import EventStream
+
+
+class SlowResponse:
+    """Stand-in for httpx.Response that sends one event per `delay` seconds."""
+
+    num_bytes_downloaded = 0
+
+    def __init__(self, count: int, delay: float = 0.0, error=None):
+        self.count = count
+        self.delay = delay
+        self.error = error
+        self.sent = 0
+        self.closed = threading.Event()
+
+    def iter_bytes(self):
+        for i in range(self.count):
+            time.sleep(self.delay)
+            self.sent += 1
+            yield f"data: {i}\n\n".encode()
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.closed.set()
+
+
+def prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "sudo-ai-prefetch"]
+
+
+def wait_for_threads_to_exit():
+    for thread in prefetch_threads():
+        thread.join(timeout=2)
+    return prefetch_threads()
+
+
+def decode(event):
+    return int(event.data)
+
+
+class TestPrefetch:
+    """Test reading the response ahead of the caller in a background thread."""
+
+    def test_yields_the_same_events(self):
+        stream = EventStream(SlowResponse(50), decode).prefetch(4)
+        assert list(stream) == list(range(50))
+        assert wait_for_threads_to_exit() == []
+
+    def test_reads_ahead_up_to_the_bound(self):
+        response = SlowResponse(100)
+        stream = EventStream(response, decode).prefetch(4)
+
+        assert next(stream) == 0
+        time.sleep(0.1)
+        # The queue holds 4 chunks, and the thread holds one more that it
+        # is waiting to put.
+        assert 2 < response.sent <= 1 + 4 + 1
+        stream.close()
+
+    def test_close_stops_the_thread(self):
+        response = SlowResponse(1000, delay=0.001)
+        stream = EventStream(response, decode).prefetch(2)
+        next(stream)
+        stream.close()
+
+        assert wait_for_threads_to_exit() == []
+        assert response.closed.is_set()
+        assert response.sent < 1000
+
+    def test_close_does_not_race_with_a_read(self):
+        class TrackedResponse(SlowResponse):
+            reading = False
+            closed_while_reading = False
+
+            def iter_bytes(self):
+                for i in range(self.count):
+                    self.reading = True
+                    time.sleep(self.delay)
+                    self.reading = False
+                    yield f"data: {i}\n\n".encode()
+
+            def close(self):
+                self.closed_while_reading |= self.reading
+                super().close()
+
+        response = TrackedResponse(1000, delay=0.01)
+        stream = EventStream(response, decode).prefetch(100)
+        next(stream)
+        stream.close()
+
+        assert response.closed.is_set()
+        assert not response.closed_while_reading
+        assert prefetch_threads() == []
+
+    def test_abandoned_stream_stops_the_thread(self):
+        response = SlowResponse(1000, delay=0.001)
+        stream = EventStream(response, decode).prefetch(2)
+        next(stream)
+        del stream
+        gc.collect()
+
+        assert wait_for_threads_to_exit() == []
+        assert response.closed.wait(timeout=2)
+
+    def test_errors_are_raised_in_the_caller(self):
+        stream = EventStream(SlowResponse(3, error=ValueError("boom")), decode)
+
+        with pytest.raises(ValueError, match="boom"):
+            list(stream.prefetch())
+
+    def test_network_time_overlaps_with_processing(self):
+        def consume(stream):
+            start = time.perf_counter()
+            for _ in stream:
+                time.sleep(0.005)
+            return time.perf_counter() - start
+
+        sequential = consume(EventStream(SlowResponse(20, delay=0.005), decode))
+        prefetched = consume(
+            EventStream(SlowResponse(20, delay=0.005), decode).prefetch()
+        )
+
+        assert prefetched < sequential * 0.8
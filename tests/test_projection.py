@@ -0,0 +1,132 @@
+"""
+Offline tests for field projection with utils.Projection and RawResponse.project().
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_projection.py -v
+"""
+
+import json
+from typing import Annotated, List, Optional
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, errors, models, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello"},
+            "logprobs": {"content": [{"token": "Hello", "logprob": -0.1}]},
+            "finish_reason": "stop",
+        },
+        {
+            "index": 1,
+            "message": {"role": "assistant", "content": "Hi"},
+            "finish_reason": "length",
+        },
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class Answer(utils.Projection):
+    content: Annotated[Optional[str], utils.JsonPath("choices.0.message.content")]
+    usage: models.Usage
+
+
+class TestProjection:
+    """Test extracting selected paths from JSON documents."""
+
+    def test_extracts_paths(self):
+        answer = Answer.extract(json.dumps(COMPLETION))
+
+        assert answer.content == "Hello"
+        assert isinstance(answer.usage, models.Usage)
+        assert answer.usage.total_tokens == 2
+
+    def test_several_indices_of_one_array(self):
+        class Reasons(utils.Projection):
+            first: Annotated[str, utils.JsonPath("choices.0.finish_reason")]
+            second: Annotated[str, utils.JsonPath("choices.1.finish_reason")]
+            last: Annotated[Optional[int], utils.JsonPath("choices.-1.index")] = None
+            token: Annotated[
+                Optional[str], utils.JsonPath("choices.0.logprobs.content.0.token")
+            ] = None
+
+        reasons = Reasons.extract(json.dumps(COMPLETION).encode())
+
+        assert (reasons.first, reasons.second, reasons.token) == (
+            "stop",
+            "length",
+            "Hello",
+        )
+        assert reasons.last == 1
+
+    def test_absent_paths_keep_their_default(self):
+        class Defaults(utils.Projection):
+            content: Annotated[
+                Optional[str], utils.JsonPath("choices.5.message.content")
+            ] = "none"
+            refusal: Annotated[
+                List[str], utils.JsonPath("choices.0.message.refusal")
+            ] = []
+
+        result = Defaults.extract(json.dumps(COMPLETION))
+
+        assert result.content == "none"
+        assert result.refusal == []
+
+    def test_explicit_null(self):
+        data = dict(COMPLETION, choices=[{"message": {"content": None}}])
+
+        assert Answer.extract(json.dumps(data)).content is None
+
+    def test_missing_required_field(self):
+        with pytest.raises(ValueError):
+            Answer.extract(json.dumps({"choices": []}))
+
+    def test_wrong_type_fails_validation(self):
+        data = dict(COMPLETION, usage={"total_tokens": "many"})
+
+        with pytest.raises(ValueError):
+            Answer.extract(json.dumps(data))
+
+    def test_overlapping_paths_are_rejected(self):
+        class Overlap(utils.Projection):
+            usage: dict
+            total: Annotated[int, utils.JsonPath("usage.total_tokens")]
+
+        with pytest.raises(ValueError, match="overlaps"):
+            Overlap.extract("{}")
+
+    def test_project_a_raw_response(self):
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json"},
+                content=json.dumps(COMPLETION).encode(),
+            )
+
+        sdk = Sudo(
+            server_url="http://sse.test",
+            api_key="test",
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        res = sdk.router.create_with_raw_response(
+            messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+        )
+
+        assert res.project(Answer).content == "Hello"
+
+        class Broken(utils.Projection):
+            id: int
+
+        with pytest.raises(errors.ResponseValidationError):
+            res.project(Broken)
@@ -0,0 +1,163 @@
+"""
+Offline tests for the pre-encoded request body methods, Router.create_raw and
+Responses.create_response_raw.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_raw_requests.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, errors, models, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+RESPONSE = {
+    "id": "resp_1",
+    "object": "response",
+    "created_at": 1700000000,
+    "model": "gpt-4o",
+    "status": "completed",
+    "output": [],
+}
+
+ERROR = {"error": {"message": "bad request", "type": "invalid_request"}}
+
+BODY = b'{"model":"gpt-4o","messages":[{"role":"user","content":"hi"}]}'
+
+RETRIES = utils.RetryConfig("backoff", utils.BackoffStrategy(1, 1, 1.0, 1000), False)
+
+
+class BeforeRequestHook:
+    def __init__(self):
+        self.operation_ids = []
+
+    def before_request(self, hook_ctx, request):
+        self.operation_ids.append(hook_ctx.operation_id)
+        request.headers["X-Hooked"] = "1"
+        return request
+
+
+def create_sdk(responses, requests, asynchronous=False, **kwargs):
+    responses = iter(responses)
+
+    def handler(request):
+        requests.append(request)
+        return next(responses)
+
+    transport = httpx.MockTransport(handler)
+    if asynchronous:
+        kwargs["async_client"] = httpx.AsyncClient(transport=transport)
+    else:
+        kwargs["client"] = httpx.Client(transport=transport)
+    return Sudo(server_url="http://sse.test", api_key="k", **kwargs)
+
+
+class TestRouterCreateRaw:
+    """Test Router.create_raw and create_raw_async."""
+
+    def test_bytes_are_sent_as_is(self):
+        requests = []
+        sdk = create_sdk([httpx.Response(200, json=COMPLETION)], requests)
+
+        res = sdk.router.create_raw(body=BODY)
+
+        assert isinstance(res, models.ChatCompletion)
+        assert res.id == "chatcmpl-1"
+        (request,) = requests
+        assert (request.method, str(request.url)) == (
+            "POST",
+            "http://sse.test/v1/chat/completions",
+        )
+        assert request.content == BODY
+        assert request.headers["Authorization"] == "Bearer k"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Accept"] == "application/json"
+
+    def test_dict_is_encoded(self):
+        requests = []
+        sdk = create_sdk([httpx.Response(200, json=COMPLETION)], requests)
+        body = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+
+        sdk.router.create_raw(body=body)
+
+        assert json.loads(requests[0].content) == body
+
+    def test_other_bodies_are_rejected(self):
+        sdk = create_sdk([], [])
+
+        with pytest.raises(TypeError):
+            sdk.router.create_raw(body="{}")
+
+    def test_hooks_see_the_typed_operation(self):
+        requests, hook = [], BeforeRequestHook()
+        sdk = create_sdk([httpx.Response(200, json=COMPLETION)], requests)
+        sdk.sdk_configuration.__dict__["_hooks"].register_before_request_hook(hook)
+
+        sdk.router.create_raw(body=BODY)
+
+        assert hook.operation_ids == ["create"]
+        assert requests[0].headers["X-Hooked"] == "1"
+
+    def test_retries(self):
+        requests = []
+        sdk = create_sdk(
+            [httpx.Response(503), httpx.Response(200, json=COMPLETION)],
+            requests,
+            retry_config=RETRIES,
+        )
+
+        sdk.router.create_raw(body=BODY)
+
+        assert len(requests) == 2
+        assert requests[1].content == BODY
+
+    def test_errors(self):
+        sdk = create_sdk([httpx.Response(400, json=ERROR)], [])
+
+        with pytest.raises(errors.ErrorResponse) as exc_info:
+            sdk.router.create_raw(body=BODY)
+        assert exc_info.value.data.error.message == "bad request"
+
+    def test_async(self):
+        requests = []
+        sdk = create_sdk(
+            [httpx.Response(200, json=COMPLETION)], requests, asynchronous=True
+        )
+
+        res = asyncio.run(sdk.router.create_raw_async(body=BODY))
+
+        assert res.id == "chatcmpl-1"
+        assert requests[0].content == BODY
+
+
+class TestResponsesCreateRaw:
+    """Test Responses.create_response_raw and create_response_raw_async."""
+
+    def test_sync(self):
+        requests = []
+        sdk = create_sdk([httpx.Response(200, json=RESPONSE)], requests)
+
+        res = sdk.responses.create_response_raw(body={"model": "gpt-4o", "input": "hi"})
+
+        assert isinstance(res, models.Response)
+        assert str(requests[0].url) == "http://sse.test/v1/responses"
+        assert requests[0].content == b'{"model":"gpt-4o","input":"hi"}'
+
+    def test_async_errors(self):
+        sdk = create_sdk([httpx.Response(401, json=ERROR)], [], asynchronous=True)
+
+        with pytest.raises(errors.ErrorResponse):
+            asyncio.run(sdk.responses.create_response_raw_async(body=b"{}"))
@@ -0,0 +1,130 @@
+"""
+Offline tests for the *_with_raw_response methods and utils.RawResponse.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_raw_response.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, errors, models, utils
+
+SERVER_URL = "http://sse.test"
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def create_sdk(handler, asynchronous=False):
+    transport = httpx.MockTransport(handler)
+    if asynchronous:
+        return Sudo(
+            server_url=SERVER_URL,
+            api_key="test",
+            async_client=httpx.AsyncClient(transport=transport),
+        )
+    return Sudo(
+        server_url=SERVER_URL,
+        api_key="test",
+        client=httpx.Client(transport=transport),
+    )
+
+
+def json_response(status, body):
+    def handler(request):
+        return httpx.Response(
+            status,
+            headers={"content-type": "application/json", "x-request-id": "req-1"},
+            content=body,
+        )
+
+    return handler
+
+
+class TestRawResponse:
+    """Test returning undecoded response bodies that are parsed on demand."""
+
+    def test_create_returns_the_body_unchanged(self):
+        body = json.dumps(COMPLETION).encode()
+        sdk = create_sdk(json_response(200, body))
+
+        res = sdk.router.create_with_raw_response(
+            messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+        )
+
+        assert isinstance(res, utils.RawResponse)
+        assert res.status_code == 200
+        assert res.headers["x-request-id"] == "req-1"
+        assert res.content == body
+
+    def test_parse_is_memoized(self):
+        sdk = create_sdk(json_response(200, json.dumps(COMPLETION).encode()))
+        res = sdk.router.create_with_raw_response(
+            messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+        )
+
+        completion = res.parse()
+        assert isinstance(completion, models.ChatCompletion)
+        assert completion.choices[0].message.content == "Hello"
+        assert res.parse() is completion
+        assert res.json() is res.json()
+        assert res.json()["id"] == "chatcmpl-1"
+
+    def test_invalid_body_fails_only_when_parsed(self):
+        sdk = create_sdk(json_response(200, b'{"id": 1}'))
+        res = sdk.router.get_chat_completion_with_raw_response(completion_id="c")
+
+        assert res.json() == {"id": 1}
+        with pytest.raises(errors.ResponseValidationError) as exc_info:
+            res.parse()
+        assert exc_info.value.body == '{"id": 1}'
+
+    def test_errors_are_raised_as_usual(self):
+        error = {"error": {"message": "bad key", "type": "auth"}}
+        sdk = create_sdk(json_response(401, json.dumps(error).encode()))
+
+        with pytest.raises(errors.ErrorResponse):
+            sdk.router.create_with_raw_response(
+                messages=[{"role": "user", "content": "hi"}], model="gpt-4o"
+            )
+
+    def test_create_response_async(self):
+        body = {
+            "id": "resp_1",
+            "object": "response",
+            "created_at": 1700000000,
+            "model": "gpt-4o",
+            "status": "completed",
+            "output": [],
+        }
+
+        async def main():
+            sdk = create_sdk(
+                json_response(200, json.dumps(body).encode()), asynchronous=True
+            )
+            res = await sdk.responses.create_response_with_raw_response_async(
+                model="gpt-4o", input_="hi"
+            )
+            return res.json(), res.parse()
+
+        data, response = asyncio.run(main())
+        assert data == body
+        assert isinstance(response, models.Response)
+        assert response.id == "resp_1"
@@ -0,0 +1,227 @@
+"""
+Offline tests for the compiled request plans used by BaseSDK.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_request_plans.py -v
+"""
+
+import json
+from typing import Optional
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from sudo_ai import Sudo, models, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def create_sdk(requests, body=COMPLETION, server_url="http://sse.test"):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json"},
+            content=json.dumps(body).encode(),
+        )
+
+    return Sudo(
+        server_url=server_url,
+        api_key="test",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestRequestPlan:
+    """Test that plans build the same parts as the generic utilities."""
+
+    @pytest.mark.parametrize(
+        "path, request_",
+        [
+            (
+                "/v1/chat/completions",
+                models.ListChatCompletionsRequest(
+                    after="a", limit=5, metadata={"k": "v"}, order="asc"
+                ),
+            ),
+            (
+                "/v1/chat/completions/{completion_id}/messages",
+                models.GetChatCompletionMessagesRequest(completion_id="abc", limit=2),
+            ),
+            (
+                "/v1/chat/completions/{completion_id}",
+                models.UpdateChatCompletionRequest(
+                    completion_id="abc",
+                    request_body=models.UpdateChatCompletionRequestBody(
+                        metadata={"k": "v"}
+                    ),
+                ),
+            ),
+            (
+                "/v1/chat/completions",
+                models.ChatCompletionRequestJSON(
+                    model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+                ),
+            ),
+            ("/v1/models", None),
+        ],
+    )
+    def test_matches_generic_utilities(self, path, request_):
+        plan = utils.get_request_plan(
+            "GET", path, type(request_), True, True, "application/json"
+        )
+
+        assert str(plan.generate_url("http://x.test/", request_)) == (
+            utils.generate_url("http://x.test/", path, request_)
+        )
+        assert plan.get_query_params(request_) == utils.get_query_params(request_)
+        assert plan.get_headers(request_) == dict(
+            utils.get_headers(request_), Accept="application/json"
+        )
+
+    def test_compiled_once_per_operation(self):
+        args = ("GET", "/v1/x", models.ListChatCompletionsRequest, False, True, "*/*")
+
+        assert utils.get_request_plan(*args) is utils.get_request_plan(*args)
+        assert utils.get_request_plan(*args[:-1], "application/json") is not (
+            utils.get_request_plan(*args)
+        )
+
+    def test_globals_fall_back_to_generic_utilities(self):
+        class Globals(BaseModel):
+            limit: Annotated[
+                Optional[int],
+                utils.FieldMetadata(
+                    query=utils.QueryParamMetadata(style="form", explode=True)
+                ),
+            ] = None
+
+        gbls = Globals(limit=7)
+        request = models.ListChatCompletionsRequest(after="a")
+        plan = utils.get_request_plan(
+            "GET",
+            "/v1/chat/completions",
+            type(request),
+            False,
+            True,
+            "application/json",
+        )
+
+        assert plan.get_query_params(request, gbls) == (
+            utils.get_query_params(request, gbls)
+        )
+        assert plan.get_query_params(request, gbls)["limit"] == ["7"]
+        assert plan.generate_url("http://x.test", request, gbls) == (
+            "http://x.test/v1/chat/completions"
+        )
+        assert plan.get_headers(request, gbls) == {"Accept": "application/json"}
+
+    def test_flags_skip_parameters(self):
+        plan = utils.get_request_plan(
+            "GET",
+            "/v1/chat/completions/{completion_id}",
+            models.GetChatCompletionMessagesRequest,
+            False,
+            False,
+            "application/json",
+        )
+        request = models.GetChatCompletionMessagesRequest(completion_id="a", limit=1)
+
+        assert plan.get_query_params(request) == {}
+        assert plan.generate_url("http://x.test", request) == httpx.URL(
+            "http://x.test/v1/chat/completions/{completion_id}"
+        )
+
+
+class TestBuiltRequests:
+    """Test requests sent by operations through their plans."""
+
+    def test_every_operation_uses_a_plan(self, monkeypatch):
+        plans = []
+        get_request_plan = utils.get_request_plan
+
+        def recording_get_request_plan(method, path, *args):
+            plans.append((method, path))
+            return get_request_plan(method, path, *args)
+
+        monkeypatch.setattr(utils, "get_request_plan", recording_get_request_plan)
+        requests = []
+        body = {
+            "object": "list",
+            "data": [],
+            "first_id": "",
+            "last_id": "",
+            "has_more": False,
+        }
+        sdk = create_sdk(requests, body=body)
+        sdk.router.list_chat_completions(limit=5)
+        sdk.system.health_check()
+        sdk = create_sdk(requests)
+        sdk.router.create_raw(body={"model": "gpt-4o", "messages": []})
+
+        assert plans == [
+            ("GET", "/v1/chat/completions"),
+            ("GET", "/system/health"),
+            ("POST", "/v1/chat/completions"),
+        ]
+
+    def test_query_parameters(self):
+        requests = []
+        body = {
+            "object": "list",
+            "data": [],
+            "first_id": "",
+            "last_id": "",
+            "has_more": False,
+        }
+        sdk = create_sdk(requests, body=body)
+        sdk.router.list_chat_completions(limit=5, metadata={"k": "v"})
+
+        assert requests[0].method == "GET"
+        assert requests[0].url.path == "/v1/chat/completions"
+        assert dict(requests[0].url.params) == {"limit": "5", "k": "v"}
+
+    def test_path_parameters_and_body(self):
+        requests = []
+        sdk = create_sdk(requests)
+        sdk.router.update_chat_completion(completion_id="c 1", metadata={"k": "v"})
+        sdk.router.update_chat_completion(completion_id="c2", metadata={"k": "v"})
+
+        assert [r.url.path for r in requests] == [
+            "/v1/chat/completions/c 1",
+            "/v1/chat/completions/c2",
+        ]
+        assert json.loads(requests[0].content) == {"metadata": {"k": "v"}}
+        assert requests[0].headers["content-type"] == "application/json"
+
+    def test_headers_and_server_url_override(self):
+        requests = []
+        sdk = create_sdk(requests, server_url="http://one.test/")
+        messages = [{"role": "user", "content": "hi"}]
+        sdk.router.create(messages=messages, model="gpt-4o")
+        sdk.router.create(
+            messages=messages,
+            model="gpt-4o",
+            server_url="http://two.test",
+            http_headers={"X-Trace": "1"},
+        )
+
+        assert [str(r.url) for r in requests] == [
+            "http://one.test/v1/chat/completions",
+            "http://two.test/v1/chat/completions",
+        ]
+        for request in requests:
+            assert request.headers["Accept"] == "application/json"
+            assert request.headers["Authorization"] == "Bearer test"
+            assert request.headers["user-agent"] == sdk.sdk_configuration.user_agent
+        assert requests[1].headers["X-Trace"] == "1"
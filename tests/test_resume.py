@@ -0,0 +1,222 @@
+"""
+Offline tests for resuming dropped event streams.
+
+A local stand-in SSE server, built on httpx.MockTransport, drops the first
+connection part way through and replays events when the client reconnects.
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_resume.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, utils
+
+SERVER_URL = "http://sse.test"
+
+
+class DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that sends its chunks, then optionally drops the connection."""
+
+    def __init__(self, chunks, drop: bool):
+        self.chunks = chunks
+        self.drop = drop
+
+    def __iter__(self):
+        yield from self.chunks
+        if self.drop:
+            raise httpx.RemoteProtocolError("peer closed connection")
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.drop:
+            raise httpx.RemoteProtocolError("peer closed connection")
+
+
+def chunk_event(i: int) -> bytes:
+    data = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": f"{i} "}}],
+    }
+    retry = "retry: 0\n" if i == 0 else ""
+    return f"id: {i}\n{retry}data: {json.dumps(data)}\n\n".encode()
+
+
+def response_event(i: int) -> bytes:
+    data = {
+        "type": "response.output_text.delta",
+        "sequence_number": i,
+        "output_index": 0,
+        "content_index": 0,
+        "delta": f"{i} ",
+    }
+    return f"data: {json.dumps(data)}\n\n".encode()
+
+
+class StandInServer:
+    """Serves `count` events, dropping each connection after `drop_after`.
+
+    On reconnect the server replays from one event before Last-Event-ID, or
+    from the start when `replay_all` is set, so the client sees duplicates.
+    """
+
+    def __init__(self, render, count=6, drop_after=3, drops=1, replay_all=False):
+        self.render = render
+        self.count = count
+        self.drop_after = drop_after
+        self.drops = drops
+        self.replay_all = replay_all
+        self.last_event_ids = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        last_event_id = request.headers.get("last-event-id")
+        self.last_event_ids.append(last_event_id)
+        start = 0
+        if last_event_id is not None and not self.replay_all:
+            start = max(0, int(last_event_id) - 1)
+
+        drop = len(self.last_event_ids) <= self.drops
+        end = start + self.drop_after if drop else self.count
+        chunks = [self.render(i) for i in range(start, min(end, self.count))]
+        if drop:
+            # Part of the next event arrives before the drop.
+            chunks.append(self.render(end)[:20])
+        else:
+            chunks.append(b"data: [DONE]\n\n")
+
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=DroppingStream(chunks, drop),
+        )
+
+
+def sync_sdk(server) -> Sudo:
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    return Sudo(server_url=SERVER_URL, api_key="test", client=client)
+
+
+def async_sdk(server) -> Sudo:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return Sudo(server_url=SERVER_URL, api_key="test", async_client=client)
+
+
+def chat_content(chunks):
+    return "".join(chunk.data.choices[0].delta.content for chunk in chunks)
+
+
+class TestResumableStreams:
+    """Test reconnecting with Last-Event-ID and skipping replayed events."""
+
+    def test_chat_stream_resumes_with_last_event_id(self):
+        server = StandInServer(chunk_event)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+            resume=utils.ResumeConfig(),
+        )
+
+        assert chat_content(stream) == "0 1 2 3 4 5 "
+        assert server.last_event_ids == [None, "2"]
+
+    def test_raw_mode_keeps_resumption(self):
+        server = StandInServer(chunk_event)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+            resume=utils.ResumeConfig(),
+        )
+
+        assert [event.id for event in stream.raw()] == [str(i) for i in range(6)]
+
+    def test_responses_stream_dedupes_by_sequence_number(self):
+        server = StandInServer(response_event, replay_all=True)
+        stream = sync_sdk(server).responses.create_streaming_response(
+            model="gpt-4o",
+            input_="hi",
+            resume=utils.ResumeConfig(retry_ms=0),
+        )
+
+        deltas = [event.data.delta for event in stream]
+
+        assert "".join(deltas) == "0 1 2 3 4 5 "
+        assert server.last_event_ids == [None, "2"]
+
+    def test_gives_up_after_max_attempts(self):
+        server = StandInServer(chunk_event, drop_after=0, drops=10)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+            resume=utils.ResumeConfig(max_attempts=2, retry_ms=0),
+        )
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            list(stream)
+        assert len(server.last_event_ids) == 3
+
+    def test_drop_is_raised_without_resume(self):
+        server = StandInServer(chunk_event)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+        )
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            list(stream)
+        assert server.last_event_ids == [None]
+
+    def test_async_stream_resumes(self):
+        server = StandInServer(chunk_event, drops=2)
+
+        async def consume():
+            stream = await async_sdk(server).router.create_streaming_async(
+                messages=[{"role": "user", "content": "hi"}],
+                model="gpt-4o",
+                resume=utils.ResumeConfig(),
+            )
+            return [chunk async for chunk in stream]
+
+        assert chat_content(asyncio.run(consume())) == "0 1 2 3 4 5 "
+        assert server.last_event_ids == [None, "2", "3"]
+
+    def test_stop_counts_bytes_from_before_the_resume(self):
+        server = StandInServer(chunk_event)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+            resume=utils.ResumeConfig(),
+            stop_condition=utils.StopCondition(max_events=6),
+        )
+
+        assert chat_content(stream) == "0 1 2 3 4 5 "
+        first = sum(len(chunk_event(i)) for i in range(3)) + 20
+        second = sum(len(chunk_event(i)) for i in range(1, 6))
+        assert stream.stopped.bytes_received >= first + second
+
+    def test_stream_without_ids_is_not_replayed(self):
+        def unnumbered_event(i: int) -> bytes:
+            lines = chunk_event(i).split(b"\n")
+            return b"\n".join(line for line in lines if not line.startswith(b"id: "))
+
+        server = StandInServer(unnumbered_event)
+        stream = sync_sdk(server).router.create_streaming(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4o",
+            resume=utils.ResumeConfig(),
+        )
+        chunks = []
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            for chunk in stream:
+                chunks.append(chunk)
+
+        assert chat_content(chunks) == "0 1 2 "
+        assert server.last_event_ids == [None]
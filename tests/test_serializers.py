@@ -0,0 +1,103 @@
+"""
+Offline tests for the type-driven helpers in sudo_ai.utils.serializers.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_serializers.py -v
+"""
+
+from typing import List
+
+from sudo_ai import models, utils
+from sudo_ai.types import OptionalNullable, UNSET
+
+
+class TestTypeAdapters:
+    """Adapters are built once per type and reused."""
+
+    def test_adapter_is_cached_per_type(self):
+        first = utils.get_type_adapter(List[models.ChatMessage])
+        assert utils.get_type_adapter(List[models.ChatMessage]) is first
+        assert utils.get_type_adapter(models.ChatCompletionChunk) is not first
+
+    def test_unmarshal_accepts_field_names_for_typed_dicts(self):
+        messages = utils.get_pydantic_model(
+            [{"role": "user", "content": "hi"}], List[models.ChatMessage]
+        )
+        assert isinstance(messages[0], models.ChatMessage)
+        assert messages[0].content == "hi"
+
+    def test_marshal_json_drops_unset_fields(self):
+        request = models.ChatCompletionRequestJSON(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert utils.marshal_json(request, models.ChatCompletionRequestJSON) == (
+            '{"messages":[{"content":"hi","role":"user"}],'
+            '"model":"gpt-4o","stream":false}'
+        )
+
+    def test_marshal_json_nullable_none(self):
+        assert utils.marshal_json(None, OptionalNullable[List[models.Tool]]) == "null"
+
+
+class TestRequestBodies:
+    """JSON request bodies are encoded straight to UTF-8 bytes."""
+
+    def test_json_body_is_bytes(self):
+        request = models.ChatCompletionRequestJSON(
+            model="gpt-4o", messages=[{"role": "user", "content": "héllo"}], audio=None
+        )
+        body = utils.serialize_request_body(
+            request, False, False, "json", models.ChatCompletionRequestJSON
+        )
+        assert body.media_type == "application/json"
+        assert (
+            body.content
+            == (
+                '{"messages":[{"content":"héllo","role":"user"}],'
+                '"model":"gpt-4o","audio":null,"stream":false}'
+            ).encode()
+        )
+
+
+class TestUnsetAwareSerializer:
+    """UNSET fields are dropped and explicitly set nulls are kept."""
+
+    def test_unset_fields_are_dropped(self):
+        message = models.ChatMessage(role="user", content="hi")
+        assert message.model_dump() == {"content": "hi", "role": "user"}
+
+    def test_explicit_null_is_kept(self):
+        message = models.ChatMessage(role="user", content="hi", name=None)
+        assert message.model_dump() == {"content": "hi", "role": "user", "name": None}
+        assert message.model_dump(exclude_none=True) == {
+            "content": "hi",
+            "role": "user",
+            "name": None,
+        }
+
+    def test_explicit_unset_is_dropped(self):
+        message = models.ChatMessage(role="user", content="hi", name=UNSET)
+        assert message.model_dump_json() == '{"content":"hi","role":"user"}'
+
+    def test_nested_models(self):
+        request = models.ChatCompletionRequestJSON(
+            model="gpt-4o",
+            messages=[
+                {"role": "user", "content": "hi", "tool_call_id": None},
+                {"role": "assistant", "content": "hello"},
+            ],
+        )
+        assert request.model_dump(by_alias=True)["messages"] == [
+            {"content": "hi", "role": "user", "tool_call_id": None},
+            {"content": "hello", "role": "assistant"},
+        ]
+
+    def test_models_with_unset_fields_inside_unions(self):
+        request = models.ResponsesRequest(
+            model="gpt-4o",
+            input=[{"type": "function_call_output", "call_id": "c", "output": "o"}],
+        )
+        assert request.model_dump(by_alias=True)["input"] == [
+            {"call_id": "c", "output": "o", "type": "function_call_output"}
+        ]
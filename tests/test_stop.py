@@ -0,0 +1,169 @@
+"""
+Offline tests for ending streams early with utils.StopCondition.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_stop.py -v
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from sudo_ai import Sudo, utils
+
+SERVER_URL = "http://sse.test"
+
+
+def chunk_event(i: int) -> bytes:
+    data = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": f"{i} "}}],
+    }
+    return f"data: {json.dumps(data)}\n\n".encode()
+
+
+class TrackedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body of 100 events that records how much was sent."""
+
+    def __init__(self):
+        self.sent = 0
+        self.closed = False
+
+    def __iter__(self):
+        for i in range(100):
+            self.sent += 1
+            yield chunk_event(i)
+
+    async def __aiter__(self):
+        for i in range(100):
+            self.sent += 1
+            yield chunk_event(i)
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+def create_stream(stop, body):
+    def handler(request):
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=body
+        )
+
+    sdk = Sudo(
+        server_url=SERVER_URL,
+        api_key="test",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    return sdk.router.create_streaming(
+        messages=[{"role": "user", "content": "hi"}],
+        model="gpt-4o",
+        stop_condition=stop,
+    )
+
+
+def content(chunk) -> str:
+    return chunk.data.choices[0].delta.content
+
+
+class TestStopCondition:
+    """Test closing the connection when a stop condition fires."""
+
+    def test_predicate_closes_connection(self):
+        body = TrackedStream()
+        stream = create_stream(
+            utils.StopCondition(predicate=lambda chunk: content(chunk) == "4 "),
+            body,
+        )
+
+        assert [content(chunk) for chunk in stream] == ["0 ", "1 ", "2 ", "3 ", "4 "]
+        assert body.closed
+        assert body.sent < 100
+        assert stream.stopped.reason == "predicate"
+        assert stream.stopped.events == 5
+        assert stream.stopped.bytes_received == sum(
+            len(chunk_event(i)) for i in range(body.sent)
+        )
+
+    def test_max_events(self):
+        body = TrackedStream()
+        stream = create_stream(utils.StopCondition(max_events=3), body)
+
+        assert len(list(stream)) == 3
+        assert stream.stopped.reason == "max_events"
+        assert body.closed
+
+    def test_max_bytes(self):
+        body = TrackedStream()
+        limit = len(chunk_event(0)) * 10
+        stream = create_stream(utils.StopCondition(max_bytes=limit), body)
+
+        assert len(list(stream)) == 10
+        assert stream.stopped.reason == "max_bytes"
+        assert stream.stopped.bytes_received >= limit
+
+    def test_max_duration(self):
+        stream = create_stream(utils.StopCondition(max_duration_ms=0), TrackedStream())
+
+        assert len(list(stream)) == 1
+        assert stream.stopped.reason == "max_duration"
+
+    def test_duration_counts_from_the_response_headers(self):
+        stream = create_stream(
+            utils.StopCondition(max_duration_ms=20), TrackedStream()
+        )
+        time.sleep(0.05)
+
+        assert len(list(stream)) == 1
+        assert stream.stopped.reason == "max_duration"
+        assert stream.stopped.elapsed_ms >= 50
+
+    def test_raw_mode_passes_raw_events(self):
+        body = TrackedStream()
+        stream = create_stream(
+            utils.StopCondition(predicate=lambda event: b'"1 "' in event.raw_data),
+            body,
+        ).raw()
+
+        assert len(list(stream)) == 2
+        assert stream.stopped.reason == "predicate"
+
+    def test_runs_to_the_end_without_firing(self):
+        stream = create_stream(utils.StopCondition(max_events=1000), TrackedStream())
+
+        assert len(list(stream)) == 100
+        assert stream.stopped is None
+
+    def test_async_stream(self):
+        body = TrackedStream()
+
+        async def main():
+            def handler(request):
+                return httpx.Response(
+                    200, headers={"content-type": "text/event-stream"}, stream=body
+                )
+
+            sdk = Sudo(
+                server_url=SERVER_URL,
+                api_key="test",
+                async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            stream = await sdk.router.create_streaming_async(
+                messages=[{"role": "user", "content": "hi"}],
+                model="gpt-4o",
+                stop_condition=utils.StopCondition(max_events=2),
+            )
+            return [chunk async for chunk in stream], stream.stopped
+
+        chunks, stopped = asyncio.run(main())
+        assert len(chunks) == 2
+        assert stopped.reason == "max_events"
+        assert body.closed
@@ -0,0 +1,186 @@
+"""
+Offline tests for EventStream.tee() and EventStreamAsync.tee().
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_tee.py -v
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from sudo_ai import errors
+from sudo_ai.utils.eventstreaming import EventStream, EventStreamAsync
+
+
+class FakeResponse:
+    """Stand-in for httpx.Response that sends one event per chunk."""
+
+    def __init__(self, count: int, error=None):
+        self.chunks = [f"data: {i}\n\n".encode() for i in range(count)]
+        self.error = error
+        self.closed = False
+
+    def iter_bytes(self):
+        yield from self.chunks
+        if self.error is not None:
+            raise self.error
+
+    async def aiter_bytes(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class CountingDecoder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, event):
+        self.calls += 1
+        return {"value": int(event.data)}
+
+
+class TestTee:
+    """Test fanning one EventStream out to several consumers."""
+
+    def test_consumers_in_threads_share_decoded_events(self):
+        decoder = CountingDecoder()
+        response = FakeResponse(200)
+        consumers = EventStream(response, decoder).tee(3, max_buffered=4, overflow="block")
+        results = [[] for _ in consumers]
+        peak = [0]
+
+        def consume(consumer, out):
+            with consumer:
+                for event in consumer:
+                    peak[0] = max(peak[0], len(consumer._tee.state.buffer))
+                    out.append(event)
+
+        threads = [
+            threading.Thread(target=consume, args=pair)
+            for pair in zip(consumers, results)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert [e["value"] for e in results[0]] == list(range(200))
+        assert all(r[i] is results[0][i] for r in results for i in range(200))
+        assert decoder.calls == 200
+        assert peak[0] <= 4
+        assert response.closed
+
+    def test_slow_consumer_is_detached(self):
+        fast, slow = EventStream(FakeResponse(10), CountingDecoder()).tee(
+            max_buffered=3, overflow="detach"
+        )
+        assert next(slow)["value"] == 0
+
+        assert [e["value"] for e in fast] == list(range(10))
+        assert slow.detached
+        with pytest.raises(errors.StreamDetachedError):
+            next(slow)
+
+    def test_sequential_drain_detaches_instead_of_blocking(self):
+        first, second = EventStream(FakeResponse(10), CountingDecoder()).tee(
+            max_buffered=3
+        )
+
+        assert [e["value"] for e in first] == list(range(10))
+        assert second.detached
+        with pytest.raises(errors.StreamDetachedError):
+            next(second)
+
+    def test_closing_one_consumer_releases_the_buffer(self):
+        response = FakeResponse(10)
+        first, second = EventStream(response, CountingDecoder()).tee(max_buffered=2)
+        second.close()
+
+        assert len(list(first)) == 10
+        first.close()
+        assert response.closed
+
+    def test_upstream_error_reaches_every_consumer(self):
+        first, second = EventStream(
+            FakeResponse(2, error=ValueError("boom")), CountingDecoder()
+        ).tee()
+
+        with pytest.raises(ValueError):
+            list(first)
+        assert [e["value"] for e in [next(second), next(second)]] == [0, 1]
+        with pytest.raises(ValueError):
+            next(second)
+
+    def test_async_consumers_in_tasks(self):
+        decoder = CountingDecoder()
+        response = FakeResponse(100)
+
+        async def consume(consumer):
+            async with consumer:
+                return [event async for event in consumer]
+
+        async def main():
+            consumers = EventStreamAsync(response, decoder).tee(
+                3, max_buffered=2, overflow="block"
+            )
+            return await asyncio.gather(*(consume(c) for c in consumers))
+
+        results = asyncio.run(main())
+
+        assert [e["value"] for e in results[2]] == list(range(100))
+        assert all(r == results[0] for r in results)
+        assert decoder.calls == 100
+        assert response.closed
+
+    def test_cancelling_one_async_consumer_keeps_the_others_reading(self):
+        class SlowResponse(FakeResponse):
+            async def aiter_bytes(self):
+                for chunk in self.chunks:
+                    await asyncio.sleep(0.01)
+                    yield chunk
+
+        response = SlowResponse(5)
+
+        async def main():
+            first, second = EventStreamAsync(response, CountingDecoder()).tee()
+            pending = asyncio.ensure_future(first.__anext__())
+            await asyncio.sleep(0.005)
+            pending.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+            await first.aclose()
+
+            async with second:
+                return [event["value"] async for event in second]
+
+        assert asyncio.run(main()) == list(range(5))
+        assert response.closed
+
+    def test_interrupted_read_fails_the_other_consumers(self):
+        class InterruptedResponse(FakeResponse):
+            def iter_bytes(self):
+                yield self.chunks[0]
+                raise KeyboardInterrupt
+
+        first, second = EventStream(
+            InterruptedResponse(2), CountingDecoder()
+        ).tee()
+
+        assert next(first)["value"] == 0
+        with pytest.raises(KeyboardInterrupt):
+            next(first)
+        assert next(second)["value"] == 0
+        with pytest.raises(errors.StreamInterruptedError):
+            next(second)
@@ -0,0 +1,238 @@
+"""
+Offline tests for the debug logging guards and utils.RequestTrace records.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_tracing.py -v
+"""
+
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, basesdk, errors, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+ERROR = {"error": {"message": "bad request", "type": "invalid_request"}}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+RETRIES = utils.RetryConfig("backoff", utils.BackoffStrategy(1, 1, 1.0, 1000), False)
+
+
+class ListSink:
+    def __init__(self):
+        self.traces = []
+
+    def publish(self, trace):
+        self.traces.append(trace)
+
+
+def create_sdk(responses, asynchronous=False, **kwargs):
+    responses = iter(responses)
+
+    def handler(request):
+        return next(responses)
+
+    transport = httpx.MockTransport(handler)
+    if asynchronous:
+        kwargs["async_client"] = httpx.AsyncClient(transport=transport)
+    else:
+        kwargs["client"] = httpx.Client(transport=transport)
+    return Sudo(server_url="http://sse.test", api_key="secret", **kwargs)
+
+
+class TestDebugLogging:
+    """Test that request and response bodies are only formatted when logged."""
+
+    def test_disabled_logger_formats_nothing(self, monkeypatch):
+        def fail(req):
+            raise AssertionError("request body formatted")
+
+        monkeypatch.setattr(basesdk, "get_body_content", fail)
+        monkeypatch.setattr(
+            httpx.Response, "text", property(lambda self: pytest.fail("text read"))
+        )
+        logger = logging.getLogger("sudo_ai.test.disabled")
+        logger.setLevel(logging.INFO)
+
+        for debug_logger in (None, logger):
+            sdk = create_sdk(
+                [httpx.Response(200, json=COMPLETION)], debug_logger=debug_logger
+            )
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+    def test_enabled_logger(self, caplog):
+        logger = logging.getLogger("sudo_ai.test.enabled")
+        sdk = create_sdk([httpx.Response(200, json=COMPLETION)], debug_logger=logger)
+
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        request, response = [r.getMessage() for r in caplog.records]
+        assert "Method: POST" in request and '"gpt-4o"' in request
+        assert "Status Code: 200" in response and "chatcmpl-1" in response
+
+    def test_is_debug_enabled(self):
+        logger = logging.getLogger("sudo_ai.test.levels")
+        logger.setLevel(logging.DEBUG)
+
+        assert utils.is_debug_enabled(logger)
+        logger.setLevel(logging.WARNING)
+        assert not utils.is_debug_enabled(logger)
+        assert not utils.is_debug_enabled(utils.logger.NoOpLogger())
+
+
+class TestRequestTrace:
+    """Test the traces published for operation calls."""
+
+    def test_trace(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [httpx.Response(200, json=COMPLETION)],
+            trace_config=utils.TraceConfig(sink),
+        )
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        (trace,) = sink.traces
+        assert trace.operation_id == "create"
+        assert (trace.method, trace.url) == (
+            "POST",
+            "http://sse.test/v1/chat/completions",
+        )
+        assert trace.status_code == 200
+        assert trace.attempts == 1
+        assert trace.request_bytes > 0
+        assert trace.response_bytes == len(httpx.Response(200, json=COMPLETION).content)
+        assert 0 <= trace.latency <= trace.elapsed
+        assert trace.error is None
+        assert trace.request_body is None and trace.response_body is None
+        assert "secret" not in repr(trace.to_dict())
+
+    def test_retries_are_counted(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [httpx.Response(503), httpx.Response(200, json=COMPLETION)],
+            retry_config=RETRIES,
+            trace_config=utils.TraceConfig(sink),
+        )
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        (trace,) = sink.traces
+        assert trace.attempts == 2
+        assert trace.status_code == 200
+
+    def test_errors_are_recorded(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [httpx.Response(400, json=ERROR)], trace_config=utils.TraceConfig(sink)
+        )
+
+        with pytest.raises(errors.ErrorResponse):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        (trace,) = sink.traces
+        assert trace.status_code == 400
+        assert trace.finished is not None
+
+    def test_transport_errors_are_recorded(self):
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        sink = ListSink()
+        sdk = Sudo(
+            server_url="http://sse.test",
+            api_key="secret",
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+            trace_config=utils.TraceConfig(sink),
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        (trace,) = sink.traces
+        assert trace.error == "ConnectError"
+        assert trace.status_code is None
+
+    def test_sink_errors_do_not_replace_the_request_error(self):
+        class FailingSink:
+            def publish(self, trace):
+                raise RuntimeError("sink down")
+
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        sdk = Sudo(
+            server_url="http://sse.test",
+            api_key="secret",
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+            trace_config=utils.TraceConfig(FailingSink()),
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+    def test_sampled_bodies_are_truncated(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [httpx.Response(200, json=COMPLETION)],
+            trace_config=utils.TraceConfig(sink, body_sample_rate=1.0, body_limit=10),
+        )
+
+        sdk.router.create(messages=MESSAGES, model="gpt-4o")
+
+        (trace,) = sink.traces
+        assert trace.sampled
+        assert trace.request_body.startswith('{"messages')
+        assert trace.request_body.endswith(f"({trace.request_bytes - 10} more bytes)")
+        assert trace.response_body.startswith('{"id":"cha')
+
+    def test_query_string_is_dropped(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [
+                httpx.Response(
+                    200,
+                    json={
+                        "object": "list",
+                        "data": [],
+                        "first_id": "a",
+                        "last_id": "b",
+                        "has_more": False,
+                    },
+                )
+            ],
+            trace_config=utils.TraceConfig(sink),
+        )
+
+        sdk.router.list_chat_completions(limit=5)
+
+        assert sink.traces[0].url == "http://sse.test/v1/chat/completions"
+
+    def test_async(self):
+        sink = ListSink()
+        sdk = create_sdk(
+            [httpx.Response(503), httpx.Response(200, json=COMPLETION)],
+            asynchronous=True,
+            retry_config=RETRIES,
+            trace_config=utils.TraceConfig(sink),
+        )
+
+        asyncio.run(sdk.router.create_async(messages=MESSAGES, model="gpt-4o"))
+
+        (trace,) = sink.traces
+        assert trace.operation_id == "create"
+        assert trace.attempts == 2
+        assert trace.status_code == 200
@@ -0,0 +1,142 @@
+"""
+Offline tests for utils.TransportConfig and the clients Sudo builds from it.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_transport.py -v
+"""
+
+import importlib.util
+
+import httpx
+import pytest
+
+from sudo_ai import Sudo, utils
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def pool(client):
+    return client._transport._pool
+
+
+def sent_timeouts(transport_config=None, **kwargs):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=COMPLETION)
+
+    sdk = Sudo(
+        server_url="http://sse.test",
+        api_key="k",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        transport_config=transport_config,
+    )
+    sdk.router.create(messages=MESSAGES, model="gpt-4o", **kwargs)
+    return requests[0].extensions["timeout"]
+
+
+class TestPool:
+    """Test the pool settings of the clients Sudo creates."""
+
+    def test_defaults_match_httpx(self):
+        sdk = Sudo(
+            server_url="http://sse.test", transport_config=utils.TransportConfig()
+        )
+        default = httpx.Client()
+
+        for client in (
+            sdk.sdk_configuration.get_client(),
+            sdk.sdk_configuration.get_async_client(),
+        ):
+            assert pool(client)._max_connections == pool(default)._max_connections
+            assert pool(client)._keepalive_expiry == pool(default)._keepalive_expiry
+
+    def test_limits(self):
+        sdk = Sudo(
+            server_url="http://sse.test",
+            transport_config=utils.TransportConfig(
+                max_connections=500,
+                max_keepalive_connections=200,
+                keepalive_expiry_ms=30000,
+            ),
+        )
+
+        for client in (
+            sdk.sdk_configuration.get_client(),
+            sdk.sdk_configuration.get_async_client(),
+        ):
+            assert pool(client)._max_connections == 500
+            assert pool(client)._max_keepalive_connections == 200
+            assert pool(client)._keepalive_expiry == 30.0
+            assert client.follow_redirects
+
+    def test_supplied_clients_are_kept(self):
+        client = httpx.Client()
+        sdk = Sudo(
+            server_url="http://sse.test",
+            client=client,
+            transport_config=utils.TransportConfig(max_connections=1),
+        )
+
+        assert sdk.sdk_configuration.get_client() is client
+        assert pool(sdk.sdk_configuration.get_async_client())._max_connections == 1
+
+    @pytest.mark.skipif(not HAS_H2, reason="h2 is not installed")
+    def test_http2(self):
+        sdk = Sudo(
+            server_url="http://sse.test",
+            transport_config=utils.TransportConfig(http2=True),
+        )
+
+        assert pool(sdk.sdk_configuration.get_client())._http2
+
+    @pytest.mark.skipif(HAS_H2, reason="h2 is installed")
+    def test_http2_without_h2(self):
+        with pytest.raises(ImportError, match="h2"):
+            Sudo(
+                server_url="http://sse.test",
+                transport_config=utils.TransportConfig(http2=True),
+            )
+
+
+class TestTimeouts:
+    """Test the timeouts sent with each request."""
+
+    def test_no_timeouts_by_default(self):
+        assert sent_timeouts() == dict.fromkeys(
+            ("connect", "read", "write", "pool"), None
+        )
+        assert sent_timeouts(utils.TransportConfig()) == sent_timeouts()
+
+    def test_phases(self):
+        config = utils.TransportConfig(connect_timeout_ms=2000, pool_timeout_ms=500)
+
+        assert sent_timeouts(config) == {
+            "connect": 2.0,
+            "read": None,
+            "write": None,
+            "pool": 0.5,
+        }
+
+    def test_phases_fall_back_to_timeout_ms(self):
+        config = utils.TransportConfig(read_timeout_ms=60000)
+
+        assert sent_timeouts(config, timeout_ms=10000) == {
+            "connect": 10.0,
+            "read": 60.0,
+            "write": 10.0,
+            "pool": 10.0,
+        }
@@ -0,0 +1,161 @@
+"""
+Offline tests for the tag-dispatched Item, InputItem and ContentPart unions.
+
+These tests do not talk to the API and run without SUDO_API_KEY:
+
+    python -m pytest test_unions.py -v
+"""
+
+from typing import List
+
+import pytest
+
+from sudo_ai import models, utils
+from sudo_ai.models import contentpart_union, inputitem_union, item_union
+
+
+def validate(typ, data):
+    return utils.get_type_adapter(List[typ]).validate_python(data)
+
+
+class TestItemUnion:
+    """Test dispatching Responses API items on their type."""
+
+    @pytest.mark.parametrize(
+        "item, variant",
+        [
+            (
+                {"type": "function_call", "call_id": "c", "name": "f", "arguments": ""},
+                item_union.Item7,
+            ),
+            (
+                {"type": "function_call_output", "call_id": "c", "output": "o"},
+                item_union.Item8,
+            ),
+            (
+                {"type": "custom_tool_call_output", "call_id": "c", "output": "o"},
+                item_union.Item18,
+            ),
+            (
+                {"type": "local_shell_call_output", "id": "l", "output": "o"},
+                item_union.Item13,
+            ),
+            (
+                {
+                    "type": "message",
+                    "id": "m",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [],
+                },
+                item_union.Item2,
+            ),
+            (
+                {"type": "message", "role": "user", "status": "done", "content": "hi"},
+                item_union.Item1,
+            ),
+        ],
+    )
+    def test_dispatch_on_type(self, item, variant):
+        assert type(validate(models.ItemUnion, [item])[0]) is variant
+
+    def test_unknown_type_falls_back_to_every_variant(self):
+        (item,) = validate(
+            models.ItemUnion, [{"type": "new", "id": "x", "output": "o"}]
+        )
+
+        assert isinstance(item, item_union.Item13)
+        assert item.type == "new"
+
+    def test_mismatched_item_falls_back_to_every_variant(self):
+        item = {"type": "function_call", "id": "x", "output": "o"}
+
+        assert isinstance(validate(models.ItemUnion, [item])[0], item_union.Item13)
+
+    def test_invalid_item_raises(self):
+        with pytest.raises(ValueError):
+            validate(models.ItemUnion, [{"type": "function_call"}])
+
+    def test_model_instances_are_kept(self):
+        item = item_union.Item18(call_id="c", output="o", type="function_call_output")
+
+        assert validate(models.ItemUnion, [item])[0] is item
+
+    def test_response_output(self):
+        response = models.Response.model_validate(
+            {
+                "id": "resp_1",
+                "object": "response",
+                "created_at": 1700000000,
+                "model": "gpt-4o",
+                "status": "completed",
+                "output": [
+                    {"type": "reasoning", "id": "r", "summary": [], "content": []},
+                    {
+                        "type": "function_call",
+                        "call_id": "c",
+                        "name": "f",
+                        "arguments": "",
+                    },
+                ],
+            }
+        )
+
+        assert [type(item) for item in response.output] == [
+            item_union.Item9,
+            item_union.Item7,
+        ]
+
+
+class TestInputItemUnion:
+    """Test dispatching request input items on their type."""
+
+    def test_dispatch(self):
+        items = validate(
+            models.InputItemUnion,
+            [
+                {"role": "user", "content": "hi"},
+                {"id": "msg_0"},
+                {"type": "message", "role": "user", "content": "hi"},
+                {"type": "item_reference", "id": "msg_0"},
+                {"type": "function_call_output", "call_id": "c", "output": "o"},
+            ],
+        )
+
+        assert [type(item) for item in items] == [
+            inputitem_union.InputItem1,
+            inputitem_union.InputItem2,
+            inputitem_union.InputItem1,
+            inputitem_union.InputItem2,
+            item_union.Item8,
+        ]
+
+    def test_request_body_round_trip(self):
+        item = {"type": "function_call_output", "call_id": "c", "output": "o"}
+        request = models.ResponsesRequest(model="gpt-4o", input=[item])
+
+        assert request.model_dump(by_alias=True)["input"] == [item]
+
+
+class TestContentPartUnion:
+    """Test dispatching chat message content parts on their type."""
+
+    def test_dispatch(self):
+        parts = validate(
+            models.ContentPartUnion,
+            [
+                {"type": "text", "text": "hi"},
+                {"type": "image_url", "image_url": {"url": "https://x"}},
+                {"type": "input_audio", "input_audio": {"data": "", "format": "wav"}},
+                {"type": "file", "file": {"file_id": "f"}},
+                {"type": "input_text", "text": "hi"},
+            ],
+        )
+
+        assert [type(part) for part in parts] == [
+            contentpart_union.ContentPart1,
+            contentpart_union.ContentPart2,
+            contentpart_union.ContentPart3,
+            contentpart_union.ContentPart4,
+            contentpart_union.ContentPart1,
+        ]